@@ -6,6 +6,8 @@ dataseries_plot_panel.py
 Provides a QWidget-based panel for plotting data series using matplotlib, designed for
 PySide6 compatibility.
 """
+import itertools
+
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                               QGroupBox, QCheckBox, QComboBox, QLabel,
                               QSpinBox)
@@ -187,16 +189,18 @@ class DataSeriesPlotPanel(QWidget):
         """Set the plot title."""
         title = ""
         num_curves = len(self.curves)
+        # Grab at most the first three curve names without materializing the
+        # full key list (plots can hold many curves).
+        names = list(itertools.islice(self.curves, 3))
         if num_curves == 0:
             title = self.title
         elif num_curves == 1:
-            title = list(self.curves.keys())[0] + " vs. Elapsed Time (s)"
+            title = names[0] + " vs. Elapsed Time (s)"
         elif num_curves == 2:
-            title = list(self.curves.keys())[0] + " and " + list(self.curves.keys())[1] + \
-                " vs. Elapsed Time (s)"
+            title = names[0] + " and " + names[1] + " vs. Elapsed Time (s)"
         elif num_curves == 3:
-            title = list(self.curves.keys())[0] + ", " + list(self.curves.keys())[1] + \
-                ", and " + list(self.curves.keys())[2] + " vs. Elapsed Time (s)"
+            title = names[0] + ", " + names[1] + ", and " + names[2] + \
+                " vs. Elapsed Time (s)"
         elif num_curves > 3:
             title = "Multiple Data Series vs. Elapsed Time (s)"
 
@@ -500,13 +504,24 @@ class DataSeriesPlotPanel(QWidget):
         """Clear all plots - alias for clear method."""
         self.clear()
 
-    def plot_dataseries(self, time_data, channel_data):
-        """Plot data series vs. time."""
+    def plot_dataseries(self, time_data, channel_data, channel_names=None):
+        """Plot data series vs. time.
+
+        channel_data is either a mapping of channel name to data, or a 2D
+        array whose columns are named by channel_names. Column slices of
+        the array form are views, so plotting many channels doesn't copy
+        each one.
+        """
         self.clear()
 
-        self.total_curves = len(channel_data)
-        for channel_name, data in channel_data.items():
-            self.plot_data(time_data, data, channel_name)
+        if channel_names is None:
+            self.total_curves = len(channel_data)
+            for channel_name, data in channel_data.items():
+                self.plot_data(time_data, data, channel_name)
+        else:
+            self.total_curves = len(channel_names)
+            for i, channel_name in enumerate(channel_names):
+                self.plot_data(time_data, channel_data[:, i], channel_name)
 
         self._set_plot_title()
 
@@ -6,11 +6,16 @@ file_panel.py
 Provides a QWidget-based panel for selecting, opening, and managing log files.
 Features include recent file tracking, file options, and persistent settings.
 """
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                              QLabel, QListWidget, QGroupBox, QFileDialog,
-                              QCheckBox)
-from PySide6.QtCore import Signal, QSettings
+                              QLabel, QListView, QGroupBox, QFileDialog,
+                              QCheckBox, QApplication, QAbstractItemView)
+from PySide6.QtCore import Signal, QSettings, QTimer, QStringListModel
+
+from settings_writer import SettingsWriter
 
 class FilePanel(QWidget):
     """
@@ -27,10 +32,32 @@ class FilePanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.recent_files = []
+        # Most-recently-used ordering: keys are file paths, newest first.
+        # An OrderedDict gives O(1) membership, promotion, and eviction.
+        self.recent_files = OrderedDict()
         self.current_file = None
         self.settings = QSettings("RadioControl", "RCLogViewer")
 
+        # Short-TTL cache of existence checks so repeated list refreshes
+        # don't re-stat every entry (slow on network filesystems).
+        self._exists_cache = {}
+
+        # The recent-files list widget is filled on first show, not at
+        # construction, so startup never stats the saved paths
+        self._recent_list_populated = False
+
+        # Coalesce bursts of recent-file updates into a single settings write
+        # so the UI thread never waits on repeated disk syncs.
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_settings)
+
+        # Make sure any pending write lands on shutdown
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_settings)
+
         self._setup_ui()
         self._load_recent_files()
 
@@ -64,8 +91,12 @@ class FilePanel(QWidget):
         recent_group = QGroupBox("Recent Files")
         recent_layout = QVBoxLayout(recent_group)
 
-        self.recent_list = QListWidget()
-        self.recent_list.itemDoubleClicked.connect(self._load_recent_file)
+        # Model/view pairing avoids a QListWidgetItem allocation per entry
+        self.recent_list = QListView()
+        self._recent_model = QStringListModel(self)
+        self.recent_list.setModel(self._recent_model)
+        self.recent_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.recent_list.doubleClicked.connect(self._load_recent_file)
         recent_layout.addWidget(self.recent_list)
 
         # Clear recent files button
@@ -76,6 +107,21 @@ class FilePanel(QWidget):
         layout.addWidget(recent_group)
 
 
+    # Seconds for which a cached existence check remains valid
+    _EXISTS_CACHE_TTL = 2.0
+
+    def _exists(self, file_path):
+        """
+        Check whether a file exists, caching the result for a short time.
+        """
+        now = time.monotonic()
+        cached = self._exists_cache.get(file_path)
+        if cached is not None and now - cached[0] < self._EXISTS_CACHE_TTL:
+            return cached[1]
+        result = os.path.exists(file_path)
+        self._exists_cache[file_path] = (now, result)
+        return result
+
     def _open_file_dialog(self):
         """
         Open a file dialog for the user to select a log file. Updates current file and emits
@@ -92,13 +138,13 @@ class FilePanel(QWidget):
             self._set_current_file(file_path)
             self.file_selected.emit(file_path)
 
-    def _load_recent_file(self, item):
+    def _load_recent_file(self, index):
         """
         Load a file from the recent files list when double-clicked. Updates current file and
         emits file_selected.
         """
-        file_path = item.text()
-        if Path(file_path).exists():
+        file_path = index.data()
+        if self._exists(file_path):
             self._set_current_file(file_path)
             self.file_selected.emit(file_path)
         else:
@@ -124,16 +170,14 @@ class FilePanel(QWidget):
         """
         Add a file to the recent files list, ensuring uniqueness and limiting to 10 entries.
         """
-        # Remove if already exists
-        if file_path in self.recent_files:
-            self.recent_files.remove(file_path)
-
-        # Add to beginning
-        self.recent_files.insert(0, file_path)
+        # Promote to the front (removing any existing entry first)
+        self.recent_files.pop(file_path, None)
+        self.recent_files[file_path] = None
+        self.recent_files.move_to_end(file_path, last=False)
 
         # Limit to 10 recent files
-        if len(self.recent_files) > 10:
-            self.recent_files = self.recent_files[:10]
+        while len(self.recent_files) > 10:
+            self.recent_files.popitem(last=True)
 
         self._update_recent_list()
         self._save_recent_files()
@@ -143,7 +187,8 @@ class FilePanel(QWidget):
         Remove a file from the recent files list.
         """
         if file_path in self.recent_files:
-            self.recent_files.remove(file_path)
+            del self.recent_files[file_path]
+            self._exists_cache.pop(file_path, None)
             self._update_recent_list()
             self._save_recent_files()
 
@@ -151,17 +196,16 @@ class FilePanel(QWidget):
         """
         Update the recent files list widget to reflect current recent files.
         """
-        self.recent_list.clear()
-        for file_path in self.recent_files:
-            if Path(file_path).exists():
-                self.recent_list.addItem(file_path)
+        # A single model reset replaces the list contents in one pass
+        self._recent_model.setStringList(
+            [p for p in self.recent_files if self._exists(p)])
 
     def _clear_recent_files(self):
         """
         Clear all recent files from the list and settings.
         """
         self.recent_files.clear()
-        self.recent_list.clear()
+        self._recent_model.setStringList([])
         self._save_recent_files()
 
     def _load_recent_files(self):
@@ -178,28 +222,45 @@ class FilePanel(QWidget):
             elif not isinstance(recent_files, list):
                 recent_files = []
 
-            # Filter out non-existent files and limit to 10
-            self.recent_files = []
+            # Keep at most 10 entries; existence is checked lazily when the
+            # list is first shown so unreachable network paths can't stall
+            # application start
+            self.recent_files = OrderedDict()
             for file_path in recent_files:
-                if isinstance(file_path, str) and Path(file_path).exists():
-                    self.recent_files.append(file_path)
+                if isinstance(file_path, str):
+                    self.recent_files[file_path] = None
                 if len(self.recent_files) >= 10:
                     break
 
-            self._update_recent_list()
-
         except Exception:
             # If loading fails, start with empty list
-            self.recent_files = []
+            self.recent_files = OrderedDict()
+
+    def showEvent(self, event):
+        """
+        Populate the recent files list the first time the panel is shown.
+        """
+        if not self._recent_list_populated:
+            self._recent_list_populated = True
+            self._update_recent_list()
+        super().showEvent(event)
 
     def _save_recent_files(self):
         """
-        Save the recent files list to persistent settings.
+        Schedule a save of the recent files list to persistent settings.
+
+        The actual write is debounced via a single-shot timer so that bursts
+        of add/remove/clear operations produce one physical write.
+        """
+        self._save_timer.start()
+
+    def _flush_settings(self):
+        """
+        Queue the recent files list for writing to persistent settings.
         """
         try:
-            # Save recent files to QSettings
-            self.settings.setValue("recent_files", self.recent_files)
-            self.settings.sync()  # Ensure data is written to disk
+            SettingsWriter.instance().set_value(
+                self.settings, "recent_files", list(self.recent_files))
         except Exception:
             # If saving fails, just continue (non-critical)
             pass
@@ -209,8 +270,8 @@ class FilePanel(QWidget):
         Save the current file path to persistent settings.
         """
         try:
-            self.settings.setValue("current_file", file_path)
-            self.settings.sync()
+            SettingsWriter.instance().set_value(
+                self.settings, "current_file", file_path)
         except Exception:
             pass
 
@@ -15,6 +15,44 @@ from PySide6.QtCore import QSettings
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from settings_writer import SettingsWriter
+
+# Display-name to matplotlib color mappings, shared by the combo boxes and
+# the lookup helpers so the UI and mapping stay in sync
+_TRAJ_COLORS = {
+    "Blue": "blue",
+    "Red": "red",
+    "Green": "green",
+    "Orange": "orange",
+    "Purple": "purple",
+    "Brown": "brown",
+    "Pink": "pink",
+    "Gray": "gray",
+}
+
+_GROUND_COLORS = {
+    "Light Gray": "lightgray",
+    "Gray": "gray",
+    "Black": "black",
+    "Light Blue": "lightblue",
+    "Light Green": "lightgreen",
+    "Light Red": "lightcoral",
+    "Yellow": "yellow",
+    "Cyan": "cyan",
+}
+
+_FILTERED_COLORS = {
+    "Orange": "orange",
+    "Red": "red",
+    "Green": "green",
+    "Blue": "blue",
+    "Purple": "purple",
+    "Brown": "brown",
+    "Pink": "pink",
+    "Gray": "gray",
+}
 
 
 class GPSXYZ3DPlotPanel(QWidget):
@@ -42,6 +80,7 @@ class GPSXYZ3DPlotPanel(QWidget):
         self.canvas = None
         self.ax = None
         self.trajectory_line = None
+        self.filtered_line = None
         self.start_marker = None
         self.end_marker = None
         self.ground_projection = None
@@ -50,7 +89,19 @@ class GPSXYZ3DPlotPanel(QWidget):
         self.gps_y_data = None
         self.gps_z_data = None
         self.gps_time_data = None
-        self.time_mask = None
+        self._min_z = None
+
+        # Time filter as a contiguous [lo, hi) index range; GPS time is
+        # monotonic so a range replaces the old per-point boolean mask
+        self.time_lo = 0
+        self.time_hi = 0
+
+        # Settings tuple of the last render, used to skip no-op redraws
+        self._last_render_key = None
+
+        # Set when a display update is requested while the panel is hidden;
+        # the redraw is deferred until the panel is next shown
+        self._dirty = False
 
         self._setup_ui()
 
@@ -60,22 +111,8 @@ class GPSXYZ3DPlotPanel(QWidget):
         """
         layout = QVBoxLayout(self)
 
-        # Create matplotlib figure and canvas with 3D projection
-        self.figure = Figure(figsize=(12, 10), dpi=100, facecolor='white')
-        self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111, projection='3d')
-
-        # Set up the 3D plot
-        self.ax.set_xlabel('GPS X (m)')
-        self.ax.set_ylabel('GPS Y (m)')
-        self.ax.set_zlabel('GPS Altitude (m)')
-        self.ax.set_title('GPS 3D Trajectory')
-
-        layout.addWidget(self.canvas)
-
-        # Add navigation toolbar
-        self.toolbar = NavigationToolbar(self.canvas, self)
-        layout.addWidget(self.toolbar)
+        # The matplotlib figure, canvas, and toolbar are heavy to construct,
+        # so they are created lazily in _setup_canvas on first show or plot
 
         # Control panel
         controls_group = QGroupBox("GPS 3D Plot Controls")
@@ -124,9 +161,7 @@ class GPSXYZ3DPlotPanel(QWidget):
         row2_layout.addWidget(color_label)
 
         self.color_combo = QComboBox()
-        self.color_combo.addItems([
-            "Blue", "Red", "Green", "Orange", "Purple", "Brown", "Pink", "Gray"
-        ])
+        self.color_combo.addItems(list(_TRAJ_COLORS))
         self.color_combo.currentTextChanged.connect(self._on_color_changed)
         row2_layout.addWidget(self.color_combo)
 
@@ -135,9 +170,7 @@ class GPSXYZ3DPlotPanel(QWidget):
         row2_layout.addWidget(ground_color_label)
 
         self.ground_color_combo = QComboBox()
-        self.ground_color_combo.addItems([
-            "Light Gray", "Gray", "Black", "Light Blue", "Light Green", "Light Red",
-            "Yellow", "Cyan"])
+        self.ground_color_combo.addItems(list(_GROUND_COLORS))
 
         self.ground_color_combo.currentTextChanged.connect(self._on_color_changed)
         row2_layout.addWidget(self.ground_color_combo)
@@ -147,9 +180,7 @@ class GPSXYZ3DPlotPanel(QWidget):
         row2_layout.addWidget(filtered_trajectory_color_label)
 
         self.filtered_trajectory_color_combo = QComboBox()
-        self.filtered_trajectory_color_combo.addItems([
-            "Orange", "Red", "Green", "Blue", "Purple", "Brown", "Pink", "Gray"
-        ])
+        self.filtered_trajectory_color_combo.addItems(list(_FILTERED_COLORS))
         self.filtered_trajectory_color_combo.currentTextChanged.connect(self._on_color_changed)
         row2_layout.addWidget(self.filtered_trajectory_color_combo)
 
@@ -189,94 +220,101 @@ class GPSXYZ3DPlotPanel(QWidget):
 
         layout.addWidget(controls_group)
 
-        # Store GPS data
-        self.gps_x_data = None
-        self.gps_y_data = None
-        self.gps_z_data = None
-        self.ground_projection = None
-
         # Initialize QSettings for persistence
         self.settings = QSettings('RCLogViewer', 'GPS3DPlotPanel')
         self._load_color_settings()
 
+    def _setup_canvas(self):
+        """
+        Create the matplotlib figure, canvas, 3D axes, and toolbar.
+
+        Deferred until the panel is first shown or first receives data, so
+        the matplotlib 3D machinery isn't paid for at application start when
+        the GPS tab is never opened.
+        """
+        if self.figure is not None:
+            return
+
+        # Create matplotlib figure and canvas with 3D projection
+        self.figure = Figure(figsize=(12, 10), dpi=100, facecolor='white')
+        self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot(111, projection='3d')
+
+        # Set up the 3D plot
+        self.ax.set_xlabel('GPS X (m)')
+        self.ax.set_ylabel('GPS Y (m)')
+        self.ax.set_zlabel('GPS Altitude (m)')
+        self.ax.set_title('GPS 3D Trajectory')
+
+        # Insert above the controls group, canvas first then toolbar
+        layout = self.layout()
+        layout.insertWidget(0, self.canvas)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        layout.insertWidget(1, self.toolbar)
+
+    def showEvent(self, event):
+        """
+        Build the plot canvas the first time the panel becomes visible, and
+        apply any display update that was deferred while hidden.
+        """
+        self._setup_canvas()
+        if self._dirty:
+            self._dirty = False
+            self._update_display()
+        super().showEvent(event)
+
     def _get_color(self, color_name):
         """
         Convert color name to matplotlib color string.
         """
-        color_map = {
-            "Blue": "blue",
-            "Red": "red",
-            "Green": "green",
-            "Orange": "orange",
-            "Purple": "purple",
-            "Brown": "brown",
-            "Pink": "pink",
-            "Gray": "gray"
-        }
-        return color_map.get(color_name, "blue")
+        return _TRAJ_COLORS.get(color_name, "blue")
 
     def _get_ground_color(self, color_name):
         """
         Convert ground projection color name to matplotlib color string.
         """
-        color_map = {
-            "Light Gray": "lightgray",
-            "Gray": "gray",
-            "Black": "black",
-            "Light Blue": "lightblue",
-            "Light Green": "lightgreen",
-            "Light Red": "lightcoral",
-            "Yellow": "yellow",
-            "Cyan": "cyan"
-        }
-        return color_map.get(color_name, "lightgray")
+        return _GROUND_COLORS.get(color_name, "lightgray")
 
     def _get_filtered_trajectory_color(self, color_name):
         """
         Convert filtered trajectory color name to matplotlib color string.
         """
-        color_map = {
-            "Blue": "blue",
-            "Red": "red",
-            "Green": "green",
-            "Orange": "orange",
-            "Purple": "purple",
-            "Brown": "brown",
-            "Pink": "pink",
-            "Gray": "gray"
-        }
-        return color_map.get(color_name, "orange")
+        return _FILTERED_COLORS.get(color_name, "orange")
 
     def _save_color_settings(self):
         """
         Save color selections to QSettings for persistence.
+
+        Writes are delegated to the shared SettingsWriter thread so the UI
+        never blocks on disk I/O.
         """
-        self.settings.setValue('trajectory_color', self.color_combo.currentText())
-        self.settings.setValue('ground_color', self.ground_color_combo.currentText())
-        self.settings.setValue('filtered_trajectory_color',
-                               self.filtered_trajectory_color_combo.currentText())
+        writer = SettingsWriter.instance()
+        writer.set_value(self.settings, 'trajectory_color',
+                         self.color_combo.currentText())
+        writer.set_value(self.settings, 'ground_color',
+                         self.ground_color_combo.currentText())
+        writer.set_value(self.settings, 'filtered_trajectory_color',
+                         self.filtered_trajectory_color_combo.currentText())
 
     def _load_color_settings(self):
         """
         Load color selections from QSettings for persistence.
         """
-        saved_trajectory_color = self.settings.value('trajectory_color')
-        if saved_trajectory_color:
-            index = self.color_combo.findText(saved_trajectory_color)
-            if index >= 0:
-                self.color_combo.setCurrentIndex(index)
-
-        saved_ground_color = self.settings.value('ground_color')
-        if saved_ground_color:
-            index = self.ground_color_combo.findText(saved_ground_color)
-            if index >= 0:
-                self.ground_color_combo.setCurrentIndex(index)
-
-        saved_filtered_color = self.settings.value('filtered_trajectory_color')
-        if saved_filtered_color:
-            index = self.filtered_trajectory_color_combo.findText(saved_filtered_color)
-            if index >= 0:
-                self.filtered_trajectory_color_combo.setCurrentIndex(index)
+        # Block signals while restoring: each setCurrentIndex would otherwise
+        # fire currentTextChanged and trigger a replot during construction
+        restores = [
+            (self.color_combo, self.settings.value('trajectory_color')),
+            (self.ground_color_combo, self.settings.value('ground_color')),
+            (self.filtered_trajectory_color_combo,
+             self.settings.value('filtered_trajectory_color')),
+        ]
+        for combo, saved_color in restores:
+            if saved_color:
+                index = combo.findText(saved_color)
+                if index >= 0:
+                    combo.blockSignals(True)
+                    combo.setCurrentIndex(index)
+                    combo.blockSignals(False)
 
     def _on_color_changed(self):
         """
@@ -295,60 +333,105 @@ class GPSXYZ3DPlotPanel(QWidget):
             z_data (array-like): GPS Z coordinates (altitude)
             time_data (array-like): Time data for synchronization with main plot
         """
-        # Store the data
-        self.gps_x_data = np.asarray(x_data, dtype=float)
-        self.gps_y_data = np.asarray(y_data, dtype=float)
-        self.gps_z_data = np.asarray(z_data, dtype=float)
-        self.gps_time_data = np.asarray(time_data, dtype=float)
-
-
-        # Remove any NaN values
-        valid_mask = ~(np.isnan(self.gps_x_data) | np.isnan(self.gps_y_data) |
-                       np.isnan(self.gps_z_data))
-        self.gps_x_data = self.gps_x_data[valid_mask]
-        self.gps_y_data = self.gps_y_data[valid_mask]
-        self.gps_z_data = self.gps_z_data[valid_mask]
-        self.gps_time_data = self.gps_time_data[valid_mask]
-
-        # Create a time mask for filtering. Initially, it has all values set to True
-        self.time_mask = np.ones_like(self.gps_time_data, dtype=bool)
+        # Store the data as a single float32 stack and drop invalid points in
+        # one fused isfinite pass. float32 is ample precision for plotting
+        # metre-scale coordinates and halves memory bandwidth.
+        xyz = np.stack([np.asarray(x_data), np.asarray(y_data),
+                        np.asarray(z_data)], axis=0).astype(np.float32, copy=False)
+        valid_mask = np.isfinite(xyz).all(axis=0)
+        xyz = np.ascontiguousarray(xyz[:, valid_mask])
+        self.gps_x_data = xyz[0]
+        self.gps_y_data = xyz[1]
+        self.gps_z_data = xyz[2]
+        self.gps_time_data = np.asarray(
+            time_data, dtype=np.float32)[valid_mask]
+
+        # Reset the time filter to cover the full dataset
+        self.time_lo = 0
+        self.time_hi = len(self.gps_time_data)
 
         if len(self.gps_x_data) == 0 or len(self.gps_y_data) == 0 or len(self.gps_z_data) == 0:
             return
 
+        # Ground-projection altitude is fixed per dataset; cache it so each
+        # redraw doesn't rescan the z array
+        self._min_z = float(self.gps_z_data.min())
+
+        # Make sure the canvas exists (it is created lazily)
+        self._setup_canvas()
+
         # Clear previous plot
         self.clear_plot()
 
+        # Create the reusable artists for this dataset
+        self._create_artists()
+
         # Plot the trajectory
         self._update_display()
 
         # Auto-scale to show all data
         self.reset_view()
 
+    def _create_artists(self):
+        """
+        Create the trajectory, marker, and projection artists once per dataset.
+
+        _update_display then only mutates these artists (data, color, width,
+        visibility) instead of destroying and recreating them on every
+        settings change.
+        """
+        self.trajectory_line, = self.ax.plot(
+            [], [], [], label='GPS Trajectory')
+        self.filtered_line, = self.ax.plot(
+            [], [], [], label='Time-Filtered Segment')
+        self.start_marker, = self.ax.plot(
+            [], [], [], 'go', markersize=8, label='Start')
+        self.end_marker, = self.ax.plot(
+            [], [], [], 'rs', markersize=8, label='End')
+        # A Line3DCollection draws the projection polyline with much lower
+        # per-segment overhead than a Line2D routed through the 3D transform
+        self.ground_projection = Line3DCollection(
+            np.empty((0, 2, 3)), linewidths=1, alpha=0.5,
+            label='Ground Projection')
+        # autolim=False: the collection starts empty and reset_view sets the
+        # axis limits explicitly
+        self.ax.add_collection3d(self.ground_projection, autolim=False)
+
+    def _display_step(self, num_points):
+        """
+        Return the subsampling stride for display decimation.
+
+        The canvas is only ~1000 px per axis, so drawing every segment of a
+        100k-point log is wasted work. Subsample to roughly four points per
+        pixel of canvas width (at least 2000 points); the stored arrays are
+        left untouched for export and analysis.
+        """
+        target = max(2000, 4 * max(self.canvas.width(), 1))
+        return max(1, num_points // target)
+
     def _update_display(self):
         """
         Update the display based on current settings and filters.
+
+        Mutates the persistent artists created in _create_artists rather than
+        clearing and rebuilding the axes, so settings changes are
+        O(visible artists) instead of O(trajectory points).
         """
         if (self.gps_x_data is None or self.gps_y_data is None or
             self.gps_z_data is None or len(self.gps_x_data) == 0):
             return
 
-        # Clear the entire axes and redraw (safer for 3D plots)
-        self.ax.clear()
+        # Don't render while hidden (e.g. on an inactive tab); defer the
+        # update to the next showEvent instead
+        if not self.isVisible():
+            self._dirty = True
+            return
 
-        # Initialize axis settings and title
-        self.ax.set_xlabel('GPS X (m)')
-        self.ax.set_ylabel('GPS Y (m)')
-        self.ax.set_zlabel('GPS Altitude (m)')
-        self.ax.set_title('GPS 3D Trajectory')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.set_aspect('equal', adjustable='box')
+        if self.trajectory_line is None:
+            self._create_artists()
 
-        # Reset line references
-        self.trajectory_line = None
-        self.start_marker = None
-        self.end_marker = None
-        self.ground_projection = None
+        # Grid and aspect are configured once in clear_plot; reapplying them
+        # here would force a projection recompute on every cosmetic update
 
         # Get current settings
         color = self._get_color(self.color_combo.currentText())
@@ -360,84 +443,111 @@ class GPSXYZ3DPlotPanel(QWidget):
 
         line_width = self.line_width_spin.value()
 
-        # Determine if there are any false values in self.time_mask, indicating that a
-        # filter is applied
-        is_filtered = not np.all(self.time_mask)
+        # Skip the redraw entirely if neither the settings, the time filter,
+        # nor the dataset have changed since the last render
+        render_key = (color, ground_color, filtered_trajectory_color,
+                      line_width,
+                      self.show_trajectory_cb.isChecked(),
+                      self.show_markers_cb.isChecked(),
+                      self.show_projection_cb.isChecked(),
+                      self.time_lo, self.time_hi, id(self.gps_x_data))
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # A filter is applied when the [lo, hi) range covers less than the
+        # full dataset
+        is_filtered = (self.time_lo != 0 or
+                       self.time_hi != len(self.gps_time_data))
 
         if not is_filtered:
-            # Plot the full trajectory
-            if self.show_trajectory_cb.isChecked():
-                self.ax.plot(self.gps_x_data, self.gps_y_data, self.gps_z_data,
-                             color=color, linewidth=line_width,
-                             label='GPS Trajectory')
-
-            # Add start/end markers for full trajectory if enabled
-            if self.show_markers_cb.isChecked():
-                if len(self.gps_x_data) > 0:
-                    self.ax.plot(self.gps_x_data[0], self.gps_y_data[0], self.gps_z_data[0],
-                                 'go', markersize=8, label='Full Trajectory Start')
-                if len(self.gps_x_data) > 1:
-                    self.ax.plot(self.gps_x_data[-1], self.gps_y_data[-1], self.gps_z_data[-1],
-                                 'rs', markersize=8, label='Full Trajectory End')
-
-            # Plot ground projection if enabled
-            if self.show_projection_cb.isChecked():
-                min_z = self.gps_z_data.min()
-                self.ground_projection = self.ax.plot(
-                    self.gps_x_data, self.gps_y_data, min_z,
-                    color=ground_color,
-                    linewidth=1,
-                    alpha=0.5,
-                    label='Ground Projection'
-                )
+            filtered_x = filtered_y = filtered_z = None
+        else:
+            # Slices are views, not copies
+            filtered_x = self.gps_x_data[self.time_lo:self.time_hi]
+            filtered_y = self.gps_y_data[self.time_lo:self.time_hi]
+            filtered_z = self.gps_z_data[self.time_lo:self.time_hi]
+
+        # Full trajectory: normal weight when unfiltered, faded context line
+        # behind the highlighted segment when a time filter is applied
+        step = self._display_step(len(self.gps_x_data))
+        self.trajectory_line.set_data_3d(
+            self.gps_x_data[::step], self.gps_y_data[::step],
+            self.gps_z_data[::step])
+        self.trajectory_line.set_color(color)
+        if is_filtered:
+            self.trajectory_line.set_linewidth(1)
+            self.trajectory_line.set_alpha(0.5)
+            self.trajectory_line.set_label('Full Trajectory')
+            self.trajectory_line.set_visible(True)
+        else:
+            self.trajectory_line.set_linewidth(line_width)
+            self.trajectory_line.set_alpha(1.0)
+            self.trajectory_line.set_label('GPS Trajectory')
+            self.trajectory_line.set_visible(self.show_trajectory_cb.isChecked())
+
+        # Time-filtered segment
+        if is_filtered and len(filtered_x) > 0:
+            step_f = self._display_step(len(filtered_x))
+            self.filtered_line.set_data_3d(
+                filtered_x[::step_f], filtered_y[::step_f], filtered_z[::step_f])
+            self.filtered_line.set_color(filtered_trajectory_color)
+            self.filtered_line.set_linewidth(line_width)
+            self.filtered_line.set_visible(True)
+        else:
+            self.filtered_line.set_visible(False)
 
+        # Start/end markers track whichever segment is highlighted
+        if is_filtered:
+            marker_x, marker_y, marker_z = filtered_x, filtered_y, filtered_z
+            start_label, end_label = 'Filtered Segment Start', 'Filtered Segment End'
         else:
-            if len(self.gps_x_data) > 0:
-                self.ax.plot(self.gps_x_data, self.gps_y_data, self.gps_z_data,
-                            color=color, linewidth=1, alpha=0.5,
-                            label='Full Trajectory')
-
-                filtered_x = self.gps_x_data[self.time_mask]
-                filtered_y = self.gps_y_data[self.time_mask]
-                filtered_z = self.gps_z_data[self.time_mask]
-
-                if len(filtered_x) > 0:
-                    # Get current color setting
-
-                    self.ax.plot(filtered_x, filtered_y, filtered_z,
-                                color=filtered_trajectory_color, linewidth=line_width,
-                                label='Time-Filtered Segment')
-
-                    # Add start/end markers for filtered segment if enabled
-                    if self.show_markers_cb.isChecked():
-                        if len(filtered_x) > 0:
-                            self.ax.plot(filtered_x[0], filtered_y[0], filtered_z[0], 'go',
-                                    markersize=8, label='Filtered Segment Start')
-                        if len(filtered_x) > 1:
-                            self.ax.plot(filtered_x[-1], filtered_y[-1], filtered_z[-1], 'rs',
-                                    markersize=8, label='Filtered Segment End')
-
-                    # Plot ground projection if enabled
-                    if self.show_projection_cb.isChecked():
-                        min_z = self.gps_z_data.min()
-                        self.ground_projection = self.ax.plot(
-                            filtered_x, filtered_y, min_z,
-                            color=ground_color,
-                            linewidth=1,
-                            alpha=0.5,
-                            label='Ground Projection'
-                        )
-
-        # Update legend
-        self.ax.legend()
-
-        # Refresh canvas
-        self.canvas.draw()
+            marker_x, marker_y, marker_z = \
+                self.gps_x_data, self.gps_y_data, self.gps_z_data
+            start_label, end_label = 'Full Trajectory Start', 'Full Trajectory End'
+
+        show_markers = self.show_markers_cb.isChecked() and len(marker_x) > 0
+        if show_markers:
+            self.start_marker.set_data_3d(
+                [marker_x[0]], [marker_y[0]], [marker_z[0]])
+            self.start_marker.set_label(start_label)
+            self.end_marker.set_data_3d(
+                [marker_x[-1]], [marker_y[-1]], [marker_z[-1]])
+            self.end_marker.set_label(end_label)
+        self.start_marker.set_visible(show_markers)
+        self.end_marker.set_visible(show_markers and len(marker_x) > 1)
+
+        # Ground projection of the highlighted segment
+        show_projection = self.show_projection_cb.isChecked() and len(marker_x) > 0
+        if show_projection:
+            min_z = self._min_z
+            step_p = self._display_step(len(marker_x))
+            pts = np.column_stack([
+                marker_x[::step_p], marker_y[::step_p],
+                np.full(len(marker_x[::step_p]), min_z)])
+            if len(pts) > 1:
+                segments = np.stack([pts[:-1], pts[1:]], axis=1)
+            else:
+                segments = np.empty((0, 2, 3))
+            self.ground_projection.set_segments(segments)
+            self.ground_projection.set_color(ground_color)
+        self.ground_projection.set_visible(show_projection)
+
+        # Update legend to show only the visible artists
+        artists = [self.trajectory_line, self.filtered_line, self.start_marker,
+                   self.end_marker, self.ground_projection]
+        self.ax.legend(handles=[a for a in artists if a.get_visible()])
+
+        # Refresh canvas; draw_idle coalesces rapid settings changes
+        self.canvas.draw_idle()
 
     def clear_plot(self):
         """
         Clear the GPS 3D plot and reset axes.
         """
+        if self.ax is None:
+            return
+
         self.ax.clear()
         self.ax.set_xlabel('GPS X (m)')
         self.ax.set_ylabel('GPS Y (m)')
@@ -448,9 +558,11 @@ class GPSXYZ3DPlotPanel(QWidget):
 
         # Reset line references
         self.trajectory_line = None
+        self.filtered_line = None
         self.start_marker = None
         self.end_marker = None
         self.ground_projection = None
+        self._last_render_key = None
 
         self.canvas.draw()
 
@@ -458,36 +570,34 @@ class GPSXYZ3DPlotPanel(QWidget):
         """
         Reset view to show all data with automatic scaling and default angle.
         """
+        if self.ax is None:
+            return
+
         if (self.gps_x_data is not None and self.gps_y_data is not None and
             self.gps_z_data is not None and len(self.gps_x_data) > 0):
 
-            # Add some padding around the data
-            x_range = self.gps_x_data.max() - self.gps_x_data.min()
-            y_range = self.gps_y_data.max() - self.gps_y_data.min()
-            z_range = self.gps_z_data.max() - self.gps_z_data.min()
-
-            max_range = max(x_range, y_range, z_range)
-            padding = max_range * 0.1
+            # One fused min/max reduction per axis instead of six separate
+            # passes over the coordinate arrays
+            xyz = np.stack([self.gps_x_data, self.gps_y_data, self.gps_z_data])
+            mins = xyz.min(axis=1)
+            maxs = xyz.max(axis=1)
+            centers = (maxs + mins) * 0.5
 
-            # Center the data
-            x_center = (self.gps_x_data.max() + self.gps_x_data.min()) / 2
-            y_center = (self.gps_y_data.max() + self.gps_y_data.min()) / 2
-            z_center = (self.gps_z_data.max() + self.gps_z_data.min()) / 2
+            # Equal aspect ratio: use the maximum range for all axes, with
+            # 10% padding
+            half_range = (maxs - mins).max() * 0.5 * 1.2
 
-            # Set equal aspect ratio by using the maximum range for all axes
-            half_range = max_range / 2 + padding
-
-            self.ax.set_xlim(x_center - half_range, x_center + half_range)
-            self.ax.set_ylim(y_center - half_range, y_center + half_range)
-            self.ax.set_zlim(z_center - half_range, z_center + half_range)
+            self.ax.set_xlim(centers[0] - half_range, centers[0] + half_range)
+            self.ax.set_ylim(centers[1] - half_range, centers[1] + half_range)
+            self.ax.set_zlim(centers[2] - half_range, centers[2] + half_range)
 
             # Set a nice default viewing angle
             self.ax.view_init(elev=30, azim=-45)
 
-            self.canvas.draw()
+            self.canvas.draw_idle()
         else:
             self.ax.autoscale()
-            self.canvas.draw()
+            self.canvas.draw_idle()
 
 
     def set_view(self, elevation, azimuth):
@@ -498,8 +608,26 @@ class GPSXYZ3DPlotPanel(QWidget):
             elevation (float): Elevation angle.
             azimuth (float): Azimuth angle.
         """
+        if self.ax is None:
+            return
+
         self.ax.view_init(elev=elevation, azim=azimuth)
-        self.canvas.draw()
+        # draw_idle coalesces rapid view-preset clicks into one repaint
+        self.canvas.draw_idle()
+
+    @property
+    def time_mask(self):
+        """
+        Boolean mask equivalent of the [time_lo, time_hi) filter range.
+
+        Materialized lazily for API compatibility; internal code uses the
+        index range directly.
+        """
+        if self.gps_time_data is None:
+            return None
+        mask = np.zeros(len(self.gps_time_data), dtype=bool)
+        mask[self.time_lo:self.time_hi] = True
+        return mask
 
     def has_gps_3d_data(self):
         """
@@ -523,11 +651,13 @@ class GPSXYZ3DPlotPanel(QWidget):
             self.gps_y_data is not None and
             self.gps_z_data is not None):
 
-            # Find indices within the time range
-            self.time_mask = (self.gps_time_data >= x_min) & (self.gps_time_data <= x_max)
+            # GPS time is monotonic, so a binary search gives the contiguous
+            # index range in O(log N) without allocating a boolean mask
+            self.time_lo = int(np.searchsorted(self.gps_time_data, x_min, side='left'))
+            self.time_hi = int(np.searchsorted(self.gps_time_data, x_max, side='right'))
 
-            if np.any(self.time_mask):
-                # Clear and replot with highlighting
+            if self.time_hi > self.time_lo:
+                # Replot with highlighting
                 self._update_display()
 
 
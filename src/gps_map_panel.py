@@ -7,7 +7,13 @@ Provides a QWidget-based panel for displaying GPS trajectory data on a 2D map us
 Qt WebEngine. Features include interactive controls, color selection, time filtering,
 persistent settings, and map tile selection.
 """
-from typing import Iterable, List, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Optional
 import numpy as np
 
 from PySide6.QtWidgets import (
@@ -19,10 +25,65 @@ from PySide6.QtWidgets import (
     QComboBox,
     QPushButton,
 )
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import (QObject, QRunnable, QSettings, QThreadPool,
+                            QTimer, QUrl, Signal)
 from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWebEngineCore import QWebEngineSettings
 
 import folium
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_coords(obj) -> str:
+    """
+    Serialize a coordinate payload (possibly containing numpy arrays) to a
+    JSON string, using orjson when available.
+
+    orjson serializes numpy arrays directly — no tolist() round-trip — and
+    is several times faster than the stdlib encoder, which matters because
+    coordinate serialization dominates CPU time for long tracks.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, default=lambda a: a.tolist())
+
+
+# Color names offered by the combo boxes; the folium color string is just
+# the lowercased display name for every entry
+_TRAJ_COLORS = frozenset(
+    {"blue", "red", "green", "orange", "purple", "brown", "pink", "gray"})
+
+
+class _MapRenderSignals(QObject):
+    """
+    Signal holder for _MapRenderTask; QRunnable itself cannot emit signals.
+    """
+    rendered = Signal(int, str)
+
+
+class _MapRenderTask(QRunnable):
+    """
+    Renders a fully built Folium map to HTML on a thread-pool worker.
+
+    Template rendering for a long track can take hundreds of milliseconds;
+    doing it off the UI thread keeps the controls responsive. The epoch
+    lets the panel drop results that were superseded while in flight.
+    """
+
+    def __init__(self, epoch: int, root) -> None:
+        super().__init__()
+        self._epoch = epoch
+        self._root = root
+        self.signals = _MapRenderSignals()
+
+    def run(self) -> None:
+        self.signals.rendered.emit(self._epoch, self._root.render())
+
+
 class GPS2DMap(QWidget):
     """
     QWidget-based panel for displaying GPS trajectory data on a 2D map using Folium.
@@ -52,9 +113,46 @@ class GPS2DMap(QWidget):
         # Additional attributes initialized later
         self.time_mask: Optional[np.ndarray] = None
         self.center: List[float] = [0.0, 0.0]
-        self.coords: List[Tuple[float, float]] = []
         self.m: Optional[folium.Map] = None
 
+        # Small LRU of rendered HTML keyed by display settings, so cosmetic
+        # round-trips (e.g. toggling a color back) skip the Folium re-render
+        self._html_cache: OrderedDict = OrderedDict()
+
+        # Leaflet variable names of the polylines in the currently loaded
+        # page, used to update the time filter client-side without a full
+        # map rebuild. Valid only once the page has finished loading.
+        self._full_polyline_name: Optional[str] = None
+        self._filtered_polyline_name: Optional[str] = None
+        self._page_loaded: bool = False
+
+        # Filtered coordinate array cached per time_mask update so
+        # cosmetic-only redraws don't redo the fancy-index and stack
+        self._filtered_coords: Optional[np.ndarray] = None
+
+        # (tiles, filter) state of the currently loaded page; when only the
+        # colors or line width differ from this, the page is restyled
+        # client-side instead of rebuilt
+        self._loaded_base_key: Optional[tuple] = None
+
+        # Full settings/filter state of the last dispatched render, used to
+        # drop redundant _update_display calls (e.g. a change handler fired
+        # by a programmatic setCurrentIndex with an unchanged value)
+        self._last_render_state: Optional[tuple] = None
+
+        # Digest of the currently loaded track data; render_gps_path uses it
+        # to recognize the same track being passed again (re-selecting the
+        # same file, refreshing UI state) and keep the cached renders alive
+        self._track_digest: Optional[bytes] = None
+
+        # Temp file the rendered map is served from; loading via file:// lets
+        # WebEngine cache the Leaflet assets across reloads, unlike setHtml
+        self._map_path: Optional[Path] = None
+
+        # Optional view bounds (lat_min, lat_max, lon_min, lon_max) used to
+        # crop off-screen segments before they reach Leaflet
+        self._view_bounds: Optional[tuple] = None
+
         # UI components (initialized in _setup_ui)
         self.tiles_combo: QComboBox
         self.trajectory_color_combo: QComboBox
@@ -66,6 +164,23 @@ class GPS2DMap(QWidget):
         # Initialize QSettings for persistence
         self.settings: QSettings = QSettings('RCLogViewer', 'GPS2DMapPanel')
 
+        # Last values written to QSettings, so unchanged keys are not
+        # re-synced to disk on every change-handler fire
+        self._last_saved_settings: dict = {}
+
+        # Background HTML rendering: a monotonically increasing epoch tags
+        # each dispatched render so stale worker results are discarded
+        self._render_pool = QThreadPool.globalInstance()
+        self._render_epoch: int = 0
+        self._pending_render: Optional[tuple] = None
+
+        # Coalesce bursts of redraw requests (pan/zoom ticks, rapid combo
+        # changes) into a single re-render; latest state wins
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(75)
+        self._redraw_timer.timeout.connect(self._update_display)
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -77,6 +192,11 @@ class GPS2DMap(QWidget):
         # Web view that hosts the Folium map
         self.web_view = QWebEngineView()
         self.web_view.setZoomFactor(self._zoom_factor)
+        self.web_view.loadFinished.connect(self._on_page_loaded)
+        # The map page fetches its coordinate data from a sibling file://
+        # JSON file, which requires local content access
+        self.web_view.settings().setAttribute(
+            QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
         layout.addWidget(self.web_view)
 
         # Controls row: imagery selector + (optional) zoom buttons
@@ -141,80 +261,177 @@ class GPS2DMap(QWidget):
         """
         Convert trajectory color name to folium color string.
         """
-        color_map = {
-            "Blue": "blue",
-            "Red": "red",
-            "Green": "green",
-            "Orange": "orange",
-            "Purple": "purple",
-            "Brown": "brown",
-            "Pink": "pink",
-            "Gray": "gray"
-        }
-        return color_map.get(color_name, "blue")
+        color = color_name.lower()
+        return color if color in _TRAJ_COLORS else "blue"
 
     def _get_filtered_trajectory_color(self, color_name: str) -> str:
         """
         Convert filtered trajectory color name to folium color string.
         """
-        color_map = {
-            "Orange": "orange",
-            "Red": "red",
-            "Green": "green",
-            "Blue": "blue",
-            "Purple": "purple",
-            "Brown": "brown",
-            "Pink": "pink",
-            "Gray": "gray"
-        }
-        return color_map.get(color_name, "orange")
+        color = color_name.lower()
+        return color if color in _TRAJ_COLORS else "orange"
 
     def _save_color_settings(self) -> None:
         """
         Save color and style selections to QSettings for persistence.
+
+        Only keys whose value actually changed are written, keeping disk
+        I/O out of the interactive render path.
         """
-        self.settings.setValue('trajectory_color', self.trajectory_color_combo.currentText())
-        self.settings.setValue('filtered_trajectory_color',
-                               self.filtered_trajectory_color_combo.currentText())
-        self.settings.setValue('line_width', self.line_width_combo.currentText())
+        values = {
+            'trajectory_color': self.trajectory_color_combo.currentText(),
+            'filtered_trajectory_color':
+                self.filtered_trajectory_color_combo.currentText(),
+            'line_width': self.line_width_combo.currentText(),
+        }
+        for key, value in values.items():
+            if self._last_saved_settings.get(key) != value:
+                self.settings.setValue(key, value)
+                self._last_saved_settings[key] = value
 
     def _load_color_settings(self) -> None:
         """
         Load color and style selections from QSettings for persistence.
         """
-        saved_trajectory_color = self.settings.value('trajectory_color')
-        if saved_trajectory_color:
-            index = self.trajectory_color_combo.findText(saved_trajectory_color)
-            if index >= 0:
-                self.trajectory_color_combo.setCurrentIndex(index)
-
-        saved_filtered_color = self.settings.value('filtered_trajectory_color')
-        if saved_filtered_color:
-            index = self.filtered_trajectory_color_combo.findText(saved_filtered_color)
-            if index >= 0:
-                self.filtered_trajectory_color_combo.setCurrentIndex(index)
-
-        saved_line_width = self.settings.value('line_width')
-        if saved_line_width:
-            index = self.line_width_combo.findText(saved_line_width)
-            if index >= 0:
-                self.line_width_combo.setCurrentIndex(index)
+        # Block signals while restoring so each setCurrentIndex doesn't fire
+        # a change handler (and a re-render) during construction
+        restores = [
+            (self.trajectory_color_combo, 'trajectory_color'),
+            (self.filtered_trajectory_color_combo, 'filtered_trajectory_color'),
+            (self.line_width_combo, 'line_width'),
+        ]
+        for combo, key in restores:
+            saved_value = self.settings.value(key)
+            if saved_value:
+                index = combo.findText(saved_value)
+                if index >= 0:
+                    combo.blockSignals(True)
+                    combo.setCurrentIndex(index)
+                    combo.blockSignals(False)
+                    # The stored value is current; no need to rewrite it on
+                    # the next save
+                    self._last_saved_settings[key] = saved_value
 
     def _on_color_changed(self) -> None:
         """
         Handle color combo box changes and update display.
         """
         self._save_color_settings()
-        self._update_display()
+        if self.gps_lat_data is not None:
+            self._redraw_timer.start()
 
     def _on_line_width_changed(self) -> None:
         """
         Handle line width combo box changes and update display.
         """
         self._save_color_settings()
-        self._update_display()
+        if self.gps_lat_data is not None:
+            self._redraw_timer.start()
+
+    # Maximum number of coordinate pairs handed to a Leaflet polyline; above
+    # this the track is decimated by a uniform stride before serialization
+    _MAX_POLYLINE_POINTS = 5000
+
+    def _display_coords(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """
+        Build the (n, 2) coordinate array for a polyline, decimating very
+        long tracks so the serialized JSON and Leaflet rendering stay
+        manageable.
+
+        The final point is always included so the track endpoint is exact;
+        the stored full-resolution arrays are unaffected. The result stays a
+        numpy array so orjson can serialize it without a Python list
+        round-trip.
+        """
+        # Crop segments far outside the current view so Leaflet never lays
+        # them out; the bounds are padded so panning slightly stays seamless
+        if self._view_bounds is not None and len(lat) > 0:
+            lat_lo, lat_hi, lon_lo, lon_hi = self._view_bounds
+            lat_pad = (lat_hi - lat_lo) * 0.1
+            lon_pad = (lon_hi - lon_lo) * 0.1
+            crop = ((lat >= lat_lo - lat_pad) & (lat <= lat_hi + lat_pad) &
+                    (lon >= lon_lo - lon_pad) & (lon <= lon_hi + lon_pad))
+            if not crop.all():
+                lat = lat[crop]
+                lon = lon[crop]
+
+        n = len(lat)
+        if n > self._MAX_POLYLINE_POINTS:
+            step = n // self._MAX_POLYLINE_POINTS
+            coords = np.column_stack((lat[::step], lon[::step]))
+            if (n - 1) % step != 0:
+                coords = np.vstack((coords, [lat[-1], lon[-1]]))
+            return coords
+        return np.column_stack((lat, lon))
+
+    def _ensure_map_path(self) -> Path:
+        """
+        Return the session temp file the rendered map is served from,
+        creating the name on first use.
+        """
+        if self._map_path is None:
+            self._map_path = Path(tempfile.gettempdir()) / \
+                f"rclogviewer_map_{os.getpid()}_{id(self):x}.html"
+        return self._map_path
+
+    def _coords_path(self) -> Path:
+        """
+        Return the sibling JSON file holding the polyline coordinates.
+        """
+        return self._ensure_map_path().with_suffix('.coords.json')
+
+    def _show_html(self, html: str, coords_payload: str) -> None:
+        """
+        Display rendered map HTML by writing it and its coordinate payload
+        to the session temp files and (re)loading through a file:// URL.
+        """
+        map_path = self._ensure_map_path()
+        self._coords_path().write_text(coords_payload, encoding='utf-8')
+        map_path.write_text(html, encoding='utf-8')
+
+        self._page_loaded = False
+        url = QUrl.fromLocalFile(str(map_path))
+        if self.web_view.url() == url:
+            self.web_view.reload()
+        else:
+            self.web_view.setUrl(url)
+
+    def _filtered_display_coords(self) -> np.ndarray:
+        """
+        Return the display coordinates of the time-filtered segment, cached
+        until the time mask or dataset changes.
+        """
+        if self._filtered_coords is None:
+            self._filtered_coords = self._display_coords(
+                self.gps_lat_data[self.time_mask],
+                self.gps_lon_data[self.time_mask])
+        return self._filtered_coords
 
     # --- Public API ---
+    def set_view_bounds(self, lat_min: float, lat_max: float,
+                        lon_min: float, lon_max: float) -> None:
+        """
+        Restrict rendered polylines to a (padded) geographic bounding box.
+
+        Intended for callers that know the visible region (e.g. a linked
+        plot panel); segments outside the box are dropped before they are
+        serialized for Leaflet. Marker endpoints are unaffected.
+        """
+        self._view_bounds = (lat_min, lat_max, lon_min, lon_max)
+        self._filtered_coords = None
+        if self.gps_lat_data is not None:
+            self._redraw_timer.start()
+
+    def clear_view_bounds(self) -> None:
+        """
+        Remove any view-bounds crop and restore full-track rendering.
+        """
+        if self._view_bounds is not None:
+            self._view_bounds = None
+            self._filtered_coords = None
+            if self.gps_lat_data is not None:
+                self._redraw_timer.start()
+
     def render_gps_path(self, latitudes: Iterable[float], longitudes: Iterable[float],
                         time_data: Iterable[float]) -> None:
         """
@@ -225,55 +442,81 @@ class GPS2DMap(QWidget):
             longitudes (Iterable[float]): GPS longitude data.
             time_data (Iterable[float]): Time data for synchronization.
         """
-        self.gps_lat_data = np.asarray(latitudes, dtype=float) \
-            if latitudes is not None else np.array([])
-        self.gps_lon_data = np.asarray(longitudes, dtype=float) \
-            if longitudes is not None else np.array([])
-        self.gps_time_data = np.asarray(time_data, dtype=float) \
+        # float32 resolves ~1e-7 degrees (about 1 cm), ample for display,
+        # and halves the memory traffic of every downstream mask and copy.
+        # Time stays float64 in case epoch timestamps are passed in.
+        lat = np.asarray(latitudes, dtype=np.float32) \
+            if latitudes is not None else np.array([], dtype=np.float32)
+        lon = np.asarray(longitudes, dtype=np.float32) \
+            if longitudes is not None else np.array([], dtype=np.float32)
+        t = np.asarray(time_data, dtype=np.float64) \
             if time_data is not None else np.array([])
 
-        valid_mask_nan = ~(np.isnan(self.gps_lat_data) | np.isnan(self.gps_lon_data) |
-                       np.isnan(self.gps_time_data))
-
-        self.gps_lat_data = self.gps_lat_data[valid_mask_nan]
-        self.gps_lon_data = self.gps_lon_data[valid_mask_nan]
-        self.gps_time_data = self.gps_time_data[valid_mask_nan]
-
-        # Filter out invalid GPS coordinates
+        # A folium render of a long track takes seconds; when the same track
+        # is passed again, skip the rebuild and re-show from the existing
+        # HTML cache instead of invalidating it
+        digest = hashlib.blake2b(lat.tobytes(), digest_size=16)
+        digest.update(lon.tobytes())
+        digest.update(t.tobytes())
+        key = digest.digest()
+        if key == self._track_digest and self.gps_lat_data is not None:
+            # The view may have been blanked by clear(); force a re-show
+            # through the cache rather than a client-side restyle
+            self._page_loaded = False
+            self._loaded_base_key = None
+            self._last_render_state = None
+            self._update_display()
+            return
+        self._track_digest = key
 
-        valid_mask_numeric = (self.gps_lat_data >= -90.0) & (self.gps_lat_data <= 90.0) & \
-                           (self.gps_lon_data >= -180.0) & (self.gps_lon_data <= 180.0)
+        # Single fused validation pass: the range comparisons are False for
+        # NaN lat/lon, and (t == t) rejects NaN times, so one mask and one
+        # fancy-index copy per array replaces the old two-stage filter
+        valid_mask = ((lat >= -90.0) & (lat <= 90.0) &
+                      (lon >= -180.0) & (lon <= 180.0) & (t == t))
 
-        self.gps_lat_data = self.gps_lat_data[valid_mask_numeric]
-        self.gps_lon_data = self.gps_lon_data[valid_mask_numeric]
-        self.gps_time_data = self.gps_time_data[valid_mask_numeric]
+        # Boolean fancy-indexing rescans the mask per array; resolve the
+        # indices once and reuse them for all three takes
+        valid_idx = np.flatnonzero(valid_mask)
+        self.gps_lat_data = np.take(lat, valid_idx)
+        self.gps_lon_data = np.take(lon, valid_idx)
+        self.gps_time_data = np.take(t, valid_idx)
 
         # Create a time mask for filtering. Initially, it has all values set to True
         self.time_mask = np.ones_like(self.gps_time_data, dtype=bool)
 
-        # Calculate center of the GPS path as the average of the latitude and longitude data
-        if self.gps_lat_data is None or self.gps_lon_data is None:
+        # Scratch boolean buffers reused by sync_x_limits so slider drags
+        # don't allocate fresh mask arrays on every tick
+        self._mask_scratch = np.empty_like(self.time_mask)
+        self._mask_tmp = np.empty_like(self.time_mask)
+
+        # Cached renders, filter slices, and view crop belong to the
+        # previous dataset
+        self._html_cache.clear()
+        self._filtered_coords = None
+        self._view_bounds = None
+        self._last_render_state = None
+
+        # Compute the data extents once and reuse them for both the map
+        # center and the fit_bounds call below
+        if len(self.gps_lat_data) == 0:
+            self._bounds = (0.0, 0.0, 0.0, 0.0)
             self.center = [0.0, 0.0]
         else:
-            self.center = [
-                (self.gps_lat_data.max() + self.gps_lat_data.min()) / 2,
-                (self.gps_lon_data.max() + self.gps_lon_data.min()) / 2
-            ]
-
-        #create a list of coordinates
-        self.coords = list(zip(self.gps_lat_data, self.gps_lon_data))
+            lat_min = self.gps_lat_data.min()
+            lat_max = self.gps_lat_data.max()
+            lon_min = self.gps_lon_data.min()
+            lon_max = self.gps_lon_data.max()
+            self._bounds = (lat_min, lat_max, lon_min, lon_max)
+            self.center = [(lat_max + lat_min) / 2, (lon_max + lon_min) / 2]
 
         # Clear previous plot
         self.clear()
 
-        # Plot the trajectory
+        # Plot the trajectory (bounds fitting happens during the map build,
+        # before the page is rendered on the worker thread)
         self._update_display()
 
-        # Fit bounds using the extents of the data points to be plotted
-        sw_corner = [self.gps_lat_data.min(), self.gps_lon_data.min()]
-        ne_corner = [self.gps_lat_data.max(), self.gps_lon_data.max()]
-        self.m.fit_bounds([sw_corner, ne_corner])
-
 
     def _update_display(self) -> None:
         """
@@ -282,13 +525,6 @@ class GPS2DMap(QWidget):
         if self.gps_lat_data is None or self.gps_lon_data is None:
             return
 
-        # Build Folium map with selected tiles
-        self.m = folium.Map(location=self.center, zoom_start=18, control_scale=True,
-                            zoom_control=True, tiles=None)
-        tiles_name = self.tiles_combo.currentText()
-        self._add_tiles_layer(self.m, tiles_name)
-
-
         # Get colors for the trajectory and filtered trajectory
         filtered_color = self._get_filtered_trajectory_color(
             self.filtered_trajectory_color_combo.currentText())
@@ -299,74 +535,264 @@ class GPS2DMap(QWidget):
         # Get line width
         line_width = int(self.line_width_combo.currentText())
 
+        tiles_name = self.tiles_combo.currentText()
+
         # Determine if there are any false values in self.time_mask, indicating that a
         # filter is applied
         is_filtered = not np.all(self.time_mask)
 
+        # When the loaded page already shows the right tiles, data, and
+        # filter, a color or width change only needs a client-side restyle —
+        # the markers, tile layer, and coordinate payload are all unchanged
+        base_key = (tiles_name, self._view_bounds,
+                    self.time_mask.tobytes() if is_filtered else None)
+
+        # Nothing changed since the last dispatched render (the change
+        # handlers fire even for no-op programmatic updates) — skip entirely
+        render_state = (base_key, trajectory_color, filtered_color, line_width)
+        if render_state == self._last_render_state:
+            return
+        self._last_render_state = render_state
+
+        if (self._page_loaded and base_key == self._loaded_base_key and
+                self._try_js_restyle(trajectory_color, filtered_color,
+                                     line_width, is_filtered)):
+            # Supersede any background render still in flight
+            self._render_epoch += 1
+            self._pending_render = None
+            return
+
+        # Serve a cached render when the same settings/filter combination has
+        # been displayed before (e.g. the user toggles a color back)
+        cache_key = (tiles_name, trajectory_color, filtered_color, line_width,
+                     self._view_bounds,
+                     self.time_mask.tobytes() if is_filtered else None)
+        cached = self._html_cache.get(cache_key)
+        if cached is not None:
+            self._html_cache.move_to_end(cache_key)
+            html, full_name, filtered_name, coords_payload = cached
+            self._full_polyline_name = full_name
+            self._filtered_polyline_name = filtered_name
+            self._loaded_base_key = base_key
+            self._render_epoch += 1
+            self._pending_render = None
+            self._show_html(html, coords_payload)
+            self.reset_view_button.setEnabled(True)
+            return
+
+        # Build Folium map with selected tiles
+        self.m = folium.Map(location=self.center, zoom_start=18, control_scale=True,
+                            zoom_control=True, tiles=None)
+        self._add_tiles_layer(self.m, tiles_name)
+
+        # Fit bounds using the extents of the data points to be plotted;
+        # this must happen before the map is handed to the render worker
+        if len(self.gps_lat_data) > 0:
+            lat_min, lat_max, lon_min, lon_max = self._bounds
+            self.m.fit_bounds([[lat_min, lon_min], [lat_max, lon_max]])
+
+        # Lat/lon stay as separate numpy arrays (structure-of-arrays); the
+        # coordinate pair list Folium needs is materialized once, here, with
+        # a single column_stack instead of N Python tuples held long-term
+        coords = self._display_coords(self.gps_lat_data, self.gps_lon_data)
+
+        # Marker endpoints use the exact (undecimated) track ends
+        start_coord = [float(self.gps_lat_data[0]), float(self.gps_lon_data[0])]
+        end_coord = [float(self.gps_lat_data[-1]), float(self.gps_lon_data[-1])]
+
         if not is_filtered:
-            # Plot the full trajectory
-            folium.PolyLine(self.coords, color=trajectory_color, weight=line_width, opacity=1.0
-                            ).add_to(self.m)
+            filtered_coords = np.empty((0, 2), dtype=np.float32)
+
+            # Plot the full trajectory (coordinates are fetched client-side,
+            # so the polyline itself starts empty)
+            full_line = folium.PolyLine([], color=trajectory_color,
+                                        weight=line_width, opacity=1.0)
+            full_line.add_to(self.m)
 
              # Display markers for the start and finish of the full trajectory
-            folium.Marker(location=self.coords[0], tooltip="Trajectory Start",
+            folium.Marker(location=start_coord, tooltip="Trajectory Start",
                           icon=folium.Icon(color="green")).add_to(self.m)
 
-            if len(self.coords) > 1:
+            if len(coords) > 1:
                 folium.Marker(
-                    location=self.coords[-1], tooltip="Trajectory End",
+                    location=end_coord, tooltip="Trajectory End",
                     icon=folium.Icon(color="red")).add_to(self.m)
         else:
             # Plot the full trajectory with a narrow line
-            folium.PolyLine(self.coords, color=trajectory_color, weight=1, opacity=0.8
-                            ).add_to(self.m)
+            full_line = folium.PolyLine([], color=trajectory_color,
+                                        weight=1, opacity=0.8)
+            full_line.add_to(self.m)
 
             # Display markers for the start and finish of the full trajectory
-            folium.Marker(location=self.coords[0], tooltip="Full Trajectory Start",
+            folium.Marker(location=start_coord, tooltip="Full Trajectory Start",
                           icon=folium.Icon(color="green")).add_to(self.m)
 
-            if len(self.coords) > 1:
+            if len(coords) > 1:
                 folium.Marker(
-                    location=self.coords[-1], tooltip="Full Trajectory End",
+                    location=end_coord, tooltip="Full Trajectory End",
                     icon=folium.Icon(color="red")).add_to(self.m)
 
-            # Plot the filtered trajectory using the mask on the original data with
+            # The filtered trajectory uses the mask on the original data with
             # a different color and a thicker line
-            filtered_coords = list(zip(self.gps_lat_data[self.time_mask],
-                                     self.gps_lon_data[self.time_mask]))
-            if filtered_coords:
-                folium.PolyLine(filtered_coords, color=filtered_color, weight=line_width,
-                                opacity=0.8).add_to(self.m)
+            filtered_coords = self._filtered_display_coords()
 
+            if len(filtered_coords) > 0:
                 # Display markers for the start and finish of the filtered trajectory
-                folium.Marker(location=filtered_coords[0], tooltip="Filtered Trajectory Start",
+                folium.Marker(location=filtered_coords[0].tolist(),
+                              tooltip="Filtered Trajectory Start",
                               icon=folium.Icon(color="green")).add_to(self.m)
 
                 if len(filtered_coords) > 1:
                     folium.Marker(
-                        location=filtered_coords[-1], tooltip="Filtered Trajectory End",
+                        location=filtered_coords[-1].tolist(),
+                        tooltip="Filtered Trajectory End",
                         icon=folium.Icon(color="red")).add_to(self.m)
 
-        # Render and display
-        html = self.m.get_root().render()
-        self.web_view.setHtml(html)
+        # The filtered polyline is always present (empty when no filter is
+        # applied) so sync_x_limits can update its coordinates client-side
+        # through runJavaScript instead of rebuilding the whole page
+        filtered_line = folium.PolyLine([], color=filtered_color,
+                                        weight=line_width, opacity=0.8)
+        filtered_line.add_to(self.m)
+
+        self._full_polyline_name = full_line.get_name()
+        self._filtered_polyline_name = filtered_line.get_name()
+
+        # The bulk coordinate data lives in a sibling JSON file streamed in
+        # with fetch(), keeping the HTML document itself small
+        coords_payload = _json_coords({"full": coords,
+                                       "filtered": filtered_coords})
+        loader = folium.Element(
+            "<script>"
+            f"fetch('{self._coords_path().name}')"
+            ".then(r => r.json()).then(d => {"
+            f"{self._full_polyline_name}.setLatLngs(d.full);"
+            f"{self._filtered_polyline_name}.setLatLngs(d.filtered);"
+            "});"
+            "</script>")
+        self.m.get_root().html.add_child(loader)
+
+        # Render on a worker thread; the completed HTML is posted back to
+        # _on_map_rendered, and any result superseded meanwhile is dropped
+        self._render_epoch += 1
+        self._pending_render = (base_key, cache_key, coords_payload)
+        task = _MapRenderTask(self._render_epoch, self.m.get_root())
+        task.signals.rendered.connect(self._on_map_rendered)
+        self._render_pool.start(task)
+
+    def _on_map_rendered(self, epoch: int, html: str) -> None:
+        """
+        Display a worker-rendered map page, unless it has been superseded.
+        """
+        if epoch != self._render_epoch or self._pending_render is None:
+            return
+        base_key, cache_key, coords_payload = self._pending_render
+        self._pending_render = None
+
+        self._loaded_base_key = base_key
+        self._show_html(html, coords_payload)
+
+        # Remember the render for future cache hits (bounded LRU)
+        self._html_cache[cache_key] = (html, self._full_polyline_name,
+                                       self._filtered_polyline_name,
+                                       coords_payload)
+        while len(self._html_cache) > 8:
+            self._html_cache.popitem(last=False)
 
         # Enable reset view button now that we have GPS data
         self.reset_view_button.setEnabled(True)
 
     # --- Internal helpers ---
+    def _on_page_loaded(self, ok: bool) -> None:
+        """
+        Record whether the current map page finished loading; client-side
+        polyline updates are only attempted against a fully loaded page.
+        """
+        self._page_loaded = ok
+
+    def _try_js_restyle(self, trajectory_color: str, filtered_color: str,
+                        line_width: int, is_filtered: bool) -> bool:
+        """
+        Restyle the loaded page's polylines in place for color/width-only
+        changes, leaving the markers, tile layer, and coordinates untouched.
+
+        Returns:
+            bool: True if the restyle was dispatched, False if a full render
+            is required.
+        """
+        if (self._full_polyline_name is None or
+                self._filtered_polyline_name is None):
+            return False
+
+        if is_filtered:
+            full_style = {"color": trajectory_color, "weight": 1,
+                          "opacity": 0.8}
+        else:
+            full_style = {"color": trajectory_color, "weight": line_width,
+                          "opacity": 1.0}
+        filtered_style = {"color": filtered_color, "weight": line_width,
+                          "opacity": 0.8}
+
+        script = (
+            f"{self._full_polyline_name}.setStyle({json.dumps(full_style)});"
+            f"{self._filtered_polyline_name}.setStyle("
+            f"{json.dumps(filtered_style)});"
+        )
+        self.web_view.page().runJavaScript(script)
+        return True
+
+    def _try_js_filter_update(self) -> bool:
+        """
+        Apply the current time filter to the loaded page via JavaScript.
+
+        Updates the filtered polyline's coordinates and the full polyline's
+        style in place, avoiding the full map rebuild, page reload, and tile
+        refetch that a re-render would cost. The filtered start/end markers
+        are only refreshed on full renders.
+
+        Returns:
+            bool: True if the update was dispatched, False if a full render
+            is required (page not loaded yet or no polylines present).
+        """
+        if (not self._page_loaded or self._filtered_polyline_name is None or
+                self._full_polyline_name is None):
+            return False
+
+        is_filtered = not np.all(self.time_mask)
+        if is_filtered:
+            filtered_coords = self._filtered_display_coords()
+        else:
+            filtered_coords = np.empty((0, 2), dtype=np.float32)
+
+        line_width = int(self.line_width_combo.currentText())
+        if is_filtered:
+            full_style = {"weight": 1, "opacity": 0.8}
+        else:
+            full_style = {"weight": line_width, "opacity": 1.0}
+
+        script = (
+            f"{self._filtered_polyline_name}.setLatLngs("
+            f"{_json_coords(filtered_coords)});"
+            f"{self._full_polyline_name}.setStyle({json.dumps(full_style)});"
+        )
+        self.web_view.page().runJavaScript(script)
+        return True
+
     def _on_tiles_changed(self, _: str) -> None:
         """
         Handle map tile selection changes and update display.
         """
         # Re-render if we have previous coordinates
-        self._update_display()
+        if self.gps_lat_data is not None:
+            self._redraw_timer.start()
 
     def _on_reset_view(self) -> None:
         """
         Reset the map view to center on the GPS track with appropriate zoom.
         """
-        self._update_display()
+        # A reset must reload the page even with unchanged settings
+        self._last_render_state = None
+        self._redraw_timer.start()
 
     def _add_tiles_layer(self, m: folium.Map, tiles_name: str) -> None:
         """
@@ -435,6 +861,15 @@ class GPS2DMap(QWidget):
             # Reset state variables
             self.reset_view_button.setEnabled(False)
 
+            # Remove the session temp files
+            if self._map_path is not None:
+                try:
+                    self._coords_path().unlink(missing_ok=True)
+                    self._map_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+                self._map_path = None
+
         except Exception:
             pass
 
@@ -452,12 +887,21 @@ class GPS2DMap(QWidget):
             self.gps_lat_data is not None and
             self.gps_lon_data is not None ):
 
-            # Find indices within the time range
-            self.time_mask = (self.gps_time_data >= x_min) & (self.gps_time_data <= x_max)
+            # Find indices within the time range, writing into the
+            # preallocated scratch buffers (no temporaries per tick)
+            np.greater_equal(self.gps_time_data, x_min, out=self._mask_scratch)
+            np.less_equal(self.gps_time_data, x_max, out=self._mask_tmp)
+            np.logical_and(self._mask_scratch, self._mask_tmp,
+                           out=self._mask_scratch)
+            self.time_mask = self._mask_scratch
+            self._filtered_coords = None
 
             if np.any(self.time_mask):
-                # Clear and replot with highlighting
-                self._update_display()
+                # Prefer updating the loaded page's polylines in place;
+                # fall back to a debounced full re-render when that isn't
+                # possible
+                if not self._try_js_filter_update():
+                    self._redraw_timer.start()
 
     def closeEvent(self, event) -> None:
         """
@@ -1,404 +1,700 @@
-"""
-Copyright Andrew Fernie, 2025
-
-gps_plot_panel.py
-
-Provides a QWidget-based panel for visualizing GPS XY trajectory data using matplotlib.
-Features include interactive controls, color selection, time filtering, and persistent settings.
-"""
-
-import numpy as np
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QPushButton, QCheckBox, QSpinBox, QComboBox,
-                              QGroupBox)
-from PySide6.QtCore import QSettings
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
-
-
-class GPSXYPlotPanel(QWidget):
-    """
-    QWidget-based panel for displaying GPS XY trajectory data in 3D. The data plotted is in
-    X/Y coordinates that have been generated from GPS latitude and longitude.
-
-    Features:
-        - Interactive controls for trajectory, markers, line width, and colors.
-        - Persistent color settings using QSettings.
-        - If the user has used the zoom feature in the dataseries plot panel to examine a subset
-          of the data, the plot will show the subset in one color and the full dataset in
-          another color. Colors are configurable via the control panel.
-    """
-
-    def __init__(self, parent=None):
-        """
-        Initialize the GPSXYPlotPanel widget and its UI components.
-        """
-        super().__init__(parent)
-
-        self.figure = None
-        self.canvas = None
-        self.ax = None
-        self.trajectory_line = None
-        self.start_marker = None
-        self.end_marker = None
-
-        self.gps_x_data = None
-        self.gps_y_data = None
-        self.gps_time_data = None
-        self.time_mask = None
-
-        self._setup_ui()
-
-    def _setup_ui(self):
-        """
-        Set up the user interface, including plot canvas, controls, and color selectors.
-        """
-        layout = QVBoxLayout(self)
-
-        # Create matplotlib figure and canvas
-        self.figure = Figure(figsize=(10, 8), dpi=100, facecolor='white')
-        self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111)
-
-        # Set up the plot
-        self.ax.set_xlabel('GPS X (m)')
-        self.ax.set_ylabel('GPS Y (m)')
-        self.ax.set_title('GPS Trajectory')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.set_aspect('equal', adjustable='box')
-
-        layout.addWidget(self.canvas)
-
-        # Add navigation toolbar
-        self.toolbar = NavigationToolbar(self.canvas, self)
-        layout.addWidget(self.toolbar)
-
-        # Control panel
-        controls_group = QGroupBox("GPS Plot Controls")
-        controls_layout = QVBoxLayout(controls_group)
-
-        # First row - Checkboxes only
-        row1_layout = QHBoxLayout()
-
-        # Show trajectory checkbox
-        self.show_trajectory_cb = QCheckBox("Show Trajectory")
-        self.show_trajectory_cb.setChecked(True)
-        self.show_trajectory_cb.stateChanged.connect(self._update_display)
-        row1_layout.addWidget(self.show_trajectory_cb)
-
-        # Show start/end markers checkbox
-        self.show_markers_cb = QCheckBox("Show Start/End Markers")
-        self.show_markers_cb.setChecked(True)
-        self.show_markers_cb.stateChanged.connect(self._update_display)
-        row1_layout.addWidget(self.show_markers_cb)
-
-        row1_layout.addStretch()
-        controls_layout.addLayout(row1_layout)
-
-        # Second row - Line width and color controls
-        row2_layout = QHBoxLayout()
-
-        # Line width control
-        line_width_label = QLabel("Line Width:")
-        row2_layout.addWidget(line_width_label)
-
-        self.line_width_spin = QSpinBox()
-        self.line_width_spin.setMinimum(1)
-        self.line_width_spin.setMaximum(10)
-        self.line_width_spin.setValue(2)
-        self.line_width_spin.valueChanged.connect(self._update_display)
-        row2_layout.addWidget(self.line_width_spin)
-
-        # Color control
-        color_label = QLabel("Trajectory Color:")
-        row2_layout.addWidget(color_label)
-
-        self.color_combo = QComboBox()
-        self.color_combo.addItems([
-            "Blue", "Red", "Green", "Orange", "Purple", "Brown", "Pink", "Gray"
-            ])
-        self.color_combo.currentTextChanged.connect(self._on_color_changed)
-        row2_layout.addWidget(self.color_combo)
-
-        # Filtered trajectory color control
-        filtered_trajectory_color_label = QLabel("Filtered Trajectory Color:")
-        row2_layout.addWidget(filtered_trajectory_color_label)
-
-        self.filtered_trajectory_color_combo = QComboBox()
-        self.filtered_trajectory_color_combo.addItems([
-            "Blue", "Red", "Green", "Orange", "Purple", "Brown", "Pink", "Gray"])
-
-        self.filtered_trajectory_color_combo.currentTextChanged.connect(self._on_color_changed)
-        row2_layout.addWidget(self.filtered_trajectory_color_combo)
-
-        row2_layout.addStretch()
-        controls_layout.addLayout(row2_layout)
-
-        # Third row - Action buttons
-        row3_layout = QHBoxLayout()
-
-        # Reset zoom button
-        reset_zoom_btn = QPushButton("Reset Zoom")
-        reset_zoom_btn.clicked.connect(self.reset_zoom)
-        row3_layout.addWidget(reset_zoom_btn)
-
-        row3_layout.addStretch()
-        controls_layout.addLayout(row3_layout)
-
-        layout.addWidget(controls_group)
-
-        # Store GPS data
-        self.gps_x_data = None
-        self.gps_y_data = None
-
-        # Initialize QSettings for persistence
-        self.settings = QSettings('RCLogViewer', 'GPSXYPlotPanel')
-        self._load_color_settings()
-
-    def _get_color(self, color_name):
-        """
-        Convert color name to matplotlib color string.
-        """
-        color_map = {
-            "Blue": "blue",
-            "Red": "red",
-            "Green": "green",
-            "Orange": "orange",
-            "Purple": "purple",
-            "Brown": "brown",
-            "Pink": "pink",
-            "Gray": "gray"
-        }
-        return color_map.get(color_name, "blue")
-
-    def _get_filtered_trajectory_color(self, color_name):
-        """
-        Convert filtered trajectory color name to matplotlib color string.
-        """
-        color_map = {
-            "Blue": "blue",
-            "Red": "red",
-            "Green": "green",
-            "Orange": "orange",
-            "Purple": "purple",
-            "Brown": "brown",
-            "Pink": "pink",
-            "Gray": "gray"
-        }
-        return color_map.get(color_name, "orange")
-
-    def _save_color_settings(self):
-        """
-        Save color selections to QSettings for persistence.
-        """
-        self.settings.setValue('trajectory_color', self.color_combo.currentText())
-        self.settings.setValue('filtered_trajectory_color',
-                               self.filtered_trajectory_color_combo.currentText())
-
-    def _load_color_settings(self):
-        """
-        Load color selections from QSettings for persistence.
-        """
-        saved_trajectory_color = self.settings.value('trajectory_color')
-        if saved_trajectory_color:
-            index = self.color_combo.findText(saved_trajectory_color)
-            if index >= 0:
-                self.color_combo.setCurrentIndex(index)
-
-        saved_filtered_color = self.settings.value('filtered_trajectory_color')
-        if saved_filtered_color:
-            index = self.filtered_trajectory_color_combo.findText(saved_filtered_color)
-            if index >= 0:
-                self.filtered_trajectory_color_combo.setCurrentIndex(index)
-
-    def _on_color_changed(self):
-        """
-        Handle color combo box changes and update display.
-        """
-        self._save_color_settings()
-        self._update_display()
-
-    def plot_gps_trajectory(self, x_data, y_data, time_data):
-        """
-        Plot GPS trajectory from X and Y coordinate data.
-
-        Args:
-            x_data (array-like): GPS X coordinates
-            y_data (array-like): GPS Y coordinates
-            time_data (array-like): Time data for synchronization
-        """
-        # Store the data
-        self.gps_x_data = np.asarray(x_data, dtype=float)
-        self.gps_y_data = np.asarray(y_data, dtype=float)
-        self.gps_time_data = np.asarray(time_data, dtype=float)
-
-        # Remove any NaN values
-        valid_mask = ~(np.isnan(self.gps_x_data) | np.isnan(self.gps_y_data))
-        self.gps_x_data = self.gps_x_data[valid_mask]
-        self.gps_y_data = self.gps_y_data[valid_mask]
-        self.gps_time_data = self.gps_time_data[valid_mask]
-
-        # Create a time mask for filtering. Initially, it has all values set to True
-        self.time_mask = np.ones_like(self.gps_time_data, dtype=bool)
-
-        if len(self.gps_x_data) == 0 or len(self.gps_y_data) == 0:
-            return
-
-        # Clear previous plot
-        self.clear_plot()
-
-        # Plot the trajectory
-        self._update_display()
-
-        # Auto-scale to show all data
-        self.reset_zoom()
-
-    def _update_display(self):
-        """
-        Update the display based on current settings and filters.
-        """
-        if self.gps_x_data is None or self.gps_y_data is None:
-            return
-
-        # Clear the entire axes and redraw (safer and more consistent)
-        self.ax.clear()
-
-        # Initialize axis settings and title
-        self.ax.set_xlabel('GPS X (m)')
-        self.ax.set_ylabel('GPS Y (m)')
-        self.ax.set_title('GPS Trajectory')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.set_aspect('equal', adjustable='box')
-
-        # Reset line references
-        self.trajectory_line = None
-        self.start_marker = None
-        self.end_marker = None
-
-        # Get current settings
-        color = self._get_color(self.color_combo.currentText())
-
-        filtered_trajectory_color = self._get_filtered_trajectory_color(
-            self.filtered_trajectory_color_combo.currentText())
-
-        line_width = self.line_width_spin.value()
-
-        # Determine if there are any false values in self.time_mask, indicating that a
-        # filter is applied
-        is_filtered = not np.all(self.time_mask)
-
-        if not is_filtered:
-            # Plot the full trajectory
-            self.ax.plot(self.gps_x_data, self.gps_y_data,
-                         color=color, linewidth=line_width,
-                         label='GPS Trajectory')
-
-            # Add start/end markers for full trajectory if enabled
-            if self.show_markers_cb.isChecked():
-                if len(self.gps_x_data) > 0:
-                    self.ax.plot(self.gps_x_data[0], self.gps_y_data[0], 'go',
-                            markersize=8, label='Full Trajectory Start')
-                if len(self.gps_x_data) > 1:
-                    self.ax.plot(self.gps_x_data[-1], self.gps_y_data[-1], 'rs',
-                            markersize=8, label='Full Trajectory End')
-        else:
-            if len(self.gps_x_data) > 0:
-                self.ax.plot(self.gps_x_data, self.gps_y_data,
-                            color=color, linewidth=1, alpha=0.5,
-                            label='Full Trajectory')
-
-                filtered_x = self.gps_x_data[self.time_mask]
-                filtered_y = self.gps_y_data[self.time_mask]
-
-                if len(filtered_x) > 0:
-                    # Get current color setting
-
-                    self.ax.plot(filtered_x, filtered_y,
-                                color=filtered_trajectory_color, linewidth=line_width,
-                                label='Time-Filtered Segment')
-
-                    # Add start/end markers for filtered segment if enabled
-                    if self.show_markers_cb.isChecked():
-                        if len(filtered_x) > 0:
-                            self.ax.plot(filtered_x[0], filtered_y[0], 'go',
-                                    markersize=8, label='Filtered Segment Start')
-                        if len(filtered_x) > 1:
-                            self.ax.plot(filtered_x[-1], filtered_y[-1], 'rs',
-                                    markersize=8, label='Filtered Segment End')
-
-        # Update legend
-        self.ax.legend()
-
-        # Refresh canvas
-        self.canvas.draw()
-
-    def clear_plot(self):
-        """
-        Clear the GPS plot and reset axes.
-        """
-        self.ax.clear()
-        self.ax.set_xlabel('GPS X (m)')
-        self.ax.set_ylabel('GPS Y (m)')
-        self.ax.set_title('GPS Trajectory')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.set_aspect('equal', adjustable='box')
-
-        # Reset line references
-        self.trajectory_line = None
-        self.start_marker = None
-        self.end_marker = None
-
-        self.canvas.draw()
-
-    def reset_zoom(self):
-        """
-        Reset zoom to show all data with automatic scaling.
-        """
-        if self.gps_x_data is not None and self.gps_y_data is not None and len(self.gps_x_data) > 0:
-            # Add some padding around the data
-            x_range = self.gps_x_data.max() - self.gps_x_data.min()
-            y_range = self.gps_y_data.max() - self.gps_y_data.min()
-            padding = max(x_range, y_range) * 0.1
-
-            self.ax.set_xlim(self.gps_x_data.min() - padding, self.gps_x_data.max() + padding)
-            self.ax.set_ylim(self.gps_y_data.min() - padding, self.gps_y_data.max() + padding)
-            self.canvas.draw()
-        else:
-            self.ax.autoscale()
-            self.canvas.draw()
-
-    def has_gps_data(self):
-        """
-        Check if GPS data is available for plotting.
-        """
-        return (self.gps_x_data is not None and self.gps_y_data is not None and
-            len(self.gps_x_data) > 0)
-
-    def sync_x_limits(self, x_min, x_max):
-        """
-        Synchronize x-axis limits with main plot panel and highlight relevant segment.
-
-        Args:
-            x_min (float): Minimum x-axis value (time)
-            x_max (float): Maximum x-axis value (time)
-        """
-        # If we have time data, filter and highlight the relevant GPS trajectory segment
-        if (self.gps_time_data is not None and
-            self.gps_x_data is not None and
-            self.gps_y_data is not None):
-
-            # Find indices within the time range
-            self.time_mask = (self.gps_time_data >= x_min) & (self.gps_time_data <= x_max)
-
-            if np.any(self.time_mask):
-                # Clear and replot with highlighting
-                self._update_display()
-
-    def setEnabled(self, enabled):
-        """
-        Enable or disable the GPS plot panel.
-        """
-        super().setEnabled(enabled)
-        if not enabled:
-            self.clear_plot()
+"""
+Copyright Andrew Fernie, 2025
+
+gps_plot_panel.py
+
+Provides a QWidget-based panel for visualizing GPS XY trajectory data using matplotlib.
+Features include interactive controls, color selection, time filtering, and persistent settings.
+"""
+
+import numpy as np
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                              QPushButton, QCheckBox, QSpinBox, QComboBox,
+                              QGroupBox, QApplication)
+from PySide6.QtCore import QSettings, QTimer
+
+from settings_writer import SettingsWriter
+
+# Display-name to matplotlib color mapping shared by both combo boxes;
+# built once at module level instead of per lookup
+_COLOR_MAP = {
+    "Blue": "blue",
+    "Red": "red",
+    "Green": "green",
+    "Orange": "orange",
+    "Purple": "purple",
+    "Brown": "brown",
+    "Pink": "pink",
+    "Gray": "gray",
+}
+
+
+class GPSXYPlotPanel(QWidget):
+    """
+    QWidget-based panel for displaying GPS XY trajectory data in 3D. The data plotted is in
+    X/Y coordinates that have been generated from GPS latitude and longitude.
+
+    Features:
+        - Interactive controls for trajectory, markers, line width, and colors.
+        - Persistent color settings using QSettings.
+        - If the user has used the zoom feature in the dataseries plot panel to examine a subset
+          of the data, the plot will show the subset in one color and the full dataset in
+          another color. Colors are configurable via the control panel.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initialize the GPSXYPlotPanel widget and its UI components.
+        """
+        super().__init__(parent)
+
+        self.figure = None
+        self.canvas = None
+        self.ax = None
+        self.trajectory_line = None
+        self.filtered_line = None
+        self.start_marker = None
+        self.end_marker = None
+
+        # Trajectory stored as one contiguous (N, 2) float32 array;
+        # gps_x_data/gps_y_data are column views into it. The _all arrays
+        # hold the finite-filtered data before the speed filter, so the
+        # filter can be re-applied when its threshold changes.
+        self._xy = None
+        self._xy_all = None
+        self._time_all = None
+        self.gps_x_data = None
+        self.gps_y_data = None
+        self.gps_time_data = None
+
+        # Time filter as a contiguous [time_lo, time_hi) index range; GPS
+        # time is monotonic so a slice replaces a boolean mask
+        self.time_lo = 0
+        self.time_hi = 0
+
+        # Data extents (xmin, xmax, ymin, ymax) cached at load so
+        # reset_zoom doesn't rescan the full arrays on every call
+        self._data_bounds = None
+
+        # Coalesce bursts of sync_x_limits calls into one update per
+        # event-loop iteration; only the latest range is applied
+        self._sync_pending = False
+        self._pending_range = None
+
+        # Last applied range, so scrubbing back to the same limits (or a
+        # range resolving to the same indices) skips the redraw entirely
+        self._last_range = None
+
+        # Coalesce bursts of color changes into a single settings write so
+        # the UI thread never waits on disk syncs
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(500)
+        self._settings_timer.timeout.connect(self._save_color_settings)
+
+        # Make sure any pending write lands on shutdown
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._save_color_settings)
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """
+        Set up the user interface, including plot canvas, controls, and color selectors.
+        """
+        # Imported here rather than at module top so importing this module
+        # doesn't pay matplotlib's sizable import cost; the backend loads
+        # on first panel construction
+        from matplotlib.backends.backend_qt5agg import (
+            FigureCanvasQTAgg as FigureCanvas,
+            NavigationToolbar2QT as NavigationToolbar)
+        from matplotlib.figure import Figure
+
+        layout = QVBoxLayout(self)
+
+        # Create matplotlib figure and canvas. layout=None pins the figure
+        # to no layout engine so no constrained/tight solver runs on each
+        # draw; this panel manages its axes geometry itself.
+        self.figure = Figure(figsize=(10, 8), dpi=100, facecolor='white',
+                             layout=None)
+        self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot(111)
+
+        # Set up the plot
+        self.ax.set_xlabel('GPS X (m)')
+        self.ax.set_ylabel('GPS Y (m)')
+        self.ax.set_title('GPS Trajectory')
+        self.ax.grid(True, alpha=0.3)
+        # datalim keeps the equal aspect without the per-draw box-geometry
+        # recomputation that adjustable='box' triggers; limits are set
+        # explicitly from the cached data bounds
+        self.ax.set_aspect('equal', adjustable='datalim')
+        self.ax.set_autoscale_on(False)
+
+        self._create_artists()
+
+        # Blitting support: the axes background (grid, ticks, full
+        # trajectory) is cached on every full draw so the filtered segment
+        # can be repainted alone during sync_x_limits
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+
+        layout.addWidget(self.canvas)
+
+        # Add navigation toolbar
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        layout.addWidget(self.toolbar)
+
+        # Control panel
+        controls_group = QGroupBox("GPS Plot Controls")
+        controls_layout = QVBoxLayout(controls_group)
+
+        # First row - Checkboxes only
+        row1_layout = QHBoxLayout()
+
+        # Show trajectory checkbox
+        self.show_trajectory_cb = QCheckBox("Show Trajectory")
+        self.show_trajectory_cb.setChecked(True)
+        self.show_trajectory_cb.stateChanged.connect(self._update_display)
+        row1_layout.addWidget(self.show_trajectory_cb)
+
+        # Show start/end markers checkbox
+        self.show_markers_cb = QCheckBox("Show Start/End Markers")
+        self.show_markers_cb.setChecked(True)
+        self.show_markers_cb.stateChanged.connect(self._update_display)
+        row1_layout.addWidget(self.show_markers_cb)
+
+        row1_layout.addStretch()
+        controls_layout.addLayout(row1_layout)
+
+        # Second row - Line width and color controls
+        row2_layout = QHBoxLayout()
+
+        # Line width control
+        line_width_label = QLabel("Line Width:")
+        row2_layout.addWidget(line_width_label)
+
+        self.line_width_spin = QSpinBox()
+        self.line_width_spin.setMinimum(1)
+        self.line_width_spin.setMaximum(10)
+        self.line_width_spin.setValue(2)
+        self.line_width_spin.valueChanged.connect(self._on_line_width_changed)
+        row2_layout.addWidget(self.line_width_spin)
+
+        # Color control
+        color_label = QLabel("Trajectory Color:")
+        row2_layout.addWidget(color_label)
+
+        self.color_combo = QComboBox()
+        self.color_combo.addItems(list(_COLOR_MAP))
+        self.color_combo.currentTextChanged.connect(self._on_color_changed)
+        row2_layout.addWidget(self.color_combo)
+
+        # Filtered trajectory color control
+        filtered_trajectory_color_label = QLabel("Filtered Trajectory Color:")
+        row2_layout.addWidget(filtered_trajectory_color_label)
+
+        self.filtered_trajectory_color_combo = QComboBox()
+        self.filtered_trajectory_color_combo.addItems(list(_COLOR_MAP))
+
+        self.filtered_trajectory_color_combo.currentTextChanged.connect(self._on_color_changed)
+        row2_layout.addWidget(self.filtered_trajectory_color_combo)
+
+        # Kinematic outlier filter threshold
+        max_speed_label = QLabel("Max Speed (m/s):")
+        row2_layout.addWidget(max_speed_label)
+
+        self.max_speed_spin = QSpinBox()
+        self.max_speed_spin.setRange(0, 1000)
+        self.max_speed_spin.setValue(100)
+        self.max_speed_spin.setSpecialValueText("Off")
+        self.max_speed_spin.setToolTip(
+            "Reject GPS fixes implying a speed above this limit (Off disables)")
+        self.max_speed_spin.valueChanged.connect(self._on_max_speed_changed)
+        row2_layout.addWidget(self.max_speed_spin)
+
+        row2_layout.addStretch()
+        controls_layout.addLayout(row2_layout)
+
+        # Third row - Action buttons
+        row3_layout = QHBoxLayout()
+
+        # Reset zoom button
+        reset_zoom_btn = QPushButton("Reset Zoom")
+        reset_zoom_btn.clicked.connect(self.reset_zoom)
+        row3_layout.addWidget(reset_zoom_btn)
+
+        row3_layout.addStretch()
+        controls_layout.addLayout(row3_layout)
+
+        layout.addWidget(controls_group)
+
+        # Initialize QSettings for persistence
+        self.settings = QSettings('RCLogViewer', 'GPSXYPlotPanel')
+        self._load_color_settings()
+
+        # Resolved style values cached so the high-frequency sync path
+        # doesn't fetch combo text and map colors on every redraw; the
+        # change slots keep them current
+        self._cached_color = self._get_color(self.color_combo.currentText())
+        self._cached_filt_color = self._get_color(
+            self.filtered_trajectory_color_combo.currentText(),
+            default="orange")
+        self._cached_lw = self.line_width_spin.value()
+
+    def _get_color(self, color_name, default="blue"):
+        """
+        Convert a display color name to a matplotlib color string.
+        """
+        return _COLOR_MAP.get(color_name, default)
+
+    def _save_color_settings(self):
+        """
+        Queue the color selections for writing to persistent settings.
+
+        The write happens on the shared settings-writer thread, keeping
+        disk I/O off the interactive path.
+        """
+        writer = SettingsWriter.instance()
+        writer.set_value(self.settings, 'trajectory_color',
+                         self.color_combo.currentText())
+        writer.set_value(self.settings, 'filtered_trajectory_color',
+                         self.filtered_trajectory_color_combo.currentText())
+
+    def _load_color_settings(self):
+        """
+        Load color selections from QSettings for persistence.
+        """
+        # Block signals while restoring so each setCurrentIndex doesn't fire
+        # a change handler (and a wasted replot) during construction
+        restores = [
+            (self.color_combo, self.settings.value('trajectory_color')),
+            (self.filtered_trajectory_color_combo,
+             self.settings.value('filtered_trajectory_color')),
+        ]
+        for combo, saved_value in restores:
+            if saved_value:
+                index = combo.findText(saved_value)
+                if index >= 0:
+                    combo.blockSignals(True)
+                    combo.setCurrentIndex(index)
+                    combo.blockSignals(False)
+
+    def _on_color_changed(self):
+        """
+        Handle color combo box changes and update display.
+        """
+        self._cached_color = self._get_color(self.color_combo.currentText())
+        self._cached_filt_color = self._get_color(
+            self.filtered_trajectory_color_combo.currentText(),
+            default="orange")
+        # Debounced: rapid combo changes produce one settings write
+        self._settings_timer.start()
+        self._update_display()
+
+    def _on_line_width_changed(self, value):
+        """
+        Handle line width spin box changes and update display.
+        """
+        self._cached_lw = value
+        self._update_display()
+
+    def plot_gps_trajectory(self, x_data, y_data, time_data):
+        """
+        Plot GPS trajectory from X and Y coordinate data.
+
+        Args:
+            x_data (array-like): GPS X coordinates
+            y_data (array-like): GPS Y coordinates
+            time_data (array-like): Time data for synchronization
+        """
+        # float32 resolves centimeters over any realistic flying field and
+        # halves the memory traffic of every downstream slice and draw.
+        # Time stays float64 in case epoch timestamps are passed in.
+        x = np.asarray(x_data, dtype=np.float32)
+        y = np.asarray(y_data, dtype=np.float32)
+        t = np.asarray(time_data, dtype=float)
+
+        # Remove invalid values: np.isfinite rejects NaN and inf in one
+        # pass, and the in-place AND avoids a second temporary mask
+        valid_mask = np.isfinite(x)
+        np.logical_and(valid_mask, np.isfinite(y), out=valid_mask)
+
+        # Pack the trajectory into one contiguous (N, 2) array so Agg walks
+        # a single block of memory; x/y stay available as column views.
+        # Logs are usually fully finite, so skip the compaction copies
+        # entirely in that case — on multi-hour logs this removes three
+        # full-array fancy-index passes from the load path.
+        if valid_mask.all():
+            self._xy_all = np.column_stack((x, y))
+            self._time_all = t
+        else:
+            self._xy_all = np.column_stack((x[valid_mask], y[valid_mask]))
+            self._time_all = t[valid_mask]
+
+        # Reject kinematically implausible fixes (isolated GPS spikes)
+        self._apply_speed_filter()
+
+        # Initially the filter range covers the whole trajectory; the last
+        # applied range belongs to the previous dataset
+        self.time_lo = 0
+        self.time_hi = len(self.gps_time_data)
+        self._last_range = None
+
+        self._update_data_bounds()
+        if self._data_bounds is None:
+            return
+
+        # Clear previous plot
+        self.clear_plot()
+
+        # Plot the trajectory
+        self._update_display()
+
+        # Auto-scale to show all data
+        self.reset_zoom()
+
+    def _create_artists(self):
+        """
+        Create the persistent plot artists once. _update_display only
+        mutates their data and style, which avoids re-rasterizing the axes,
+        grid, and labels on every settings change.
+        """
+        self.trajectory_line, = self.ax.plot(
+            [], [], color='blue', linewidth=2, label='GPS Trajectory')
+        self.filtered_line, = self.ax.plot(
+            [], [], color='orange', linewidth=2, label='Time-Filtered Segment')
+        self.start_marker, = self.ax.plot(
+            [], [], 'go', markersize=8, label='Trajectory Start')
+        self.end_marker, = self.ax.plot(
+            [], [], 'rs', markersize=8, label='Trajectory End')
+
+        # The filtered segment is drawn manually over the cached background
+        # during blit updates, so exclude it from regular draws
+        self.filtered_line.set_animated(True)
+
+    def _on_draw(self, event):
+        """
+        Cache the freshly drawn axes background for blitting and paint the
+        animated artists on top of it.
+        """
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in (self.trajectory_line, self.filtered_line):
+            if (artist is not None and artist.get_animated() and
+                    artist.get_visible()):
+                self.ax.draw_artist(artist)
+
+    def _on_resize(self, event):
+        """
+        Invalidate the cached background on resize; the follow-up full draw
+        recaptures it at the new size.
+        """
+        self._background = None
+
+    def _fast_update_filtered(self):
+        """
+        Repaint only the filtered segment over the cached background via
+        blitting, skipping the full grid/ticks/labels redraw.
+        """
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        if self.trajectory_line.get_animated():
+            self.ax.draw_artist(self.trajectory_line)
+        self.ax.draw_artist(self.filtered_line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _set_split_track_data(self, lo, hi):
+        """
+        Set line data for an active [lo, hi) filter so each vertex is
+        stroked only once: the backdrop line skips the highlighted span
+        with a NaN break (the shared endpoints keep it visually connected),
+        and the filtered line carries the span itself.
+        """
+        step = self._display_step(len(self.gps_x_data))
+        gap = np.array([np.nan], dtype=self.gps_x_data.dtype)
+        self.trajectory_line.set_data(
+            np.concatenate((self.gps_x_data[:lo + 1:step], gap,
+                            self.gps_x_data[hi - 1::step])),
+            np.concatenate((self.gps_y_data[:lo + 1:step], gap,
+                            self.gps_y_data[hi - 1::step])))
+
+        fstep = self._display_step(hi - lo)
+        self.filtered_line.set_data(self.gps_x_data[lo:hi:fstep],
+                                    self.gps_y_data[lo:hi:fstep])
+
+    def _apply_speed_filter(self):
+        """
+        Drop GPS fixes whose implied speed from the previous sample exceeds
+        the configured maximum. One bad fix otherwise explodes the plot
+        bounds and forces a manual re-zoom. A threshold of 0 disables the
+        filter.
+        """
+        xy = self._xy_all
+        t = self._time_all
+        v_max = float(self.max_speed_spin.value())
+
+        keep = None
+        if v_max > 0 and len(t) > 1:
+            dt = np.diff(t)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                v = np.hypot(np.diff(xy[:, 0]), np.diff(xy[:, 1])) / dt
+            keep = np.empty(len(t), dtype=bool)
+            keep[0] = True
+            # Points with non-increasing timestamps get infinite implied
+            # speed and are dropped along with the spikes
+            np.less_equal(v, v_max, out=keep[1:])
+            if keep.all():
+                keep = None
+
+        if keep is None:
+            self._xy = xy
+            self.gps_time_data = t
+        else:
+            self._xy = xy[keep]
+            self.gps_time_data = t[keep]
+        self.gps_x_data = self._xy[:, 0]
+        self.gps_y_data = self._xy[:, 1]
+
+    def _update_data_bounds(self):
+        """
+        Cache the data extents; reset_zoom reuses them instead of
+        rescanning the arrays.
+        """
+        if self.gps_x_data is None or len(self.gps_x_data) == 0:
+            self._data_bounds = None
+        else:
+            self._data_bounds = (float(self.gps_x_data.min()),
+                                 float(self.gps_x_data.max()),
+                                 float(self.gps_y_data.min()),
+                                 float(self.gps_y_data.max()))
+
+    def _on_max_speed_changed(self):
+        """
+        Re-apply the speed filter with the new threshold and refresh.
+        """
+        if self._xy_all is None or len(self._xy_all) == 0:
+            return
+        self._apply_speed_filter()
+        self.time_lo = 0
+        self.time_hi = len(self.gps_time_data)
+        self._last_range = None
+        self._update_data_bounds()
+        self._update_display()
+
+    def _display_step(self, n):
+        """
+        Return the decimation stride for a trajectory of n points.
+
+        The canvas is only a few thousand pixels wide, so segments denser
+        than a few per pixel add Agg rasterization cost without changing
+        the drawn result. Full-resolution data is kept for markers and
+        filtering; only the line vertices handed to matplotlib are strided.
+        """
+        target = max(2000, 4 * self.canvas.width())
+        return max(1, n // target)
+
+    def _update_display(self):
+        """
+        Update the display based on current settings and filters.
+        """
+        if self.gps_x_data is None or self.gps_y_data is None:
+            return
+
+        # Current style, maintained by the change slots
+        color = self._cached_color
+        filtered_trajectory_color = self._cached_filt_color
+        line_width = self._cached_lw
+
+        # The filter is active when the index range excludes any points
+        is_filtered = (self.time_lo != 0 or
+                       self.time_hi != len(self.gps_time_data))
+
+        show_markers = self.show_markers_cb.isChecked()
+
+        # Update the persistent artists in place instead of clearing and
+        # re-plotting; very long tracks are decimated to screen density
+        self.trajectory_line.set_color(color)
+        self.trajectory_line.set_visible(True)
+
+        if not is_filtered:
+            step = self._display_step(len(self.gps_x_data))
+            self.trajectory_line.set_data(self.gps_x_data[::step],
+                                          self.gps_y_data[::step])
+            self.trajectory_line.set_linewidth(line_width)
+            self.trajectory_line.set_alpha(1.0)
+            self.trajectory_line.set_label('GPS Trajectory')
+            self.trajectory_line.set_animated(False)
+            self.filtered_line.set_visible(False)
+
+            marker_x, marker_y = self.gps_x_data, self.gps_y_data
+            start_label, end_label = 'Full Trajectory Start', 'Full Trajectory End'
+        else:
+            # The full trajectory is shown narrow and faded around the
+            # highlighted filtered segment. Both lines are redrawn together
+            # during blit updates, so the backdrop is animated too while
+            # the filter is active.
+            self.trajectory_line.set_linewidth(1)
+            self.trajectory_line.set_alpha(0.5)
+            self.trajectory_line.set_label('Full Trajectory')
+            self.trajectory_line.set_animated(True)
+
+            self._set_split_track_data(self.time_lo, self.time_hi)
+
+            filtered_x = self.gps_x_data[self.time_lo:self.time_hi]
+            filtered_y = self.gps_y_data[self.time_lo:self.time_hi]
+            self.filtered_line.set_color(filtered_trajectory_color)
+            self.filtered_line.set_linewidth(line_width)
+            self.filtered_line.set_visible(len(filtered_x) > 0)
+
+            marker_x, marker_y = filtered_x, filtered_y
+            start_label, end_label = 'Filtered Segment Start', 'Filtered Segment End'
+
+        # Start/end markers track whichever trajectory is highlighted
+        if show_markers and len(marker_x) > 0:
+            self.start_marker.set_data([marker_x[0]], [marker_y[0]])
+            self.start_marker.set_label(start_label)
+            self.start_marker.set_visible(True)
+        else:
+            self.start_marker.set_visible(False)
+
+        if show_markers and len(marker_x) > 1:
+            self.end_marker.set_data([marker_x[-1]], [marker_y[-1]])
+            self.end_marker.set_label(end_label)
+            self.end_marker.set_visible(True)
+        else:
+            self.end_marker.set_visible(False)
+
+        # Update legend to cover only the visible artists
+        handles = [artist for artist in (self.trajectory_line, self.filtered_line,
+                                         self.start_marker, self.end_marker)
+                   if artist.get_visible()]
+        self.ax.legend(handles=handles)
+
+        # Refresh canvas when the event loop is next idle
+        self.canvas.draw_idle()
+
+    def clear_plot(self):
+        """
+        Clear the GPS plot and reset axes.
+        """
+        self.ax.clear()
+        self.ax.set_xlabel('GPS X (m)')
+        self.ax.set_ylabel('GPS Y (m)')
+        self.ax.set_title('GPS Trajectory')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.set_aspect('equal', adjustable='datalim')
+        self.ax.set_autoscale_on(False)
+
+        # Recreate the persistent artists removed by ax.clear()
+        self._create_artists()
+
+        self.canvas.draw_idle()
+
+    def reset_zoom(self):
+        """
+        Reset zoom to show all data with automatic scaling.
+        """
+        if self._data_bounds is not None:
+            # Add some padding around the cached data extents
+            x_min, x_max, y_min, y_max = self._data_bounds
+            padding = max(x_max - x_min, y_max - y_min) * 0.1
+
+            self.ax.set_xlim(x_min - padding, x_max + padding)
+            self.ax.set_ylim(y_min - padding, y_max + padding)
+            self.canvas.draw_idle()
+        else:
+            self.ax.autoscale()
+            self.canvas.draw_idle()
+
+    @property
+    def time_mask(self):
+        """
+        Boolean mask equivalent of the [time_lo, time_hi) filter range.
+
+        Materialized lazily for API compatibility; internal code uses the
+        index range directly.
+        """
+        if self.gps_time_data is None:
+            return None
+        mask = np.zeros(len(self.gps_time_data), dtype=bool)
+        mask[self.time_lo:self.time_hi] = True
+        return mask
+
+    def has_gps_data(self):
+        """
+        Check if GPS data is available for plotting.
+        """
+        return (self.gps_x_data is not None and self.gps_y_data is not None and
+            len(self.gps_x_data) > 0)
+
+    def sync_x_limits(self, x_min, x_max):
+        """
+        Synchronize x-axis limits with main plot panel and highlight relevant segment.
+
+        Args:
+            x_min (float): Minimum x-axis value (time)
+            x_max (float): Maximum x-axis value (time)
+        """
+        # An identical range is a no-op (common when the user scrubs back
+        # to the same spot)
+        if (x_min, x_max) == self._last_range:
+            return
+
+        # Store the latest range and schedule one update for the next
+        # event-loop iteration; rapid drag ticks collapse into a single
+        # redraw with the final range
+        self._pending_range = (x_min, x_max)
+        if not self._sync_pending:
+            self._sync_pending = True
+            QTimer.singleShot(0, self._do_sync)
+
+    def _do_sync(self):
+        """
+        Apply the most recently requested time range from sync_x_limits.
+        """
+        self._sync_pending = False
+        if self._pending_range is None:
+            return
+        x_min, x_max = self._pending_range
+
+        # If we have time data, filter and highlight the relevant GPS trajectory segment
+        if (self.gps_time_data is not None and
+            self.gps_x_data is not None and
+            self.gps_y_data is not None):
+
+            # Time is monotonic, so binary search gives the contiguous
+            # index range directly — no boolean mask materialized
+            lo = np.searchsorted(self.gps_time_data, x_min, side='left')
+            hi = np.searchsorted(self.gps_time_data, x_max, side='right')
+            self._last_range = (x_min, x_max)
+
+            # Different limits can resolve to the same sample range; the
+            # display only depends on the indices
+            if (lo, hi) == (self.time_lo, self.time_hi):
+                return
+
+            if hi > lo:
+                self.time_lo = lo
+                self.time_hi = hi
+                is_filtered = (lo != 0 or hi != len(self.gps_time_data))
+                if is_filtered and self.filtered_line.get_visible():
+                    # Only the highlight moved; update both line splits and
+                    # blit them over the cached background
+                    self._set_split_track_data(lo, hi)
+                    self._fast_update_filtered()
+                else:
+                    # Filter state changed (on/off): styles, markers, and
+                    # legend need a full update
+                    self._update_display()
+
+    def setEnabled(self, enabled):
+        """
+        Enable or disable the GPS plot panel.
+        """
+        super().setEnabled(enabled)
+        if not enabled:
+            self.clear_plot()
@@ -1,757 +1,1475 @@
-"""
-Copyright Andrew Fernie, 2025
-
-log_processor.py
-
-Provides classes and functions for loading, parsing, processing, and exporting RC flight log data
-in CSV format, metadata extraction, channel access, and summary statistics.
-"""
-import re
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Any
-import pandas as pd
-import numpy as np
-from pyproj import Proj
-from pymavlink import mavutil
-
-
-class LogData:
-    """
-    Container for raw and processed log data, metadata, and file information.
-    """
-
-    def __init__(self):
-        """
-        Initialize LogData with empty attributes.
-        """
-        self.raw_data: List[Dict[str, Any]] = []
-        self.processed_data: Optional[pd.DataFrame] = None
-        self.channels: List[str] = []
-        self.sample_rate: float = 0.0
-        self.duration: float = 0.0
-        self.metadata: Dict[str, Any] = {}
-        self.file_path: Optional[Path] = None
-
-
-class LogProcessor:
-    """
-    Main class for loading, parsing, processing, and exporting RC flight log data in a CSV file.
-
-    Initialize LogProcessor with no loaded log and supported formats.
-    """
-
-    def __init__(self):
-        self.current_log: Optional[LogData] = None
-        self.supported_formats = ['.csv', '.tlog', '.bin']
-
-    def load_file(self, file_path: str, config: Dict[str, Any], progress_callback=None) -> bool:
-        """
-        Load a log file in CSV format and parse its contents.
-
-        Args:
-            file_path (str): Path to the log file.
-
-        Returns:
-            bool: True if file loaded and parsed successfully, False otherwise.
-        """
-
-        try:
-            path = Path(file_path)
-            if not path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            if path.suffix.lower() not in self.supported_formats:
-                raise ValueError(f"Unsupported file format: {path.suffix}")
-
-            self.current_log = LogData()
-            self.current_log.file_path = path
-            self.file_type = path.suffix.lower()
-
-            # The argument "config" is an object imported from a json file that contains the
-            # configuration for the log processing. It is used to map the CSV columns to their
-            # respective channels.
-
-            # Parse the file based on format
-            if path.suffix.lower() == '.csv':
-                # retrieve the section of config_string related to CSV
-                csv_config = config["csv_file"]
-                success = self._parse_csv_file(
-                    path, csv_config, progress_callback)
-            elif path.suffix.lower() == '.tlog':
-                tlog_config = config["tlog_file"]
-                success = self._parse_tlog_file(
-                    path, tlog_config, progress_callback)
-            elif path.suffix.lower() == '.bin':
-                bin_config = config["bin_file"]
-                success = self._parse_bin_file(
-                    path, bin_config, progress_callback)
-            else:
-                success = False
-
-            if success and self.current_log.processed_data is not None:
-                self._extract_metadata()
-                return True
-
-            return False
-
-        except Exception as e:
-            print(f"Error loading file: {e}")
-            return False
-
-    def _parse_csv_file(self, file_path: Path, config: Dict[str, Any], progress_callback=None) -> bool:
-        """
-        Parse a CSV log file and process its contents. This supports both FrSky Ethos
-        and OpenTX log files, along with limited support for generic CSV files.
-        1. If an Ethos file is selected then related channels are automatically grouped.
-        2. Limited grouping is performed for OpenTX files.
-        3. Generic CSV files may not contain a data series with timestamps. In this case,
-           the application will assume a 1 second interval between samples. This is likely
-           to result in inaccurate timestamps, but at least allows the data to be imported
-           and plotted.
-
-        Args:
-            file_path (Path): Path to the CSV file.
-
-        Returns:
-            bool: True if parsing was successful, False otherwise.
-        """
-
-        try:
-            import_status = ""
-            # Read CSV file
-            percent_complete = 0
-            if progress_callback:
-                progress_callback(percent_complete)
-            df = pd.read_csv(file_path, on_bad_lines='skip')
-
-            percent_complete = 100
-            if progress_callback:
-                progress_callback(percent_complete)
-
-            # Basic validation
-            if df.empty:
-                return False
-
-            # Remove empty columns
-            df = df.dropna(axis=1, how='all')
-
-            # Split GPS column if present
-            if 'GPS' in df.columns:
-                gps_split = df['GPS'].str.split(' ', expand=True)
-                df['GPS.Latitude'] = gps_split[0]
-                df['GPS.Longitude'] = gps_split[1]
-                df = df.drop(columns=['GPS'])
-
-            # Compute X/Y excursions in meters from center GPS point if GPS columns exist
-            if 'GPS.Longitude' in df.columns and 'GPS.Latitude' in df.columns:
-                # Convert to float in case they are strings
-                df['GPS.LongitudeFloat'] = df['GPS.Longitude'].astype(float)
-                df['GPS.LatitudeFloat'] = df['GPS.Latitude'].astype(float)
-                lon0 = df['GPS.LongitudeFloat'].mean()
-                lat0 = df['GPS.LatitudeFloat'].mean()
-                # Use pyproj for accurate projection (WGS84)
-                proj = Proj(proj='aeqd', lat_0=lat0, lon_0=lon0, datum='WGS84')
-                x, y = proj(df['GPS.LongitudeFloat'].values,
-                            df['GPS.LatitudeFloat'].values)
-                df['GPS.X (m)'] = x
-                df['GPS.Y (m)'] = y
-                df = df.drop(
-                    columns=['GPS.LatitudeFloat', 'GPS.LongitudeFloat'])
-                import_status += "Contains GPS data.\n"
-            else:
-                import_status += "No GPS data found.\n"
-
-            # The files from the radio should have Date and Time columns, and this application
-            # will combine them into a DateTime column for more convenient processing. However,
-            # if the file being opened is one that was previously processed and exported from
-            # this application then the DateTime column will already exist, and there is no need
-            # to regenerate it.
-            if not 'DateTime' in df.columns:
-                # There was no DateTime column, so we need to create one. If either Date or
-                # Time is missing, we will generate one. The generated data won't be accurate,
-                # but at least it allows the various data series to be plotted.
-                if 'Time' in df.columns:
-                    # Ensure 'Time' is in HH:MM:SS.f format (with one or more "f" digits). The
-                    # typical problem is that if the file has gone through Excel and HH should
-                    # have been '12' it may have been dropped and we only have MM:SS.f format
-                    # with an implied '12:' at the front. If so, we prepend '12:' to the time.
-                    if not re.match(r'^\d{1,2}:\d{2}:\d{2}\.\d+$', df['Time'].iloc[0]):
-                        print(
-                            "Warning: 'Time' column format is not HH:MM:SS.f. Prepending '12:' "
-                            "to the time values.")
-                        df['Time'] = '12:' + df['Time'].astype(str)
-                else:
-                    # If no Time column, generate one assuming start at 12:00:00 and 1 second
-                    # between each sample
-                    start_time = datetime.strptime("12:00:00.0", "%H:%M:%S.%f")
-                    df['Time'] = [(start_time + pd.Timedelta(seconds=i)
-                                   ).strftime("%H:%M:%S.%f")[:-3] for i in range(len(df))]
-                    print("Warning: 'Time' column not found. Using generated time values starting"
-                          " at 12:00:00.0 with 1 second intervals.")
-                    import_status += "No time data found.\n"
-
-                if not 'Date' in df.columns:
-                    # If only Time is present, use current date
-                    current_date = datetime.now().strftime('%Y-%m-%d')
-                    print(
-                        f"Warning: 'Date' column not found. Using current date: {current_date}")
-                    df['Date'] = current_date
-                    import_status += "No date data found.\n"
-
-                # At this point we should have both Date and Time columns, either from the file
-                # or generated.
-                df['DateTime'] = pd.to_datetime(df['Date'].astype(str) + ' ' +
-                                                df['Time'].astype(str),
-                                                errors='coerce')
-
-                # Calculate ElapsedTime as an offset from the first DateTime
-                if not df['DateTime'].isnull().all():
-                    first_time = df['DateTime'].iloc[0]
-                    df['ElapsedTime'] = (
-                        df['DateTime'] - first_time).dt.total_seconds()
-                else:
-                    df['ElapsedTime'] = None
-
-            # Map the DataFrame columns to their respective channels using the config
-            # df = df.rename(columns=self.config.get("csv_file", {}).get("channel_mapping", {}))
-            df = df.rename(columns=config.get("channel_mapping", {}))
-
-            # Compute LiPo Total (V) if any "LiPo<N> (V)"" columns exist
-            lipo_cols = [col for col in df.columns if re.match(
-                r"POWER.LiPo\d+ \(V\)", col)]
-
-            if lipo_cols:
-                df['POWER.LiPo.Total (V)'] = df[lipo_cols].sum(axis=1)
-                import_status += "Generated 'LiPo.Total (V)' data.\n"
-
-            # Compute Power(W) if VFAS(V) and Current(A) are present
-            if 'POWER.VFAS (V)' in df.columns and 'POWER.Current (A)' in df.columns:
-                df['POWER.Power (W)'] = df['POWER.VFAS (V)'] * \
-                    df['POWER.Current (A)']
-                import_status += "Generated 'Power (W)' data.\n"
-
-            # Sort columns alphabetically
-            df = df[sorted(df.columns)]
-
-            # Store processed data
-            self.current_log.processed_data = df
-            self.current_log.channels = list(df.columns)
-
-            return True
-
-        except Exception as e:
-            print(f"Error parsing CSV file: {e}")
-            return False
-
-    def _parse_tlog_file(self, file_path: Path, config: Dict[str, Any], progress_callback=None) -> bool:
-        """
-        Parse a MAVLink .tlog file and process its contents into a pandas DataFrame.
-
-        Args:
-            file_path (Path): Path to the tlog file.
-            progress_callback (callable, optional): Function to call with percent_complete (0-100).
-
-        Returns:
-            bool: True if parsing was successful, False otherwise.
-        """
-        import_status = ""
-
-        try:
-            # Open the tlog file using pymavlink
-            mlog = mavutil.mavlink_connection(str(file_path))
-            data = []
-
-            # TLOG files are essentially records of MAVLINK messages.
-            # See https://mavlink.io/en/messages/common.html for message definitions.
-            #
-            # They can include time series data as well as one-time parameters, file transfers, etc.
-            # We are concerned primarily with time series data, and even for time series data, the
-            # content of the TLOG file will depend on the specific MAVLink messages being sent and
-            # received. So, we need to define the message types we are interested in, and this is
-            # done in the config file through an object "selected_messages".
-            desired_msg_types = list(config.get("selected_messages", {}).keys())
-
-            # Retrieve the scaling dictionary for unit conversions from the config file. The names
-            # are those found in the pymavlink message fieldunits_by_name attribute.
-            scaling_dict = config.get("scaling", {})
-
-            # Iterate through all messages in the log file
-            while True:
-                msg = mlog.recv_match(type=desired_msg_types, blocking=False)
-                if msg is None:
-                    break
-
-                percent_complete = mlog.percent
-                if progress_callback:
-                    progress_callback(percent_complete)
-
-                msg_datetime = pd.to_datetime(datetime.fromtimestamp(msg._timestamp
-                                                                     ).strftime('%Y-%m-%d %H:%M:%S.%f'))
-
-                msg_dict = msg.to_dict()
-
-                # Get the "group" to which each parameter is assigned, and to be used as the prefix to the DataFrame column.
-                msg_group = config.get("selected_messages", {}).get(
-                    msg.get_type(), {}).get("group", "UNKNOWN")
-
-                # Get the timestamp for this message and make it the first entry in the data_list
-                data_list = {'DateTime': msg_datetime}
-
-                # Check the field "all_channels", which indicates that all channels found in the message
-                # should be imported.
-                all_channels = config.get("selected_messages", {}).get(
-                    msg.get_type(), {}).get("all_channels", 0)
-
-                fieldnames = msg.get_fieldnames()
-                num_fields = len(fieldnames)
-
-                # Find the fields listed in the config file we said we are interested in
-                config_msg_fields = config.get("selected_messages", {}).get(
-                    msg.get_type(), {}).get("channel", {})
-
-                # Get the units for each field (channel) in the message
-                msg_units = msg.fieldunits_by_name
-
-                for i in range(num_fields):
-                    field_name = fieldnames[i]
-
-                    # Don't bother with any field name starting with "time_" - we already have the message
-                    # timestamp.
-                    if (not field_name.startswith("time_") and
-                        (all_channels > 0 or field_name in config_msg_fields)):
-                        field_info = msg_dict.get(field_name, {})
-                        field_units = msg_units.get(field_name, None)
-                        this_config_msg_field = config_msg_fields.get(field_name, {})
-
-                        if this_config_msg_field is not None:
-                            base_name = this_config_msg_field.get("base_name", field_name)
-                        else:
-                            base_name = field_name
-
-                        if field_units is not None:
-                            scaling_info = scaling_dict.get(field_units, None)
-                        else:
-                            scaling_info = None
-
-                        if scaling_info is not None:
-                            field_units_suffix = scaling_info.get("units_suffix", "")
-                        else:
-                            field_units_suffix = ""
-
-                        if field_units_suffix == "":
-                            df_col_name = f"{msg_group}.{base_name}"
-                        else:
-                            df_col_name = f"{msg_group}.{base_name} ({field_units_suffix})"
-
-                        if scaling_info is not None:
-                            scale = scaling_info.get("scale", 1)
-                        else:
-                            scale = 1
-
-                        if field_units is not None and isinstance(field_info, (int, float)):
-                            df_col_value = field_info * scale
-                        else:
-                            df_col_value = field_info
-
-                        data_list.update({df_col_name: df_col_value})
-
-                if len(data_list) > 1:
-                    data.append(data_list)
-
-            if not data:
-                return False
-
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-
-            # Fill in the missing values that result from only getting a subset of data values
-            # in each message.
-            df = df.ffill()
-
-            # Calculate ElapsedTime as an offset from the first DateTime
-            if not df['DateTime'].isnull().all():
-                first_time = df['DateTime'].iloc[0]
-                df['ElapsedTime'] = (
-                    df['DateTime'] - first_time).dt.total_seconds()
-            else:
-                df['ElapsedTime'] = None
-
-            # Compute X/Y excursions in meters from center GPS point if GPS columns exist\
-            # If there is a column in df that starts with 'GPS.Longitude'
-
-            # Find a column in df that starts with 'GPS.Latitude'
-            lat_col = df.columns[df.columns.str.startswith('GPS.Latitude')]
-            lon_col = df.columns[df.columns.str.startswith('GPS.Longitude')]
-
-            if lon_col is not None and lat_col is not None:
-                # Convert to float in case they are strings
-                df['GPS.LongitudeFloat'] = df[lon_col].astype(float)
-                df['GPS.LatitudeFloat'] = df[lat_col].astype(float)
-                lon0 = df['GPS.LongitudeFloat'].mean()
-                lat0 = df['GPS.LatitudeFloat'].mean()
-                # Use pyproj for accurate projection (WGS84)
-                proj = Proj(proj='aeqd', lat_0=lat0, lon_0=lon0, datum='WGS84')
-                x, y = proj(df['GPS.LongitudeFloat'].values,
-                            df['GPS.LatitudeFloat'].values)
-                df['GPS.X (m)'] = x
-                df['GPS.Y (m)'] = y
-                df = df.drop(
-                    columns=['GPS.LatitudeFloat', 'GPS.LongitudeFloat'])
-                import_status += "Contains GPS data.\n"
-            else:
-                import_status += "No GPS data found.\n"
-
-            # Compute Power(W) if SYS.BatteryVoltage(V) and SYS.BatteryCurrent(A) are present
-            if 'SYS.BatteryVoltage (V)' in df.columns and 'SYS.BatteryCurrent (A)' in df.columns:
-                df['SYS.Power (W)'] = df['SYS.BatteryVoltage (V)'] * \
-                    df['SYS.BatteryCurrent (A)']
-                import_status += "Generated 'Power (W)' data.\n"
-
-            # Sort columns alphabetically
-            df = df[sorted(df.columns)]
-
-            # Store processed data
-            self.current_log.processed_data = df
-            self.current_log.channels = list(df.columns)
-            return True
-
-        except Exception as e:
-            print(f"Error parsing tlog file: {e}")
-            return False
-
-    def _parse_bin_file(self, file_path: Path, config: Dict[str, Any], progress_callback=None) -> bool:
-        """
-        Parse an Ardupilot dataflash log (.bin) file and process its contents into a pandas DataFrame.
-
-        Args:
-            file_path (Path): Path to the .bin file.
-            progress_callback (callable, optional): Function to call with percent_complete (0-100).
-
-        Returns:
-            bool: True if parsing was successful, False otherwise.
-        """
-        import_status = ""
-
-        try:
-            # Open the tlog file using pymavlink
-            mlog = mavutil.mavlink_connection(str(file_path))
-            data = []
-
-            # Dataflash log (.bin) files can include time series data as well as one-time
-            # parameters, etc.
-
-            # Message definitions can be found here:
-            # https://ardupilot.org/copter/docs/logmessages.html#logmessages
-            # https://ardupilot.org/plane/docs/logmessages.html#logmessages
-
-            # We are concerned primarily with time series data, and even
-            # for time series data, the content of the bin will depend on how the flight
-            # controller has been configured. So, we need to define the message types we
-            # are interested in, and this is done in the config file through an object
-            # "selected_messages".
-
-            desired_msg_types = list(config.get(
-                "selected_messages", {}).keys())
-
-            # Retrieve the scaling dictionary for unit conversions from the config file. The names
-            # are those found in the pymavlink message fieldunits_by_name attribute.
-            scaling_dict = config.get("scaling", {})
-
-            # Iterate through all messages in the log file
-            while True:
-                msg = mlog.recv_match(type=desired_msg_types, blocking=False)
-                if msg is None:
-                    break
-
-                percent_complete = mlog.percent
-                if progress_callback:
-                    progress_callback(percent_complete)
-
-                # Get the timestamp for this message
-                msg_datetime = pd.to_datetime(datetime.fromtimestamp(msg._timestamp
-                                                                     ).strftime('%Y-%m-%d %H:%M:%S.%f'))
-
-                msg_dict = msg.to_dict()
-
-                # Get the "group" to which each parameter is assigned, and to be used as the prefix to the DataFrame column.
-                msg_group = config.get("selected_messages", {}).get(
-                    msg.get_type(), {}).get("group", "UNKNOWN")
-
-                # Get the timestamp for this message and make it the first entry in the data_list
-                data_list = {'DateTime': msg_datetime}
-
-                # Check the field "all_channels", which indicates that all channels found in the message
-                # should be imported.
-                all_channels = config.get("selected_messages", {}).get(
-                    msg.get_type(), {}).get("all_channels", 0)
-
-                fieldnames = msg.get_fieldnames()
-                num_fields = len(fieldnames)
-
-                # Find the fields listed in the config file we said we are interested in
-                config_msg_fields = config.get("selected_messages", {}).get(
-                    msg.get_type(), {}).get("channel", {})
-
-                # Get the units for each field (channel) in the message
-                msg_units = msg.fmt.units
-
-                for i in range(num_fields):
-                    field_name = fieldnames[i]
-
-                    # Don't bother with any field name starting with "TimeUS" - we already have the message
-                    # timestamp.
-                    if (not field_name.startswith("TimeUS") and
-                        (all_channels > 0 or field_name in config_msg_fields)):
-                        field_info = msg_dict.get(field_name, {})
-                        field_units = msg_units[i]
-                        this_config_msg_field = config_msg_fields.get(field_name, {})
-
-                        if this_config_msg_field is not None:
-                            base_name = this_config_msg_field.get("base_name", field_name)
-                        else:
-                            base_name = field_name
-
-                        if field_units is not None:
-                            scaling_info = scaling_dict.get(field_units, None)
-                        else:
-                            scaling_info = None
-
-                        if scaling_info is not None:
-                            field_units_suffix = scaling_info.get("units_suffix", "")
-                        else:
-                            field_units_suffix = ""
-
-                        if field_units_suffix == "":
-                            df_col_name = f"{msg_group}.{base_name}"
-                        else:
-                            df_col_name = f"{msg_group}.{base_name} ({field_units_suffix})"
-
-                        if scaling_info is not None:
-                            scale = scaling_info.get("scale", 1)
-                        else:
-                            scale = 1
-
-                        if field_units is not None and isinstance(field_info, (int, float)):
-                            df_col_value = field_info * scale
-                        else:
-                            df_col_value = field_info
-
-                        data_list.update({df_col_name: df_col_value})
-
-
-                if len(data_list) > 1:
-                    data.append(data_list)
-
-            if not data:
-                return False
-
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-
-            # Fill in the missing values that result from only getting a subset of data values
-            # in each message.
-            df = df.ffill()
-
-            # Calculate ElapsedTime as an offset from the first DateTime
-            if not df['DateTime'].isnull().all():
-                first_time = df['DateTime'].iloc[0]
-                df['ElapsedTime'] = (
-                    df['DateTime'] - first_time).dt.total_seconds()
-            else:
-                df['ElapsedTime'] = None
-
-            # Find a column in df that starts with 'GPS.Lat' or 'GPS.Lon'
-            lat_col = df.columns[df.columns.str.startswith('GPS.Lat')]
-            lon_col = df.columns[df.columns.str.startswith('GPS.Lon')]
-
-            # Some longitude fields in dataflash logs start with "Lng" rather than "Lon"
-            if lon_col.empty:
-                lon_col = df.columns[df.columns.str.startswith('GPS.Lng')]
-
-            if not lon_col.empty and not lat_col.empty:
-                # Compute X/Y excursions in meters from center GPS point if GPS columns exist
-                # Convert to float in case they are strings
-                df['GPS.LongitudeFloat'] = df[lon_col].astype(float)
-                df['GPS.LatitudeFloat'] = df[lat_col].astype(float)
-                lon0 = df['GPS.LongitudeFloat'].mean()
-                lat0 = df['GPS.LatitudeFloat'].mean()
-
-                # Use pyproj for accurate projection (WGS84)
-                proj = Proj(proj='aeqd', lat_0=lat0, lon_0=lon0, datum='WGS84')
-                x, y = proj(df['GPS.LongitudeFloat'].values,
-                            df['GPS.LatitudeFloat'].values)
-                df['GPS.X (m)'] = x
-                df['GPS.Y (m)'] = y
-                df = df.drop(
-                    columns=['GPS.LatitudeFloat', 'GPS.LongitudeFloat'])
-                import_status += "Contains GPS data.\n"
-            else:
-                import_status += "No GPS data found.\n"
-
-            # Sort columns alphabetically
-            df = df[sorted(df.columns)]
-
-            # Store processed data
-            self.current_log.processed_data = df
-            self.current_log.channels = list(df.columns)
-            return True
-
-        except Exception as e:
-            print(f"Error parsing bin file: {e}")
-            return False
-
-    def _extract_metadata(self):
-        """
-        Extract metadata such as sample rate, duration, and channel info from processed data.
-        """
-
-        if self.current_log is None or self.current_log.processed_data is None:
-            return
-
-        df = self.current_log.processed_data
-
-        # Calculate basic statistics
-        self.current_log.metadata = {
-            'num_samples': len(df),
-            'num_channels': len(df.columns),
-            'channels': list(df.columns),
-            'file_size': self.current_log.file_path.stat().st_size if self.current_log.file_path else 0
-        }
-
-        # Try to find time column and calculate duration/sample rate
-        time_cols = [col for col in df.columns if 'elapsedtime' in col.lower()]
-
-        if time_cols:
-            time_col = time_cols[0]
-            time_data = pd.to_numeric(df[time_col], errors='coerce').dropna()
-
-            if len(time_data) > 1:
-                self.current_log.duration = float(
-                    time_data.iloc[-1] - time_data.iloc[0])
-                time_diff = time_data.diff().dropna()
-                if len(time_diff) > 0:
-                    avg_interval = time_diff.mean()
-                    if avg_interval > 0:
-                        self.current_log.sample_rate = 1.0 / avg_interval
-
-        # Store additional metadata
-        self.current_log.metadata.update({
-            'duration': self.current_log.duration,
-            'sample_rate': self.current_log.sample_rate,
-            'time_column': time_cols[0] if time_cols else None
-        })
-
-    def get_channel_data(self, channel_name: str) -> Optional[pd.Series]:
-        """
-        Get data for a specific channel.
-
-        Args:
-            channel_name (str): Name of the channel.
-
-        Returns:
-            Optional[pd.Series]: Data for the channel, or None if not found.
-        """
-
-        if (self.current_log is None or
-            self.current_log.processed_data is None or
-                channel_name not in self.current_log.processed_data.columns):
-            return None
-
-        return self.current_log.processed_data[channel_name]
-
-    def get_time_data(self) -> Optional[pd.Series]:
-        """
-        Get time data for the current log, either from a time column or generated from sample rate.
-
-        Returns:
-            Optional[pd.Series]: Time data, or None if unavailable.
-        """
-        if self.current_log is None or self.current_log.processed_data is None:
-            return None
-
-        time_col = self.current_log.metadata.get('time_column')
-        if time_col:
-            return pd.to_numeric(self.current_log.processed_data[time_col], errors='coerce')
-
-        # If no time column, create index-based time
-        if self.current_log.sample_rate > 0:
-            return pd.Series(np.arange(len(self.current_log.processed_data))
-                             / self.current_log.sample_rate)
-
-        return None
-
-    def get_summary_stats(self, channel_name: str) -> Optional[Dict[str, float]]:
-        """
-        Get summary statistics (mean, std, min, max, median, count) for a channel.
-
-        Args:
-            channel_name (str): Name of the channel.
-
-        Returns:
-            Optional[Dict[str, float]]: Dictionary of summary statistics, or None if unavailable.
-        """
-
-        data = self.get_channel_data(channel_name)
-        if data is None:
-            return None
-
-        numeric_data = pd.to_numeric(data, errors='coerce').dropna()
-        if len(numeric_data) == 0:
-            return None
-
-        return {
-            'mean': float(numeric_data.mean()),
-            'std': float(numeric_data.std()),
-            'min': float(numeric_data.min()),
-            'max': float(numeric_data.max()),
-            'median': float(numeric_data.median()),
-            'count': len(numeric_data)
-        }
-
-    def export_filtered_data(self, output_path: str, channels: Optional[List[str]] = None,
-                             start_time: Optional[float] = None,
-                             end_time: Optional[float] = None) -> bool:
-        """
-        Export filtered log data to a CSV file, optionally filtering by channels and time range.
-
-        Args:
-            output_path (str): Path to output CSV file.
-            channels (Optional[List[str]]): List of channels to export.
-            start_time (Optional[float]): Start time for filtering.
-            end_time (Optional[float]): End time for filtering.
-
-        Returns:
-            bool: True if export was successful, False otherwise.
-        """
-        if self.current_log is None or self.current_log.processed_data is None:
-            return False
-
-        try:
-            df = self.current_log.processed_data.copy()
-
-            # Filter by time if specified
-            if start_time is not None or end_time is not None:
-                time_data = self.get_time_data()
-                if time_data is not None:
-                    mask = pd.Series(True, index=df.index)
-                    if start_time is not None:
-                        mask &= (time_data >= start_time)
-                    if end_time is not None:
-                        mask &= (time_data <= end_time)
-                    df = df[mask]
-
-            # Filter by channels if specified
-            if channels:
-                available_channels = [
-                    ch for ch in channels if ch in df.columns]
-                if available_channels:
-                    df = df[available_channels]
-
-            # Export to CSV
-            df.to_csv(output_path, index=False)
-            return True
-
-        except Exception as e:
-            print(f"Error exporting data: {e}")
-            return False
+"""
+Copyright Andrew Fernie, 2025
+
+log_processor.py
+
+Provides classes and functions for loading, parsing, processing, and exporting RC flight log data
+in CSV format, metadata extraction, channel access, and summary statistics.
+"""
+import logging
+import re
+import shutil
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import pandas as pd
+import numpy as np
+from pyproj import Transformer
+from pymavlink import mavutil
+
+# The PyArrow CSV engine parses multi-threaded and is markedly faster on
+# wide radio logs, but it is an optional dependency
+try:
+    import pyarrow  # noqa: F401  (presence only; selects the read_csv engine)
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
+# Matches individual LiPo cell-voltage columns, e.g. "POWER.LiPo3 (V)".
+# Anchored and escaped so names like "POWER.LiPo.Total (V)" don't match.
+_LIPO_RE = re.compile(r"^POWER\.LiPo\d+ \(V\)$")
+
+logger = logging.getLogger(__name__)
+
+# Altitude channel names recognized for the GPS 3D plot, in priority order
+_ALTITUDE_COLUMNS = ('GPS alt (m)', 'GPS.alt (m)', 'GPS.Alt (m)',
+                     'GPS_alt (m)', 'Altitude (m)', 'Alt (m)', 'altitude',
+                     'GPS.Altitude', 'GPS Altitude')
+
+# Compiled equivalents of the GPS column heuristics ("latitude" anywhere,
+# ".lat" anywhere, or a "lat" suffix, and likewise for longitude and
+# altitude); one C-level scan per channel replaces the chain of
+# lowercase-and-substring tests
+_LAT_RE = re.compile(r'latitude|\.lat|lat$', re.IGNORECASE)
+_LON_RE = re.compile(r'longitude|\.lon|\.lng|lon$', re.IGNORECASE)
+_ALT_ANY_RE = re.compile(r'gps alt|gps\.alt|altitude|alt$', re.IGNORECASE)
+
+
+def detect_gps_columns(channels) -> Dict[str, Optional[str]]:
+    """
+    Detect GPS latitude/longitude/altitude channels in a channel list.
+
+    Runs once per load (the result is attached to the log), so UI refreshes
+    and KML export don't repeat the lowercased substring matching over
+    every channel.
+
+    Args:
+        channels: Iterable of channel names.
+
+    Returns:
+        Dict[str, Optional[str]]: Channel names under 'lat', 'lon', 'alt'
+        (exact-name match, used by the 3D plot) and 'alt_any' (looser
+        match, used by KML export); None where nothing matched.
+    """
+    cols: Dict[str, Optional[str]] = {'lat': None, 'lon': None,
+                                      'alt': None, 'alt_any': None}
+    for ch in channels:
+        if cols['lat'] is None and _LAT_RE.search(ch):
+            cols['lat'] = ch
+        if cols['lon'] is None and _LON_RE.search(ch):
+            cols['lon'] = ch
+        if cols['alt_any'] is None and _ALT_ANY_RE.search(ch):
+            cols['alt_any'] = ch
+        if cols['lat'] and cols['lon'] and cols['alt_any']:
+            break
+
+    for alt_col in _ALTITUDE_COLUMNS:
+        if alt_col in channels:
+            cols['alt'] = alt_col
+            break
+
+    return cols
+
+
+def _median_partition(arr: np.ndarray) -> float:
+    """
+    Median of a NaN-free array via introselect partition, O(N) vs a sort.
+    """
+    n = arr.size
+    k = n // 2
+    if n & 1:
+        return float(np.partition(arr, k)[k])
+    part = np.partition(arr, [k - 1, k])
+    return 0.5 * (float(part[k - 1]) + float(part[k]))
+
+
+# bottleneck ships hand-tuned C reductions that are several times faster
+# than numpy's on float64; it is optional, and since the stats arrays are
+# NaN-compacted first, the nan-variants and the plain numpy fallbacks
+# compute the same values.
+try:
+    import bottleneck as _bn
+    _stat_mean, _stat_std = _bn.nanmean, _bn.nanstd
+    _stat_min, _stat_max = _bn.nanmin, _bn.nanmax
+    _stat_median = _bn.nanmedian
+except ImportError:
+    _stat_mean, _stat_std = np.mean, np.std
+    _stat_min, _stat_max = np.min, np.max
+    _stat_median = _median_partition
+
+
+class LogData:
+    """
+    Container for raw and processed log data, metadata, and file information.
+    """
+
+    def __init__(self):
+        """
+        Initialize LogData with empty attributes.
+        """
+        self.raw_data: List[Dict[str, Any]] = []
+        self.processed_data: Optional[pd.DataFrame] = None
+        self.sample_rate: float = 0.0
+        self.duration: float = 0.0
+        self.metadata: Dict[str, Any] = {}
+        self.file_path: Optional[Path] = None
+        self.gps_cols: Dict[str, Optional[str]] = {}
+        self._info_text: Optional[str] = None
+
+    @property
+    def channels(self):
+        """
+        Channel names, read directly from the processed frame's columns.
+
+        The columns Index gives O(1) membership tests and avoids keeping a
+        separate list copy in sync with the frame.
+        """
+        if self.processed_data is None:
+            return []
+        return self.processed_data.columns
+
+    @property
+    def info_text(self) -> str:
+        """
+        Status-bar summary of the log, formatted once and cached.
+
+        A new log is a new LogData, so the cache needs no explicit
+        invalidation.
+        """
+        if self._info_text is None:
+            duration = self.metadata.get('duration', 0)
+            self._info_text = (
+                f"Samples: {self.metadata.get('num_samples', 0)} | "
+                f"Channels: {self.metadata.get('num_channels', 0)} | "
+                f"Duration: {duration:.2f}s "
+                f"({duration/60:.0f}:{duration % 60:02.0f})")
+        return self._info_text
+
+
+class LogProcessor:
+    """
+    Main class for loading, parsing, processing, and exporting RC flight log data in a CSV file.
+
+    Initialize LogProcessor with no loaded log and supported formats.
+    """
+
+    # Number of projected tracks kept in the per-file cache
+    _PROJECTION_CACHE_MAX = 8
+
+    def __init__(self):
+        self.current_log: Optional[LogData] = None
+        self.supported_formats = ['.csv', '.tlog', '.bin']
+
+        # Recently projected GPS tracks keyed on file identity, so
+        # re-opening the same log (common while tweaking the config)
+        # skips the projection entirely.
+        self._projection_cache: OrderedDict = OrderedDict()
+
+        # Cleaned numeric arrays per channel for summary statistics,
+        # keyed on (frame identity, channel); cleared on every load.
+        self._stats_cache: Dict[tuple, np.ndarray] = {}
+
+        # Coerced float64 time axis for the current frame, as
+        # (frame identity, ndarray); cleared on every load.
+        self._time_cache: Optional[tuple] = None
+
+    def load_file(self, file_path: str, config: Dict[str, Any], progress_callback=None) -> bool:
+        """
+        Load a log file in CSV format and parse its contents.
+
+        Args:
+            file_path (str): Path to the log file.
+
+        Returns:
+            bool: True if file loaded and parsed successfully, False otherwise.
+        """
+
+        try:
+            path = Path(file_path)
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+            if path.suffix.lower() not in self.supported_formats:
+                raise ValueError(f"Unsupported file format: {path.suffix}")
+
+            self.current_log = LogData()
+            self.current_log.file_path = path
+            self._stats_cache.clear()
+            self._time_cache = None
+            self.file_type = path.suffix.lower()
+
+            # The argument "config" is an object imported from a json file that contains the
+            # configuration for the log processing. It is used to map the CSV columns to their
+            # respective channels.
+
+            # Pick the parser and config section for this format
+            if path.suffix.lower() == '.csv':
+                # retrieve the section of config_string related to CSV
+                file_config = config["csv_file"]
+                parser = self._parse_csv_file
+            elif path.suffix.lower() == '.tlog':
+                file_config = config["tlog_file"]
+                parser = self._parse_tlog_file
+            else:
+                file_config = config["bin_file"]
+                parser = self._parse_bin_file
+
+            # A Parquet sidecar written after the first parse lets re-opens
+            # skip the parse loop entirely. Reading/writing parquet needs
+            # pyarrow, so the cache is inert without it.
+            cache_parquet = (file_config.get("cache_parquet", False)
+                             and _HAVE_PYARROW)
+            cache_path = path.with_suffix(path.suffix + '.parquet')
+
+            if (cache_parquet and cache_path.exists()
+                    and cache_path.stat().st_mtime >= path.stat().st_mtime):
+                try:
+                    self.current_log.processed_data = pd.read_parquet(cache_path)
+                    self._extract_metadata()
+                    return True
+                except Exception:
+                    # Unreadable/stale sidecar; fall through to a full parse
+                    pass
+
+            success = parser(path, file_config, progress_callback)
+
+            if success and self.current_log.processed_data is not None:
+                self._coerce_object_columns(self.current_log.processed_data)
+                if cache_parquet:
+                    try:
+                        self.current_log.processed_data.to_parquet(
+                            cache_path, index=False)
+                    except Exception:
+                        # Caching is best-effort (e.g. read-only log folder)
+                        pass
+                self._extract_metadata()
+                return True
+
+            return False
+
+        except Exception as e:
+            print(f"Error loading file: {e}")
+            return False
+
+    def _parse_csv_file(self, file_path: Path, config: Dict[str, Any], progress_callback=None) -> bool:
+        """
+        Parse a CSV log file and process its contents. This supports both FrSky Ethos
+        and OpenTX log files, along with limited support for generic CSV files.
+        1. If an Ethos file is selected then related channels are automatically grouped.
+        2. Limited grouping is performed for OpenTX files.
+        3. Generic CSV files may not contain a data series with timestamps. In this case,
+           the application will assume a 1 second interval between samples. This is likely
+           to result in inaccurate timestamps, but at least allows the data to be imported
+           and plotted.
+
+        Args:
+            file_path (Path): Path to the CSV file.
+
+        Returns:
+            bool: True if parsing was successful, False otherwise.
+        """
+
+        try:
+            import_status = ""
+            # Read CSV file
+            percent_complete = 0
+            if progress_callback:
+                progress_callback(percent_complete)
+
+            if _HAVE_PYARROW:
+                # Multi-threaded Arrow parse. The engine can't iterate in
+                # chunks, so progress goes 0 -> 100, but the read itself is
+                # several times faster than the chunked C engine.
+                df = pd.read_csv(file_path, on_bad_lines='skip',
+                                 engine='pyarrow')
+            else:
+                # Stream the file in chunks so large logs report real
+                # progress (from the byte offset of the underlying handle)
+                # instead of jumping from 0% to 100% after a single
+                # blocking read
+                total_bytes = file_path.stat().st_size
+                chunks = []
+                with open(file_path, 'rb') as csv_handle:
+                    for chunk in pd.read_csv(csv_handle, on_bad_lines='skip',
+                                             chunksize=200_000):
+                        chunks.append(chunk)
+                        if progress_callback and total_bytes > 0:
+                            progress_callback(
+                                min(100, int(csv_handle.tell() * 100 / total_bytes)))
+
+                if not chunks:
+                    return False
+                df = pd.concat(chunks, ignore_index=True) \
+                    if len(chunks) > 1 else chunks[0]
+
+            percent_complete = 100
+            if progress_callback:
+                progress_callback(percent_complete)
+
+            # Basic validation
+            if df.empty:
+                return False
+
+            # Remove empty columns
+            df = df.dropna(axis=1, how='all')
+
+            # Split GPS column if present
+            if 'GPS' in df.columns:
+                gps_split = df['GPS'].str.split(' ', expand=True)
+                df['GPS.Latitude'] = gps_split[0]
+                df['GPS.Longitude'] = gps_split[1]
+                df = df.drop(columns=['GPS'])
+
+            # Compute X/Y excursions in meters from center GPS point if GPS columns exist
+            if 'GPS.Longitude' in df.columns and 'GPS.Latitude' in df.columns:
+                # Convert to float arrays in case they are strings; no need
+                # to round-trip the converted values through the frame
+                lat_arr = pd.to_numeric(
+                    df['GPS.Latitude'], errors='coerce').to_numpy(
+                    np.float64, copy=False)
+                lon_arr = pd.to_numeric(
+                    df['GPS.Longitude'], errors='coerce').to_numpy(
+                    np.float64, copy=False)
+                x, y = self._project_track(file_path, lat_arr, lon_arr)
+                df['GPS.X (m)'] = x
+                df['GPS.Y (m)'] = y
+                import_status += "Contains GPS data.\n"
+            else:
+                import_status += "No GPS data found.\n"
+
+            # The files from the radio should have Date and Time columns, and this application
+            # will combine them into a DateTime column for more convenient processing. However,
+            # if the file being opened is one that was previously processed and exported from
+            # this application then the DateTime column will already exist, and there is no need
+            # to regenerate it.
+            if not 'DateTime' in df.columns:
+                # There was no DateTime column, so we need to create one. If either Date or
+                # Time is missing, we will generate one. The generated data won't be accurate,
+                # but at least it allows the various data series to be plotted.
+                if 'Time' in df.columns:
+                    # Ensure 'Time' is in HH:MM:SS.f format (with one or more "f" digits). The
+                    # typical problem is that if the file has gone through Excel and HH should
+                    # have been '12' it may have been dropped and we only have MM:SS.f format
+                    # with an implied '12:' at the front. If so, we prepend '12:' to the time.
+                    # str.match checks every row in one vectorized pass (not just row 0), so
+                    # only the malformed rows are fixed up.
+                    bad = ~df['Time'].astype(str).str.match(
+                        r'^\d{1,2}:\d{2}:\d{2}\.\d+$', na=False)
+                    if bad.any():
+                        print(
+                            "Warning: 'Time' column format is not HH:MM:SS.f. Prepending '12:' "
+                            "to the time values.")
+                        df.loc[bad, 'Time'] = '12:' + df.loc[bad, 'Time'].astype(str)
+                else:
+                    # If no Time column, generate one assuming start at 12:00:00 and 1 second
+                    # between each sample. date_range builds the whole
+                    # datetime64 array in one call and strftime formats it
+                    # vectorized, instead of a Timedelta + strftime per row.
+                    generated = pd.date_range('1900-01-01 12:00:00',
+                                              periods=len(df), freq='1s')
+                    df['Time'] = generated.strftime('%H:%M:%S.%f').str[:-3]
+                    print("Warning: 'Time' column not found. Using generated time values starting"
+                          " at 12:00:00.0 with 1 second intervals.")
+                    import_status += "No time data found.\n"
+
+                if not 'Date' in df.columns:
+                    # If only Time is present, use current date
+                    current_date = datetime.now().strftime('%Y-%m-%d')
+                    print(
+                        f"Warning: 'Date' column not found. Using current date: {current_date}")
+                    df['Date'] = current_date
+                    import_status += "No date data found.\n"
+
+                # At this point we should have both Date and Time columns, either from the file
+                # or generated. Supplying format= when the layout matches the
+                # radios' YYYY-MM-DD HH:MM:SS.f form skips per-row format
+                # inference, which otherwise dominates this step.
+                date_col = df['Date'] if df['Date'].dtype == object \
+                    else df['Date'].astype(str)
+                time_col = df['Time'] if df['Time'].dtype == object \
+                    else df['Time'].astype(str)
+                combined = date_col + ' ' + time_col
+                if re.match(r'^\d{4}-\d{2}-\d{2} \d{1,2}:\d{2}:\d{2}\.\d+$',
+                            str(combined.iloc[0])):
+                    df['DateTime'] = pd.to_datetime(
+                        combined, format='%Y-%m-%d %H:%M:%S.%f',
+                        errors='coerce', cache=True)
+                else:
+                    df['DateTime'] = pd.to_datetime(combined, errors='coerce')
+
+                # Calculate ElapsedTime as an offset from the first DateTime
+                if not df['DateTime'].isnull().all():
+                    first_time = df['DateTime'].iloc[0]
+                    df['ElapsedTime'] = (
+                        df['DateTime'] - first_time).dt.total_seconds()
+                else:
+                    df['ElapsedTime'] = None
+
+            # Map the DataFrame columns to their respective channels using the config
+            # df = df.rename(columns=self.config.get("csv_file", {}).get("channel_mapping", {}))
+            df = df.rename(columns=config.get("channel_mapping", {}))
+
+            # Compute LiPo Total (V) if any "LiPo<N> (V)" columns exist
+            lipo_mask = df.columns.str.match(_LIPO_RE.pattern)
+
+            if lipo_mask.any():
+                df['POWER.LiPo.Total (V)'] = df.iloc[
+                    :, lipo_mask.nonzero()[0]].sum(axis=1)
+                import_status += "Generated 'LiPo.Total (V)' data.\n"
+
+            # Compute Power(W) if VFAS(V) and Current(A) are present
+            if 'POWER.VFAS (V)' in df.columns and 'POWER.Current (A)' in df.columns:
+                df['POWER.Power (W)'] = df['POWER.VFAS (V)'] * \
+                    df['POWER.Current (A)']
+                import_status += "Generated 'Power (W)' data.\n"
+
+            # Shrink numeric channels if the config asks for it
+            if config.get("downcast_numeric", False):
+                df = self._downcast_numeric(df)
+
+            # Sort columns alphabetically (in place; avoids the full-frame
+            # copy that fancy-indexing with a sorted list would make)
+            df.sort_index(axis=1, inplace=True)
+
+            # Store processed data
+            self.current_log.processed_data = df
+
+            return True
+
+        except Exception as e:
+            print(f"Error parsing CSV file: {e}")
+            return False
+
+    def _build_msg_plan(self, msg, config: Dict[str, Any], scaling_dict: Dict[str, Any],
+                        time_prefix: str) -> List[tuple]:
+        """
+        Resolve the per-field import plan for one message type.
+
+        The config lookups, unit scaling resolution, and column-name
+        formatting are invariant per message type, so they are done once
+        here instead of for every message in the log. Each plan entry is
+        (field_name, df_col_name, scale), where scale is None for fields
+        without units (values are passed through unscaled).
+
+        Args:
+            msg: A representative message of the type to plan for.
+            config (Dict[str, Any]): The tlog/bin config section.
+            scaling_dict (Dict[str, Any]): Unit-scaling table from the config.
+            time_prefix (str): Field-name prefix marking per-message
+                timestamps to skip (e.g. "time_" or "TimeUS").
+
+        Returns:
+            List[tuple]: Plan entries for the fields to import.
+        """
+        msg_cfg = config.get("selected_messages", {}).get(msg.get_type(), {})
+        msg_group = msg_cfg.get("group", "UNKNOWN")
+        all_channels = msg_cfg.get("all_channels", 0)
+        config_msg_fields = msg_cfg.get("channel", {})
+
+        # MAVLink messages carry units keyed by name; dataflash messages
+        # carry them positionally on the format descriptor
+        units_by_name = getattr(msg, 'fieldunits_by_name', None)
+
+        plan = []
+        for i, field_name in enumerate(msg.get_fieldnames()):
+            # The message timestamp is captured separately
+            if field_name.startswith(time_prefix):
+                continue
+            if not (all_channels > 0 or field_name in config_msg_fields):
+                continue
+
+            if units_by_name is not None:
+                field_units = units_by_name.get(field_name, None)
+            else:
+                field_units = msg.fmt.units[i]
+
+            this_config_msg_field = config_msg_fields.get(field_name, {})
+            if this_config_msg_field is not None:
+                base_name = this_config_msg_field.get("base_name", field_name)
+            else:
+                base_name = field_name
+
+            if field_units is not None:
+                scaling_info = scaling_dict.get(field_units, None)
+            else:
+                scaling_info = None
+
+            if scaling_info is not None:
+                field_units_suffix = scaling_info.get("units_suffix", "")
+                scale = scaling_info.get("scale", 1)
+            else:
+                field_units_suffix = ""
+                scale = 1
+
+            if field_units_suffix == "":
+                df_col_name = f"{msg_group}.{base_name}"
+            else:
+                df_col_name = f"{msg_group}.{base_name} ({field_units_suffix})"
+
+            # Scaling only ever applies to numeric fields, and a field's type
+            # is fixed by the message definition, so resolve the type check
+            # against the representative message here (and drop no-op 1x
+            # scales) to keep per-field branching out of the message loop.
+            if (field_units is None or scale == 1 or
+                    not isinstance(getattr(msg, field_name, None), (int, float))):
+                scale = None
+
+            plan.append((field_name, df_col_name, scale))
+
+        return plan
+
+    @staticmethod
+    def _first_col(df: pd.DataFrame, *prefixes: str) -> Optional[str]:
+        """
+        Return the first column name starting with any of the given prefixes.
+
+        Args:
+            df (pd.DataFrame): Frame whose columns to search.
+            *prefixes (str): Name prefixes to look for, in priority order.
+
+        Returns:
+            Optional[str]: The matching column name, or None if none match.
+        """
+        for prefix in prefixes:
+            for col in df.columns:
+                if col.startswith(prefix):
+                    return col
+        return None
+
+    @staticmethod
+    def _coerce_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert object columns holding numeric text to real numeric dtypes.
+
+        Doing this once at load time means downstream statistics and export
+        paths work on native ndarrays instead of re-coercing per call.
+        Columns whose values don't parse as numbers (dates, times, labels)
+        are left untouched.
+
+        Args:
+            df (pd.DataFrame): Frame to convert in place.
+
+        Returns:
+            pd.DataFrame: The same frame, for chaining.
+        """
+        for col in df.select_dtypes(include=['object', 'str']).columns:
+            converted = pd.to_numeric(df[col], errors='coerce')
+            # Keep the conversion only where no values were lost to it
+            if converted.notna().sum() >= df[col].notna().sum():
+                df[col] = converted
+        return df
+
+    @staticmethod
+    def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast numeric channels to smaller dtypes to reduce memory use.
+
+        RC sensor channels (voltages, angles, stick positions) carry far less
+        precision than float64, so floats are stored as float32 and integers
+        as the smallest safe width. ElapsedTime keeps full float64 precision
+        and datetime columns are untouched.
+
+        Args:
+            df (pd.DataFrame): Frame to downcast in place.
+
+        Returns:
+            pd.DataFrame: The same frame, for chaining.
+        """
+        for col in df.select_dtypes(include='float64').columns:
+            if col == 'ElapsedTime':
+                continue
+            df[col] = pd.to_numeric(df[col], downcast='float')
+        for col in df.select_dtypes(include=['int64', 'uint64']).columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        return df
+
+    def _project_track(self, file_path: Path, lat_arr, lon_arr):
+        """
+        Project a file's GPS track, reusing the cached result on re-open.
+
+        The cache is keyed on (path, mtime, point count) so an unchanged file
+        gets its projection back without touching PROJ, while an edited file
+        or a config change that alters the row count misses cleanly.
+
+        Args:
+            file_path (Path): The log file the track came from.
+            lat_arr: Latitude values in degrees (array-like).
+            lon_arr: Longitude values in degrees (array-like).
+
+        Returns:
+            tuple: (x, y) ndarrays of excursions in meters.
+        """
+        try:
+            key = (str(file_path), file_path.stat().st_mtime_ns, len(lat_arr))
+        except OSError:
+            key = None
+
+        if key is not None:
+            cached = self._projection_cache.get(key)
+            if cached is not None:
+                self._projection_cache.move_to_end(key)
+                return cached
+
+        xy = self._project_latlon_to_xy(lat_arr, lon_arr)
+
+        if key is not None:
+            self._projection_cache[key] = xy
+            while len(self._projection_cache) > self._PROJECTION_CACHE_MAX:
+                self._projection_cache.popitem(last=False)
+
+        return xy
+
+    @staticmethod
+    def _project_latlon_to_xy(lat_arr, lon_arr):
+        """
+        Project latitude/longitude arrays to X/Y meters about their mean point.
+
+        Uses an azimuthal equidistant (WGS84) projection centered on the mean
+        of the track. Transformer.transform takes pyproj's buffer-protocol
+        fast path on contiguous float64 arrays, so the projection is a single
+        vectorized call into PROJ rather than per-point marshaling through a
+        temporary Proj object.
+
+        Args:
+            lat_arr: Latitude values in degrees (array-like).
+            lon_arr: Longitude values in degrees (array-like).
+
+        Returns:
+            tuple: (x, y) ndarrays of excursions in meters.
+        """
+        lat_arr = np.ascontiguousarray(lat_arr, dtype=np.float64)
+        lon_arr = np.ascontiguousarray(lon_arr, dtype=np.float64)
+        lat0 = float(np.nanmean(lat_arr))
+        lon0 = float(np.nanmean(lon_arr))
+        transformer = Transformer.from_crs(
+            "+proj=longlat +datum=WGS84",
+            f"+proj=aeqd +lat_0={lat0} +lon_0={lon0} +datum=WGS84",
+            always_xy=True)
+        return transformer.transform(lon_arr, lat_arr)
+
+    @staticmethod
+    def _timestamps_to_datetime(timestamps: List[float]) -> pd.DatetimeIndex:
+        """
+        Convert raw epoch message timestamps to naive local datetimes in one
+        vectorized pass.
+
+        Matches the local wall-clock values datetime.fromtimestamp() would
+        produce, without the per-message datetime/strftime round-trip.
+
+        Args:
+            timestamps (List[float]): Epoch timestamps in seconds.
+
+        Returns:
+            pd.DatetimeIndex: Naive local-time datetimes.
+        """
+        local_tz = datetime.now().astimezone().tzinfo
+        return pd.to_datetime(np.asarray(timestamps, dtype=np.float64) * 1e9,
+                              unit='ns', utc=True
+                              ).tz_convert(local_tz).tz_localize(None)
+
+    def _parse_tlog_file(self, file_path: Path, config: Dict[str, Any], progress_callback=None) -> bool:
+        """
+        Parse a MAVLink .tlog file and process its contents into a pandas DataFrame.
+
+        Args:
+            file_path (Path): Path to the tlog file.
+            progress_callback (callable, optional): Function to call with percent_complete (0-100).
+
+        Returns:
+            bool: True if parsing was successful, False otherwise.
+        """
+        import_status = ""
+
+        try:
+            # Open the tlog file using pymavlink
+            mlog = mavutil.mavlink_connection(str(file_path))
+            # Column-oriented accumulators: one value list per DataFrame
+            # column, padded with None where a row's message type doesn't
+            # carry that column. Avoids building a throwaway dict per row.
+            cols = {}
+            num_rows = 0
+            timestamps = []
+
+            # TLOG files are essentially records of MAVLINK messages.
+            # See https://mavlink.io/en/messages/common.html for message definitions.
+            #
+            # They can include time series data as well as one-time parameters, file transfers, etc.
+            # We are concerned primarily with time series data, and even for time series data, the
+            # content of the TLOG file will depend on the specific MAVLink messages being sent and
+            # received. So, we need to define the message types we are interested in, and this is
+            # done in the config file through an object "selected_messages".
+            desired_msg_types = frozenset(config.get("selected_messages", {}).keys())
+
+            # Retrieve the scaling dictionary for unit conversions from the config file. The names
+            # are those found in the pymavlink message fieldunits_by_name attribute.
+            scaling_dict = config.get("scaling", {})
+
+            # Per-message-type import plans, resolved lazily on the first
+            # message of each type. All config/units/column-name work is done
+            # once per type rather than once per message.
+            msg_plans = {}
+
+            # Iterate through all messages in the log file. recv_msg() with a
+            # frozenset filter here avoids recv_match()'s per-message timeout
+            # bookkeeping and condition evaluation in the hot loop, and
+            # getattr reads fields directly rather than materializing a full
+            # to_dict() per message.
+            try:
+                while True:
+                    msg = mlog.recv_msg()
+                    if msg is None:
+                        break
+
+                    msg_type = msg.get_type()
+                    if msg_type not in desired_msg_types:
+                        continue
+
+                    percent_complete = mlog.percent
+                    if progress_callback:
+                        progress_callback(percent_complete)
+
+                    plan = msg_plans.get(msg_type)
+                    if plan is None:
+                        plan = self._build_msg_plan(
+                            msg, config, scaling_dict, "time_")
+                        msg_plans[msg_type] = plan
+
+                    if not plan:
+                        continue
+
+                    for field_name, df_col_name, scale in plan:
+                        field_info = getattr(msg, field_name, None)
+                        if scale is not None:
+                            field_info = field_info * scale
+
+                        col = cols.get(df_col_name)
+                        if col is None:
+                            col = []
+                            cols[df_col_name] = col
+                        # Back-fill rows recorded before this column first appeared
+                        if len(col) < num_rows:
+                            col.extend(repeat(None, num_rows - len(col)))
+                        col.append(field_info)
+
+                    # Keep the raw epoch timestamp; the datetime conversion is
+                    # done in one vectorized pass after the loop.
+                    timestamps.append(msg._timestamp)
+                    num_rows += 1
+            finally:
+                # Release the file handle even if parsing blows up part-way
+                mlog.close()
+
+            if num_rows == 0:
+                return False
+
+            # Pad trailing rows so every column has the full length, then
+            # assemble the DataFrame column-by-column (no per-row dicts)
+            for col in cols.values():
+                if len(col) < num_rows:
+                    col.extend(repeat(None, num_rows - len(col)))
+            df = pd.DataFrame(cols)
+            df.insert(0, 'DateTime', self._timestamps_to_datetime(timestamps))
+
+            # Fill in the missing values that result from only getting a subset of data values
+            # in each message. Only touch the columns that actually have
+            # gaps so dense columns aren't rewritten.
+            na_cols = df.columns[df.isna().any().to_numpy()]
+            if len(na_cols):
+                df[na_cols] = df[na_cols].ffill()
+
+            # Calculate ElapsedTime as an offset from the first DateTime
+            if not df['DateTime'].isnull().all():
+                first_time = df['DateTime'].iloc[0]
+                df['ElapsedTime'] = (
+                    df['DateTime'] - first_time).dt.total_seconds()
+            else:
+                df['ElapsedTime'] = None
+
+            # Compute X/Y excursions in meters from center GPS point if GPS columns exist\
+            # If there is a column in df that starts with 'GPS.Longitude'
+
+            # Find a column in df that starts with 'GPS.Latitude'
+            lat_col = self._first_col(df, 'GPS.Latitude')
+            lon_col = self._first_col(df, 'GPS.Longitude')
+
+            if lon_col is not None and lat_col is not None:
+                # Convert to float arrays in case they are strings; no need
+                # to round-trip the converted values through the frame
+                lat_arr = pd.to_numeric(
+                    df[lat_col], errors='coerce').to_numpy(
+                    np.float64, copy=False)
+                lon_arr = pd.to_numeric(
+                    df[lon_col], errors='coerce').to_numpy(
+                    np.float64, copy=False)
+                x, y = self._project_track(file_path, lat_arr, lon_arr)
+                df['GPS.X (m)'] = x
+                df['GPS.Y (m)'] = y
+                import_status += "Contains GPS data.\n"
+            else:
+                import_status += "No GPS data found.\n"
+
+            # Compute Power(W) if SYS.BatteryVoltage(V) and SYS.BatteryCurrent(A) are present
+            if 'SYS.BatteryVoltage (V)' in df.columns and 'SYS.BatteryCurrent (A)' in df.columns:
+                df['SYS.Power (W)'] = df['SYS.BatteryVoltage (V)'] * \
+                    df['SYS.BatteryCurrent (A)']
+                import_status += "Generated 'Power (W)' data.\n"
+
+            # Shrink numeric channels if the config asks for it
+            if config.get("downcast_numeric", False):
+                df = self._downcast_numeric(df)
+
+            # Sort columns alphabetically (in place; avoids the full-frame
+            # copy that fancy-indexing with a sorted list would make)
+            df.sort_index(axis=1, inplace=True)
+
+            # Store processed data
+            self.current_log.processed_data = df
+            return True
+
+        except Exception as e:
+            print(f"Error parsing tlog file: {e}")
+            return False
+
+    def _parse_bin_file(self, file_path: Path, config: Dict[str, Any], progress_callback=None) -> bool:
+        """
+        Parse an Ardupilot dataflash log (.bin) file and process its contents into a pandas DataFrame.
+
+        Args:
+            file_path (Path): Path to the .bin file.
+            progress_callback (callable, optional): Function to call with percent_complete (0-100).
+
+        Returns:
+            bool: True if parsing was successful, False otherwise.
+        """
+        import_status = ""
+
+        try:
+            # Open the tlog file using pymavlink
+            mlog = mavutil.mavlink_connection(str(file_path))
+            # Column-oriented accumulators: one value list per DataFrame
+            # column, padded with None where a row's message type doesn't
+            # carry that column. Avoids building a throwaway dict per row.
+            cols = {}
+            num_rows = 0
+            timestamps = []
+
+            # Dataflash log (.bin) files can include time series data as well as one-time
+            # parameters, etc.
+
+            # Message definitions can be found here:
+            # https://ardupilot.org/copter/docs/logmessages.html#logmessages
+            # https://ardupilot.org/plane/docs/logmessages.html#logmessages
+
+            # We are concerned primarily with time series data, and even
+            # for time series data, the content of the bin will depend on how the flight
+            # controller has been configured. So, we need to define the message types we
+            # are interested in, and this is done in the config file through an object
+            # "selected_messages".
+
+            desired_msg_types = frozenset(config.get(
+                "selected_messages", {}).keys())
+
+            # Retrieve the scaling dictionary for unit conversions from the config file. The names
+            # are those found in the pymavlink message fieldunits_by_name attribute.
+            scaling_dict = config.get("scaling", {})
+
+            # Per-message-type import plans, resolved lazily on the first
+            # message of each type (dataflash units are positional, so the
+            # plan needs a representative message to resolve them).
+            msg_plans = {}
+
+            # Iterate through all messages in the log file. recv_msg() with a
+            # frozenset filter here avoids recv_match()'s per-message timeout
+            # bookkeeping and condition evaluation in the hot loop, and
+            # getattr reads fields directly rather than materializing a full
+            # to_dict() per message.
+            try:
+                while True:
+                    msg = mlog.recv_msg()
+                    if msg is None:
+                        break
+
+                    msg_type = msg.get_type()
+                    if msg_type not in desired_msg_types:
+                        continue
+
+                    percent_complete = mlog.percent
+                    if progress_callback:
+                        progress_callback(percent_complete)
+
+                    plan = msg_plans.get(msg_type)
+                    if plan is None:
+                        plan = self._build_msg_plan(
+                            msg, config, scaling_dict, "TimeUS")
+                        msg_plans[msg_type] = plan
+
+                    if not plan:
+                        continue
+
+                    for field_name, df_col_name, scale in plan:
+                        field_info = getattr(msg, field_name, None)
+                        if scale is not None:
+                            field_info = field_info * scale
+
+                        col = cols.get(df_col_name)
+                        if col is None:
+                            col = []
+                            cols[df_col_name] = col
+                        # Back-fill rows recorded before this column first appeared
+                        if len(col) < num_rows:
+                            col.extend(repeat(None, num_rows - len(col)))
+                        col.append(field_info)
+
+                    # Keep the raw epoch timestamp; the datetime conversion is
+                    # done in one vectorized pass after the loop.
+                    timestamps.append(msg._timestamp)
+                    num_rows += 1
+            finally:
+                # Release the file handle even if parsing blows up part-way
+                mlog.close()
+
+            if num_rows == 0:
+                return False
+
+            # Pad trailing rows so every column has the full length, then
+            # assemble the DataFrame column-by-column (no per-row dicts)
+            for col in cols.values():
+                if len(col) < num_rows:
+                    col.extend(repeat(None, num_rows - len(col)))
+            df = pd.DataFrame(cols)
+            df.insert(0, 'DateTime', self._timestamps_to_datetime(timestamps))
+
+            # Fill in the missing values that result from only getting a subset of data values
+            # in each message. Only touch the columns that actually have
+            # gaps so dense columns aren't rewritten.
+            na_cols = df.columns[df.isna().any().to_numpy()]
+            if len(na_cols):
+                df[na_cols] = df[na_cols].ffill()
+
+            # Calculate ElapsedTime as an offset from the first DateTime
+            if not df['DateTime'].isnull().all():
+                first_time = df['DateTime'].iloc[0]
+                df['ElapsedTime'] = (
+                    df['DateTime'] - first_time).dt.total_seconds()
+            else:
+                df['ElapsedTime'] = None
+
+            # Find a column in df that starts with 'GPS.Lat' or 'GPS.Lon'.
+            # Some longitude fields in dataflash logs start with "Lng"
+            # rather than "Lon".
+            lat_col = self._first_col(df, 'GPS.Lat')
+            lon_col = self._first_col(df, 'GPS.Lon', 'GPS.Lng')
+
+            if lon_col is not None and lat_col is not None:
+                # Compute X/Y excursions in meters from center GPS point if GPS columns exist
+                # Convert to float arrays in case they are strings; no need
+                # to round-trip the converted values through the frame
+                lat_arr = pd.to_numeric(
+                    df[lat_col], errors='coerce').to_numpy(
+                    np.float64, copy=False)
+                lon_arr = pd.to_numeric(
+                    df[lon_col], errors='coerce').to_numpy(
+                    np.float64, copy=False)
+                x, y = self._project_track(file_path, lat_arr, lon_arr)
+                df['GPS.X (m)'] = x
+                df['GPS.Y (m)'] = y
+                import_status += "Contains GPS data.\n"
+            else:
+                import_status += "No GPS data found.\n"
+
+            # Shrink numeric channels if the config asks for it
+            if config.get("downcast_numeric", False):
+                df = self._downcast_numeric(df)
+
+            # Sort columns alphabetically (in place; avoids the full-frame
+            # copy that fancy-indexing with a sorted list would make)
+            df.sort_index(axis=1, inplace=True)
+
+            # Store processed data
+            self.current_log.processed_data = df
+            return True
+
+        except Exception as e:
+            print(f"Error parsing bin file: {e}")
+            return False
+
+    def _extract_metadata(self):
+        """
+        Extract metadata such as sample rate, duration, and channel info from processed data.
+        """
+
+        if self.current_log is None or self.current_log.processed_data is None:
+            return
+
+        df = self.current_log.processed_data
+
+        # Calculate basic statistics
+        self.current_log.metadata = {
+            'num_samples': len(df),
+            'num_channels': len(df.columns),
+            'file_size': self.current_log.file_path.stat().st_size if self.current_log.file_path else 0
+        }
+
+        # Try to find time column and calculate duration/sample rate
+        time_cols = [col for col in df.columns if 'elapsedtime' in col.lower()]
+
+        if time_cols:
+            time_col = time_cols[0]
+            arr = pd.to_numeric(df[time_col], errors='coerce').to_numpy(
+                dtype=np.float64, copy=False)
+            finite = np.isfinite(arr)
+            num_finite = int(finite.sum())
+
+            if num_finite > 1:
+                # First/last finite samples give duration directly, and the
+                # mean sample interval telescopes to duration/(n-1), so no
+                # diff/dropna intermediates are needed
+                first = arr[finite.argmax()]
+                last = arr[len(arr) - 1 - finite[::-1].argmax()]
+                self.current_log.duration = float(last - first)
+                if self.current_log.duration > 0:
+                    self.current_log.sample_rate = (
+                        (num_finite - 1) / self.current_log.duration)
+
+        # Store additional metadata
+        self.current_log.metadata.update({
+            'duration': self.current_log.duration,
+            'sample_rate': self.current_log.sample_rate,
+            'time_column': time_cols[0] if time_cols else None
+        })
+
+        # Detect the GPS columns once per load; the UI and KML export read
+        # the cached result instead of rescanning the channel list
+        self.current_log.gps_cols = detect_gps_columns(df.columns)
+
+    def get_channel_data(self, channel_name: str) -> Optional[pd.Series]:
+        """
+        Get data for a specific channel.
+
+        Args:
+            channel_name (str): Name of the channel.
+
+        Returns:
+            Optional[pd.Series]: Data for the channel, or None if not found.
+        """
+
+        if (self.current_log is None or
+            self.current_log.processed_data is None or
+                channel_name not in self.current_log.processed_data.columns):
+            return None
+
+        return self.current_log.processed_data[channel_name]
+
+    def get_channels(self, channel_names: List[str]):
+        """
+        Get several channels as one 2D array plus the resolved names.
+
+        The requested columns are pulled in a single pandas subset
+        operation, so callers plotting many channels avoid materializing a
+        separate Series per channel; column slices of the returned array
+        are views.
+
+        Args:
+            channel_names (List[str]): Names of the channels.
+
+        Returns:
+            tuple: (ndarray with one column per resolved channel, list of
+            the resolved names). (None, []) if nothing matched.
+        """
+        if self.current_log is None or self.current_log.processed_data is None:
+            return None, []
+
+        df = self.current_log.processed_data
+        available = pd.Index(channel_names).intersection(df.columns,
+                                                         sort=False)
+        if len(available) == 0:
+            return None, []
+
+        return df.loc[:, available].to_numpy(), list(available)
+
+    def _get_time_ndarray(self) -> Optional[np.ndarray]:
+        """
+        Get the time axis as a float64 ndarray, cached per frame.
+
+        The coerced array is memoized against the identity of the processed
+        frame, so successive range queries (repeated exports, plot syncs)
+        skip the coercion pass entirely.
+
+        Returns:
+            Optional[np.ndarray]: Time values in seconds, or None if
+            unavailable.
+        """
+        if self.current_log is None or self.current_log.processed_data is None:
+            return None
+
+        frame_id = id(self.current_log.processed_data)
+        if self._time_cache is not None and self._time_cache[0] == frame_id:
+            return self._time_cache[1]
+
+        time_col = self.current_log.metadata.get('time_column')
+        if time_col:
+            col = self.current_log.processed_data[time_col]
+            # Already-numeric columns (the common case) need no coercion pass
+            if col.dtype.kind in 'fiu':
+                arr = col.to_numpy(dtype=np.float64, copy=False)
+            else:
+                arr = pd.to_numeric(col, errors='coerce').to_numpy(
+                    dtype=np.float64, copy=False)
+        elif self.current_log.sample_rate > 0:
+            # If no time column, create index-based time (multiply by the
+            # reciprocal rather than dividing per element)
+            arr = (np.arange(len(self.current_log.processed_data),
+                             dtype=np.float64)
+                   * (1.0 / self.current_log.sample_rate))
+        else:
+            return None
+
+        self._time_cache = (frame_id, arr)
+        return arr
+
+    def get_time_data(self) -> Optional[pd.Series]:
+        """
+        Get time data for the current log, either from a time column or generated from sample rate.
+
+        Returns:
+            Optional[pd.Series]: Time data, or None if unavailable.
+        """
+        arr = self._get_time_ndarray()
+        if arr is None:
+            return None
+        # Wrapping the cached ndarray copies nothing
+        return pd.Series(arr)
+
+    def get_summary_stats(self, channel_name: str) -> Optional[Dict[str, float]]:
+        """
+        Get summary statistics (mean, std, min, max, median, count) for a channel.
+
+        Args:
+            channel_name (str): Name of the channel.
+
+        Returns:
+            Optional[Dict[str, float]]: Dictionary of summary statistics, or None if unavailable.
+        """
+
+        data = self.get_channel_data(channel_name)
+        if data is None:
+            return None
+
+        # Coerce and NaN-strip once per channel per load; repeated stats
+        # requests (e.g. refreshing the info panel) hit the cached array
+        key = (id(self.current_log.processed_data), channel_name)
+        arr = self._stats_cache.get(key)
+        if arr is None:
+            if pd.api.types.is_numeric_dtype(data):
+                # Already-numeric columns hand back their buffer directly;
+                # only non-numeric data pays for the coercing copy
+                arr = data.to_numpy(dtype=np.float64, copy=False,
+                                    na_value=np.nan)
+            else:
+                arr = pd.to_numeric(data, errors='coerce').to_numpy(
+                    dtype=np.float64, copy=False)
+            # Only pay for the compacting copy when non-finite values are
+            # present; isfinite also strips ±inf so a single bad sample
+            # can't poison the mean and std
+            finite = np.isfinite(arr)
+            if not finite.all():
+                arr = arr[finite]
+            self._stats_cache[key] = arr
+
+        if arr.size == 0:
+            return None
+
+        # Reductions go through the module-level aliases: bottleneck's C
+        # kernels when installed, otherwise numpy (with an introselect
+        # partition standing in for the median's full sort)
+        return {
+            'mean': float(_stat_mean(arr)),
+            'std': float(_stat_std(arr, ddof=1)) if arr.size > 1 else float('nan'),
+            'min': float(_stat_min(arr)),
+            'max': float(_stat_max(arr)),
+            'median': float(_stat_median(arr)),
+            'count': int(arr.size)
+        }
+
+    def get_summary_stats_bulk(self, channels: List[str]
+                               ) -> Dict[str, Dict[str, float]]:
+        """
+        Get summary statistics for several channels in one vectorized pass.
+
+        The requested channels are stacked into a single float64 matrix and
+        the column-wise reductions are computed together, so the per-channel
+        pandas dispatch of repeated get_summary_stats calls is paid once.
+        Channels that are missing or hold no numeric data are omitted.
+
+        Args:
+            channels (List[str]): Names of the channels.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per-channel statistics dictionaries.
+        """
+        if self.current_log is None or self.current_log.processed_data is None:
+            return {}
+
+        df = self.current_log.processed_data
+        kept = []
+        arrays = []
+        for name in channels:
+            if name not in df.columns:
+                continue
+            col = df[name]
+            if col.dtype.kind not in 'fiub':
+                col = pd.to_numeric(col, errors='coerce')
+            arrays.append(col.to_numpy(dtype=np.float64, na_value=np.nan))
+            kept.append(name)
+
+        if not arrays:
+            return {}
+
+        arr = np.column_stack(arrays)
+        counts = np.isfinite(arr).sum(axis=0)
+
+        # All-NaN columns are dropped before the reductions so the nan*
+        # functions don't warn on them
+        good = counts > 0
+        arr = arr[:, good]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            means = np.nanmean(arr, axis=0)
+            stds = np.nanstd(arr, axis=0, ddof=1)
+            mins = np.nanmin(arr, axis=0)
+            maxs = np.nanmax(arr, axis=0)
+            medians = np.nanmedian(arr, axis=0)
+
+        stats = {}
+        for i, name in enumerate(n for n, g in zip(kept, good) if g):
+            stats[name] = {
+                'mean': float(means[i]),
+                'std': float(stds[i]),
+                'min': float(mins[i]),
+                'max': float(maxs[i]),
+                'median': float(medians[i]),
+                'count': int(counts[good][i])
+            }
+        return stats
+
+    @staticmethod
+    def _export_csv_parallel(df: pd.DataFrame, output_path: str,
+                             workers: int) -> bool:
+        """
+        Write a frame as CSV using several formatter threads.
+
+        pandas releases the GIL inside its C CSV formatter, so splitting the
+        frame into row chunks and formatting them concurrently overlaps the
+        work across cores. Each chunk lands in a .partN file (header only on
+        the first) and the parts are concatenated into the final file.
+
+        Args:
+            df (pd.DataFrame): Frame to write.
+            output_path (str): Path to the output CSV file.
+            workers (int): Number of chunks/threads.
+
+        Returns:
+            bool: True (exceptions propagate to the caller).
+        """
+        bounds = np.array_split(np.arange(len(df)), workers)
+        part_paths = [f"{output_path}.part{i}" for i in range(len(bounds))]
+
+        def _write_part(i):
+            df.iloc[bounds[i]].to_csv(part_paths[i], index=False,
+                                      header=(i == 0), lineterminator='\n')
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_write_part, range(len(bounds))))
+
+        with open(output_path, 'wb') as out_handle:
+            for part in part_paths:
+                with open(part, 'rb') as part_handle:
+                    shutil.copyfileobj(part_handle, out_handle)
+                Path(part).unlink()
+        return True
+
+    def export_filtered_data(self, output_path: str, channels: Optional[List[str]] = None,
+                             start_time: Optional[float] = None,
+                             end_time: Optional[float] = None,
+                             parallel_chunks: int = 1) -> bool:
+        """
+        Export filtered log data to a CSV file, optionally filtering by channels and time range.
+
+        Args:
+            output_path (str): Path to output CSV file.
+            channels (Optional[List[str]]): List of channels to export.
+            start_time (Optional[float]): Start time for filtering.
+            end_time (Optional[float]): End time for filtering.
+            parallel_chunks (int): Number of concurrent writer threads for
+                very large frames; 1 writes single-threaded.
+
+        Returns:
+            bool: True if export was successful, False otherwise.
+        """
+        if self.current_log is None or self.current_log.processed_data is None:
+            return False
+
+        try:
+            # Work on views; to_csv only reads, so no defensive copy is
+            # needed and unfiltered exports write the frame as-is
+            df = self.current_log.processed_data
+
+            # Unfiltered exports (the common whole-log case) go straight to
+            # the writer with no filter machinery at all
+            if not channels and start_time is None and end_time is None:
+                return self._write_csv(df, output_path, parallel_chunks)
+
+            # Filter by time if specified
+            if start_time is not None or end_time is not None:
+                t = self._get_time_ndarray()
+                if t is not None:
+                    if t.size > 1 and np.all(t[1:] >= t[:-1]):
+                        # Monotonic time (the usual case): an O(log N)
+                        # searchsorted slice, no mask at all
+                        lo = 0 if start_time is None else int(
+                            np.searchsorted(t, start_time, side='left'))
+                        hi = t.size if end_time is None else int(
+                            np.searchsorted(t, end_time, side='right'))
+                        df = df.iloc[lo:hi]
+                    else:
+                        mask = np.ones(t.shape[0], dtype=bool)
+                        if start_time is not None:
+                            np.logical_and(mask, t >= start_time, out=mask)
+                        if end_time is not None:
+                            np.logical_and(mask, t <= end_time, out=mask)
+                        df = df.iloc[mask]
+
+            # Filter by channels if specified. Index.intersection is a
+            # C-level hash join rather than per-name Python lookups, and
+            # building it from the request keeps the caller's ordering.
+            if channels:
+                available_channels = pd.Index(channels).intersection(
+                    df.columns, sort=False)
+                if len(available_channels):
+                    df = df.loc[:, available_channels]
+
+            return self._write_csv(df, output_path, parallel_chunks)
+
+        except Exception:
+            # logger.exception is a no-op with logging unconfigured and,
+            # unlike print, doesn't serialize on the stdout lock while the
+            # parallel chunk writers are running
+            logger.exception("Error exporting data")
+            return False
+
+    def make_exporter(self, channels: List[str]
+                      ) -> Optional[Callable[[Optional[float], Optional[float], str], bool]]:
+        """
+        Build an exporter specialized to a fixed numeric channel list.
+
+        When the same channels are exported repeatedly over different time
+        windows (e.g. batch range exports), the returned closure binds the
+        channel matrix and time axis once; each call only computes the
+        searchsorted slice and streams the rows through numpy's C-level
+        row formatter instead of pandas' per-row formatting.
+
+        Args:
+            channels (List[str]): Names of the numeric channels to export.
+
+        Returns:
+            Optional[Callable]: export(start_time, end_time, output_path)
+                returning bool, or None if the channels are unavailable,
+                non-numeric, or the time axis is not monotonic.
+        """
+        if self.current_log is None or self.current_log.processed_data is None:
+            return None
+
+        df = self.current_log.processed_data
+        available = pd.Index(channels).intersection(df.columns, sort=False)
+        if len(available) == 0:
+            return None
+
+        sub = df.loc[:, available]
+        if not all(pd.api.types.is_numeric_dtype(d) for d in sub.dtypes):
+            return None
+
+        t = self._get_time_ndarray()
+        if t is None or t.size < 2 or not np.all(t[1:] >= t[:-1]):
+            return None
+
+        arr = sub.to_numpy(dtype=np.float64)
+        header = ','.join(available)
+        fmt = '%.10g'
+
+        def export(start_time: Optional[float], end_time: Optional[float],
+                   output_path: str) -> bool:
+            try:
+                lo = 0 if start_time is None else int(
+                    np.searchsorted(t, start_time, side='left'))
+                hi = t.size if end_time is None else int(
+                    np.searchsorted(t, end_time, side='right'))
+                np.savetxt(output_path, arr[lo:hi], fmt=fmt, delimiter=',',
+                           header=header, comments='')
+                return True
+            except Exception:
+                logger.exception("Error exporting data")
+                return False
+
+        return export
+
+    def _write_csv(self, df: pd.DataFrame, output_path: str,
+                   parallel_chunks: int = 1) -> bool:
+        """
+        Write a frame to a CSV file via the fastest available path.
+
+        Args:
+            df (pd.DataFrame): Frame to write.
+            output_path (str): Path to the output CSV file.
+            parallel_chunks (int): Number of concurrent writer threads.
+
+        Returns:
+            bool: True (exceptions propagate to the caller).
+        """
+        # A MultiIndex forces to_csv onto a dramatically slower row
+        # formatter even with index=False; flatten to a RangeIndex first
+        if isinstance(df.index, pd.MultiIndex):
+            df = df.reset_index(drop=True)
+
+        if parallel_chunks > 1 and len(df) > parallel_chunks:
+            return self._export_csv_parallel(df, output_path,
+                                             parallel_chunks)
+
+        # pyarrow's multi-threaded C++ CSV writer is far faster than
+        # pandas' per-row formatter. It is optional, so any failure here
+        # (missing dependency, unconvertible column) simply falls
+        # through to the pandas path below.
+        if _HAVE_PYARROW:
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pacsv
+                pacsv.write_csv(
+                    pa.Table.from_pandas(df, preserve_index=False),
+                    output_path,
+                    write_options=pacsv.WriteOptions(
+                        include_header=True, batch_size=65536))
+                return True
+            except Exception:
+                pass
+
+        # Export to CSV in chunks through a large write buffer, so the
+        # formatter never materializes the whole output and syscalls
+        # are amortized
+        with open(output_path, 'w', buffering=1 << 20, newline='',
+                  encoding='utf-8') as out_handle:
+            df.to_csv(out_handle, index=False, chunksize=100_000,
+                      lineterminator='\n')
+        return True
@@ -8,30 +8,305 @@ for viewing and analyzing RC log files. It integrates file management, data visu
 plotting, map display, and analysis features using PySide6, matplotlib, and folium.
 """
 
+import io
 import os
+import sys
 import json
+import time
+import hashlib
+import functools
+import importlib
 import tempfile
 import subprocess
+import zipfile
 from typing import List
 
+import numpy as np
+import pandas as pd
+
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QSplitter, QTabWidget, QSizePolicy,
                                QFileDialog, QMessageBox, QProgressBar, QLabel,
-                               QScrollArea, QApplication)
+                               QScrollArea)
 
-from PySide6.QtCore import Qt, QTimer, QThread
+from PySide6.QtCore import Qt, QTimer, QThread, QObject, Signal
 from PySide6.QtGui import QAction, QCloseEvent, QIcon
 
 from file_panel import FilePanel
 from channel_panel import ChannelPanel
 from dataseries_plot_panel import DataSeriesPlotPanel
 from gps_plot_panel import GPSXYPlotPanel
-from gps_3d_plot_panel import GPSXYZ3DPlotPanel
-from gps_map_panel import GPS2DMap
-from analysis_panel import AnalysisPanel
-from data_panel import DataPanel
 from log_processor import LogProcessor
 
+# The GPS 3D, map, analysis, and data panels are imported lazily in
+# _ensure_tab so their heavyweight dependencies (matplotlib 3D, folium,
+# QtWebEngine) don't load until the user first opens the matching tab.
+
+
+# Generated KML files are kept in the system temp dir, keyed by source log
+# path and mtime, so re-viewing the same log skips regeneration
+_KML_CACHE_DIRNAME = 'rclogviewer_kml_cache'
+_KML_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+# Track coordinates are formatted this many points at a time, keeping the
+# per-chunk buffer small while still amortizing the np.savetxt call
+_KML_COORD_CHUNK = 10000
+
+# Static KML document templates, built once at import. %-formatting with a
+# cached format string avoids re-parsing the literals on every export.
+# 6 decimal degrees is ~11 cm of resolution — plenty for RC telemetry, and
+# roughly half the output bytes of emitting full float reprs
+_KML_COORD_FMT = '%.6f,%.6f,%.2f'
+
+_KML_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+  <Document>
+    <name>RC Log GPS Track</name>
+    <description>%s</description>
+    <Style id="trackStyle">
+      <LineStyle>
+        <color>ff0000ff</color>
+        <width>3</width>
+      </LineStyle>
+    </Style>
+    <Style id="startStyle">
+      <IconStyle>
+        <color>ff00ff00</color>
+        <Icon>
+          <href>http://maps.google.com/mapfiles/kml/pushpin/grn-pushpin.png</href>
+        </Icon>
+      </IconStyle>
+    </Style>
+    <Style id="endStyle">
+      <IconStyle>
+        <color>ff0000ff</color>
+        <Icon>
+          <href>http://maps.google.com/mapfiles/kml/pushpin/red-pushpin.png</href>
+        </Icon>
+      </IconStyle>
+    </Style>'''
+
+_KML_POINT_MARKER = '''
+    <Placemark>
+      <name>%s</name>
+      <description>%s</description>
+      <styleUrl>#%s</styleUrl>
+      <Point>
+        <coordinates>''' + _KML_COORD_FMT + '''</coordinates>
+      </Point>
+    </Placemark>'''
+
+_KML_TRACK_OPEN = '''
+    <Placemark>
+      <name>GPS Track</name>
+      <description>%s</description>
+      <styleUrl>#trackStyle</styleUrl>
+      <LineString>
+        <altitudeMode>absolute</altitudeMode>
+        <coordinates>'''
+
+_KML_FOOTER = '''</coordinates>
+      </LineString>
+    </Placemark>
+  </Document>
+</kml>'''
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(path: str, mtime_ns: int) -> dict:
+    """
+    Read and parse a JSON config file, cached against its mtime.
+
+    Repeated window constructions (or tests) with an unchanged config file
+    skip both the read and the JSON parse; a modified file changes
+    mtime_ns and misses the cache. The returned dict is shared, so callers
+    treat it as read-only.
+
+    Args:
+        path (str): Path to the config file.
+        mtime_ns (int): The file's st_mtime_ns, part of the cache key.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    with open(path, "r") as config_file:
+        return json.loads(config_file.read())
+
+
+def _to_float_array(values) -> np.ndarray:
+    """
+    Coerce a column of samples to a float64 array in one pass.
+
+    Unparseable cells become NaN via pd.to_numeric(errors='coerce') rather
+    than raising, replacing the old per-row try/except around float() —
+    exception setup per bad row costs far more than one vectorized coercion.
+
+    Args:
+        values: Array-like of samples (ndarray, Series, or list).
+
+    Returns:
+        np.ndarray: float64 array with NaN where a cell wasn't numeric.
+    """
+    arr = np.asarray(values)
+    if arr.dtype == np.float64:
+        return arr
+    return pd.to_numeric(pd.Series(arr),
+                         errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _dedupe_consecutive(key_arrays, carry_arrays=(), eps=None):
+    """
+    Drop consecutive duplicate samples from a set of coordinate arrays.
+
+    Because each line (or message) in the input log file creates its own line
+    in the dataframe, and each line in the dataframe contains all channels,
+    GPS tracks end up with long runs of repeated points. A sample is kept
+    when any of the key arrays differs from its predecessor; carry arrays
+    (e.g. time) are filtered with the same mask without contributing to it.
+    The compare runs as a handful of vectorized NumPy passes instead of a
+    Python loop over every sample.
+
+    Args:
+        key_arrays: Sequence of array-likes compared against their
+            predecessors to decide which samples to keep.
+        carry_arrays: Sequence of array-likes filtered by the same mask.
+        eps: Optional per-key tolerances. When given, a sample is kept only
+            if some key moves by more than its tolerance, so sensor noise
+            (e.g. sub-meter altitude jitter) no longer defeats the dedup.
+            Exact comparison is used when None.
+
+    Returns:
+        tuple: The deduplicated key arrays followed by the carry arrays.
+    """
+    keys = [np.asarray(a) for a in key_arrays]
+    carries = [np.asarray(a) for a in carry_arrays]
+    n = keys[0].shape[0]
+    if n == 0:
+        return tuple(keys) + tuple(carries)
+
+    mask = np.empty(n, dtype=bool)
+    mask[0] = True
+    if eps is None:
+        np.not_equal(keys[0][1:], keys[0][:-1], out=mask[1:])
+        for k in keys[1:]:
+            np.logical_or(mask[1:], k[1:] != k[:-1], out=mask[1:])
+    else:
+        np.greater(np.abs(np.diff(keys[0])), eps[0], out=mask[1:])
+        for k, e in zip(keys[1:], eps[1:]):
+            np.logical_or(mask[1:], np.abs(np.diff(k)) > e, out=mask[1:])
+
+    return tuple(a[mask] for a in keys) + tuple(c[mask] for c in carries)
+
+
+def _write_kml_chunks(chunks, filename: str) -> None:
+    """
+    Write KML document chunks to a .kml or .kmz file.
+
+    Args:
+        chunks: Iterable of document sections (from _iter_kml_chunks).
+        filename (str): Destination path; a .kmz suffix selects the
+            zip-container format with the document stored as doc.kml.
+    """
+    # Write to a sibling temp file and swap it in with os.replace, so a
+    # failure mid-write can't leave a truncated file where a previous
+    # export (or nothing at all) used to be
+    tmp = filename + '.tmp'
+    try:
+        if filename.lower().endswith('.kmz'):
+            # KMZ is a zip container holding doc.kml; KML text is highly
+            # redundant so deflate typically shrinks it 5-15x. The
+            # compressor consumes the generator chunk by chunk
+            with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=6) as zf:
+                with zf.open('doc.kml', 'w') as raw, \
+                        io.TextIOWrapper(raw, encoding='utf-8') as kml_file:
+                    for chunk in chunks:
+                        kml_file.write(chunk)
+        else:
+            # Stream the KML sections straight to disk through a large
+            # buffer instead of concatenating one megabyte-scale string
+            with open(tmp, 'w', encoding='utf-8',
+                      buffering=1 << 20) as kml_file:
+                for chunk in chunks:
+                    kml_file.write(chunk)
+        os.replace(tmp, filename)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class KmlWriteWorker(QObject):
+    """
+    Serializes and writes a KML/KMZ file on a worker thread.
+
+    Generating and writing a long track can take seconds; running it off
+    the GUI thread keeps the event loop responsive during the export.
+
+    Signals:
+        finished (bool, str): Success flag, and the output path on success
+            or the error text on failure.
+    """
+
+    finished = Signal(bool, str)
+
+    def __init__(self, chunks, filename):
+        super().__init__()
+        self._chunks = chunks
+        self._filename = filename
+
+    def run(self) -> None:
+        """
+        Write the document and emit finished with the result.
+        """
+        try:
+            _write_kml_chunks(self._chunks, self._filename)
+        except Exception as e:
+            self.finished.emit(False, str(e))
+        else:
+            self.finished.emit(True, self._filename)
+
+
+class LoadWorker(QObject):
+    """
+    Parses a log file on a worker thread so the GUI stays responsive.
+
+    Signals:
+        progress (int): Parse progress as a percentage.
+        finished (bool, str): Success flag and the path that was loaded.
+    """
+
+    progress = Signal(int)
+    finished = Signal(bool, str)
+
+    def __init__(self, processor, file_path, config):
+        super().__init__()
+        self._processor = processor
+        self._file_path = file_path
+        self._config = config
+        self._last_progress = -1
+
+    def run(self) -> None:
+        """
+        Run the parse and emit finished with the result.
+        """
+        try:
+            success = self._processor.load_file(
+                self._file_path, self._config, self._emit_progress)
+        except Exception:
+            success = False
+        self.finished.emit(success, self._file_path)
+
+    def _emit_progress(self, percent) -> None:
+        # Parsers report progress far more often than the bar can show;
+        # only whole-percent changes cross the thread boundary
+        p = int(percent)
+        if p != self._last_progress:
+            self._last_progress = p
+            self.progress.emit(p)
+
 
 class MainWindow(QMainWindow):
     """
@@ -47,20 +322,46 @@ class MainWindow(QMainWindow):
         """
 
         super().__init__()
+        # Worker thread for file loading; only one load runs at a time
+        self._load_thread = None
+        self._load_worker = None
+        # Worker thread for KML export; only one export runs at a time
+        self._kml_thread = None
+        self._kml_worker = None
+        # Live worker threads, registered at creation so closeEvent can
+        # shut them down without walking the whole QObject tree
+        self._threads = set()
+
+        # GPS columns detected in the current log, shared by the refresh
+        # helpers; recomputed by _update_ui_state on every load
+        self._gps_alt_column = None
+        self._lat_col = None
+        self._lon_col = None
+        self._has_gps_latlon_data = False
+
         # Set application window icon
         icon_path = os.path.join(os.path.dirname(__file__), '../images/rclogviewer_icon.png')
         self.setWindowIcon(QIcon(icon_path))
         self.processor = LogProcessor()
 
-        # Read the contents of the configuration file "rclogviewer_config.json"
+        # Read the contents of the configuration file "rclogviewer_config.json";
+        # the parse is cached against the file's mtime, and a missing file
+        # yields an empty config instead of a JSON error
         config_file_path = "rclogviewer_config.json"
-        if os.path.exists(config_file_path):
-            with open(config_file_path, "r") as config_file:
-                config_string = config_file.read()
+        try:
+            st = os.stat(config_file_path)
+        except OSError:
+            self.config = {}
         else:
-            config_string = ""
+            self.config = _load_config(config_file_path, st.st_mtime_ns)
 
-        self.config = json.loads(config_string)
+        # Per-extension config sections, resolved once so each load is a
+        # single dict lookup
+        self._config_by_ext = {
+            'csv': self.config.get('csv_file'),
+            'tlog': self.config.get('tlog_file'),
+            'bin': self.config.get('bin_file'),
+        }
 
         self.setWindowTitle("RC Log Viewer - PySide6")
         self.setGeometry(100, 100, 1400, 900)
@@ -123,37 +424,126 @@ class MainWindow(QMainWindow):
 
         # GPS XY plot tab
         self.gps_plot_panel = GPSXYPlotPanel()
-        self.tab_widget.addTab(self.gps_plot_panel, "GPS-XY")
+        self._gps_xy_tab_index = self.tab_widget.addTab(self.gps_plot_panel,
+                                                        "GPS-XY")
+
+        # The GPS 3D, map, analysis, and data panels are expensive to build
+        # (matplotlib 3D axes, QtWebEngine/folium, table models), so each is
+        # created on the first visit to its tab. A bare QWidget holds the
+        # spot until then and the refresh helpers skip absent panels.
 
         # GPS 3D plot tab
-        self.gps_3d_plot_panel = GPSXYZ3DPlotPanel()
-        self.tab_widget.addTab(self.gps_3d_plot_panel, "GPS-XYZ")
+        self.gps_3d_plot_panel = None
+        self._gps_3d_tab_index = self.tab_widget.addTab(QWidget(), "GPS-XYZ")
 
-        # GPS 2D Map tab (using new GPS2DMap widget)
-        self.gps_2d_map_panel = GPS2DMap()
-        self.tab_widget.addTab(self.gps_2d_map_panel, "GPS Map")
+        # GPS 2D Map tab (using GPS2DMap widget)
+        self.gps_2d_map_panel = None
+        self._gps_map_tab_index = self.tab_widget.addTab(QWidget(), "GPS Map")
 
-        # Connect plot panel x-limits changes to GPS panels
+        # Connect plot panel x-limits changes to the eagerly-built GPS
+        # panel; the lazy panels are connected when they are created
         self.plot_panel.x_limits_changed.connect(
             self.gps_plot_panel.sync_x_limits)
-        self.plot_panel.x_limits_changed.connect(
-            self.gps_3d_plot_panel.sync_x_limits)
-        self.plot_panel.x_limits_changed.connect(
-            self.gps_2d_map_panel.sync_x_limits)
 
         # Analysis tab (comprehensive log analysis)
-        self.analysis_panel = AnalysisPanel()
-        self.tab_widget.addTab(self.analysis_panel, "Analysis")
+        self.analysis_panel = None
+        self._analysis_tab_index = self.tab_widget.addTab(QWidget(),
+                                                          "Analysis")
 
         # Data tab (tabular data view)
-        self.data_panel = DataPanel()
-        self.tab_widget.addTab(self.data_panel, "Data View")
+        self.data_panel = None
+        self._data_tab_index = self.tab_widget.addTab(QWidget(), "Data View")
+
+        # Tabs still holding their placeholder, keyed by tab index
+        self._lazy_tabs = {
+            self._gps_3d_tab_index: 'gps_3d_plot_panel',
+            self._gps_map_tab_index: 'gps_2d_map_panel',
+            self._analysis_tab_index: 'analysis_panel',
+            self._data_tab_index: 'data_panel',
+        }
+
+        # Refresh routine per data-dependent tab. A file load refreshes
+        # only the visible tab and marks the rest dirty; switching to a
+        # dirty tab runs its refresh then.
+        self._tab_refreshers = {
+            self._gps_xy_tab_index: self._refresh_gps_xy,
+            self._gps_3d_tab_index: self._refresh_gps_3d,
+            self._gps_map_tab_index: self._refresh_gps_map,
+            self._analysis_tab_index: self._refresh_analysis,
+            self._data_tab_index: self._refresh_data,
+        }
+        self._dirty = set()
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         main_splitter.addWidget(self.tab_widget)
 
         # Set splitter proportions
         main_splitter.setSizes([350, 1050])
 
+    # Module and class names of the lazily-created panels, keyed by the
+    # attribute that holds each panel once it exists
+    _LAZY_PANEL_MODULES = {
+        'gps_3d_plot_panel': ('gps_3d_plot_panel', 'GPSXYZ3DPlotPanel'),
+        'gps_2d_map_panel': ('gps_map_panel', 'GPS2DMap'),
+        'analysis_panel': ('analysis_panel', 'AnalysisPanel'),
+        'data_panel': ('data_panel', 'DataPanel'),
+    }
+
+    def _ensure_tab(self, index: int) -> None:
+        """
+        Create the panel behind a lazily-constructed tab on first visit.
+
+        Swaps the placeholder widget for the real panel, connects its
+        signals, and populates it from the current log.
+
+        Args:
+            index (int): Index of the tab that became current.
+        """
+
+        attr = self._lazy_tabs.get(index)
+        if attr is None or not self.isVisible():
+            # Qt retargets the current tab while others are being disabled
+            # during construction; only a visit to a visible window counts
+            return
+        del self._lazy_tabs[index]
+
+        module_name, class_name = self._LAZY_PANEL_MODULES[attr]
+        panel_cls = getattr(importlib.import_module(module_name), class_name)
+        panel = panel_cls()
+        setattr(self, attr, panel)
+
+        # Swap the placeholder for the real panel without re-entering this
+        # handler through currentChanged
+        label = self.tab_widget.tabText(index)
+        enabled = self.tab_widget.isTabEnabled(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, panel, label)
+        self.tab_widget.setTabEnabled(index, enabled)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+
+        # The GPS panels track the main plot's x-range
+        if attr in ('gps_3d_plot_panel', 'gps_2d_map_panel'):
+            self.plot_panel.x_limits_changed.connect(panel.sync_x_limits)
+
+        # A freshly created panel has never been populated
+        self._dirty.add(index)
+
+    def _on_tab_changed(self, index: int) -> None:
+        """
+        Materialize and refresh the newly current tab if it needs it.
+
+        Args:
+            index (int): Index of the tab that became current.
+        """
+        self._ensure_tab(index)
+        if index in self._dirty:
+            refresh = self._tab_refreshers.get(index)
+            if refresh is not None:
+                self._dirty.discard(index)
+                refresh()
+
     def _setup_menu(self) -> None:
         """
         Set up the application menus and connect actions to their respective handlers.
@@ -161,6 +551,11 @@ class MainWindow(QMainWindow):
 
         menubar = self.menuBar()
 
+        # Only the actions whose shortcuts must work before their menu is
+        # ever opened (Open, Exit) are created eagerly; the rest are built
+        # on the menu's first aboutToShow, trimming startup work and idle
+        # shortcut subscribers
+
         # File menu
         file_menu = menubar.addMenu("&File")
 
@@ -171,22 +566,51 @@ class MainWindow(QMainWindow):
         open_action.triggered.connect(self._open_file)
         file_menu.addAction(open_action)
 
-        file_menu.addSeparator()
+        # Exit action
+        exit_action = QAction("E&xit", self)
+        exit_action.setShortcut("Ctrl+Q")
+        exit_action.setStatusTip("Exit application")
+        exit_action.triggered.connect(self.close)
+        file_menu.addAction(exit_action)
+
+        # The export/KML actions are inserted above Exit on first show
+        self._file_menu = file_menu
+        self._exit_action = exit_action
+        self._file_menu_built = False
+        self.export_kml_action = None
+        self.view_kml_action = None
+        file_menu.aboutToShow.connect(self._populate_file_menu)
+
+        # View menu
+        view_menu = menubar.addMenu("&View")
+        self._view_menu = view_menu
+        self._view_menu_built = False
+        view_menu.aboutToShow.connect(self._populate_view_menu)
+
+        # Help menu
+        help_menu = menubar.addMenu("&Help")
+        self._help_menu = help_menu
+        self._help_menu_built = False
+        help_menu.aboutToShow.connect(self._populate_help_menu)
+
+    def _populate_file_menu(self) -> None:
+        """
+        Build the deferred File menu actions on first show.
+        """
+        if self._file_menu_built:
+            return
+        self._file_menu_built = True
 
         # Export action
         export_action = QAction("&Export Data...", self)
         export_action.setShortcut("Ctrl+E")
         export_action.setStatusTip("Export filtered data")
         export_action.triggered.connect(self._export_data)
-        file_menu.addAction(export_action)
 
         # Export as KML action
         self.export_kml_action = QAction("Export as K&ML file...", self)
         self.export_kml_action.setStatusTip("Export GPS data to KML file")
         self.export_kml_action.triggered.connect(self._export_as_kml)
-        # Disabled until GPS data is available
-        self.export_kml_action.setEnabled(False)
-        file_menu.addAction(self.export_kml_action)
 
         # View as KML action
         self.view_kml_action = QAction("View as &KML", self)
@@ -194,44 +618,54 @@ class MainWindow(QMainWindow):
         self.view_kml_action.setStatusTip(
             "Export GPS data to KML and open with default application")
         self.view_kml_action.triggered.connect(self._view_as_kml)
-        # Disabled until GPS data is available
-        self.view_kml_action.setEnabled(False)
-        file_menu.addAction(self.view_kml_action)
 
-        file_menu.addSeparator()
+        # Enabled only while GPS lat/lon data is loaded
+        self.export_kml_action.setEnabled(self._has_gps_latlon_data)
+        self.view_kml_action.setEnabled(self._has_gps_latlon_data)
 
-        # Exit action
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.setStatusTip("Exit application")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        # Insert above the eagerly-created Exit action, separators around
+        self._file_menu.insertSeparator(self._exit_action)
+        self._file_menu.insertAction(self._exit_action, export_action)
+        self._file_menu.insertAction(self._exit_action,
+                                     self.export_kml_action)
+        self._file_menu.insertAction(self._exit_action, self.view_kml_action)
+        self._file_menu.insertSeparator(self._exit_action)
 
-        # View menu
-        view_menu = menubar.addMenu("&View")
+    def _populate_view_menu(self) -> None:
+        """
+        Build the deferred View menu actions on first show.
+        """
+        if self._view_menu_built:
+            return
+        self._view_menu_built = True
 
         # Reset zoom action
         reset_zoom_action = QAction("&Reset Zoom", self)
         reset_zoom_action.setShortcut("Ctrl+R")
         reset_zoom_action.setStatusTip("Reset plot zoom")
         reset_zoom_action.triggered.connect(self.plot_panel.reset_zoom)
-        view_menu.addAction(reset_zoom_action)
+        self._view_menu.addAction(reset_zoom_action)
 
         # Clear plots action
         clear_plots_action = QAction("&Clear Plots", self)
         clear_plots_action.setShortcut("Ctrl+Shift+C")
         clear_plots_action.setStatusTip("Clear all plots")
         clear_plots_action.triggered.connect(self._clear_all_plots)
-        view_menu.addAction(clear_plots_action)
+        self._view_menu.addAction(clear_plots_action)
 
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
+    def _populate_help_menu(self) -> None:
+        """
+        Build the deferred Help menu actions on first show.
+        """
+        if self._help_menu_built:
+            return
+        self._help_menu_built = True
 
         # About action
         about_action = QAction("&About", self)
         about_action.setStatusTip("About this application")
         about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        self._help_menu.addAction(about_action)
 
     def _setup_status_bar(self) -> None:
         """
@@ -272,176 +706,186 @@ class MainWindow(QMainWindow):
         file.
         """
 
-        has_data = (self.processor.current_log is not None and
-                    self.processor.current_log.processed_data is not None)
-
-        # Update panels
-        self.channel_panel.setEnabled(has_data)
-        self.plot_panel.setEnabled(has_data)
-
-        # Check for GPS data availability
-        has_gps_data = (has_data and
-                        'GPS.X (m)' in self.processor.current_log.channels and
-                        'GPS.Y (m)' in self.processor.current_log.channels)
-        self.tab_widget.setTabEnabled(
-            self.tab_widget.indexOf(self.gps_plot_panel), has_gps_data)
-
-        # Check for GPS 3D data availability (XY + altitude)
-        # Look for various altitude column names
-        altitude_columns = ['GPS alt (m)', 'GPS.alt (m)', 'GPS.Alt (m)', 'GPS_alt (m)',
-                            'Altitude (m)', 'Alt (m)', 'altitude', 'GPS.Altitude',
-                            'GPS Altitude']
-        gps_alt_column = None
-        if has_gps_data:
-            for alt_col in altitude_columns:
-                if alt_col in self.processor.current_log.channels:
-                    gps_alt_column = alt_col
-                    break
-
-        has_gps_3d_data = has_gps_data and gps_alt_column is not None
-        self.tab_widget.setTabEnabled(self.tab_widget.indexOf(
-            self.gps_3d_plot_panel), has_gps_3d_data)
-
-        # Check for GPS lat/lon data for 2D map
-        has_gps_latlon_data = False
-        lat_col = None
-        lon_col = None
-        if has_data:
-            for ch in self.processor.current_log.channels:
-                cl = ch.lower()
-                if lat_col is None and ("latitude" in cl or cl.endswith("lat") or ".lat" in cl):
-                    lat_col = ch
-                if lon_col is None and ("longitude" in cl or cl.endswith("lon") or ".lon" in cl or ".lng" in cl):
-                    lon_col = ch
-
-            has_gps_latlon_data = lat_col is not None and lon_col is not None
-
-        self.tab_widget.setTabEnabled(self.tab_widget.indexOf(self.gps_2d_map_panel),
-                                      has_gps_latlon_data)
-
-        # Enable/disable KML export based on GPS lat/lon data availability
-        self.view_kml_action.setEnabled(has_gps_latlon_data)
-        self.export_kml_action.setEnabled(has_gps_latlon_data)
-
-        # Enable/disable plotting, analysis, and data panels based on data availability
-        self.tab_widget.setTabEnabled(
-            self.tab_widget.indexOf(self.plot_panel), has_data)
-        self.tab_widget.setTabEnabled(
-            self.tab_widget.indexOf(self.analysis_panel), has_data)
-        self.tab_widget.setTabEnabled(
-            self.tab_widget.indexOf(self.data_panel), has_data)
-
-        if has_data:
-            # Update channel list
-            channels = self.processor.current_log.channels
-            self.channel_panel.update_channels(channels, self.filetype_config)
-
-            # Update analysis panel
-            self.analysis_panel.update_analysis(self.processor.current_log)
+        # Batch the refresh into one composite repaint: the tab enable
+        # flips, label updates, and panel clears below would each trigger
+        # an incremental repaint and style recompute otherwise. Tab signals
+        # are blocked so Qt's current-tab retargeting during the enable/
+        # disable churn can't re-enter _on_tab_changed mid-refresh; the
+        # explicit call in the finally block covers whichever tab ends up
+        # current.
+        self.setUpdatesEnabled(False)
+        self.tab_widget.blockSignals(True)
+        try:
+            has_data = (self.processor.current_log is not None and
+                        self.processor.current_log.processed_data is not None)
 
-            # Update data panel
-            self.data_panel.update_data(self.processor.current_log)
+            # Update panels
+            self.channel_panel.setEnabled(has_data)
+            self.plot_panel.setEnabled(has_data)
 
-            # Update GPS plot if GPS data is available
+            # Check for GPS data availability
+            has_gps_data = (has_data and
+                            'GPS.X (m)' in self.processor.current_log.channels and
+                            'GPS.Y (m)' in self.processor.current_log.channels)
             self.tab_widget.setTabEnabled(
-                self.tab_widget.indexOf(self.gps_plot_panel), False)
-            self.gps_plot_panel.clear_plot()
+                self.tab_widget.indexOf(self.gps_plot_panel), has_gps_data)
+
+            # Check for GPS 3D data availability (XY + altitude). The column
+            # scan was done once at load time; read the cached result.
+            gps_alt_column = None
             if has_gps_data:
-                x_data_full = self.processor.get_channel_data('GPS.X (m)')
-                y_data_full = self.processor.get_channel_data('GPS.Y (m)')
-                time_data_full = self.processor.get_time_data()
-
-                # Because each line (or message) in the input log file creates its own line in
-                # the dataframe, and each line in the dataframe contains all channels, we can
-                # end up with many duplicate points. So, create new arrays that only contain
-                # values that are different from the previous values.
-                x_data = []
-                y_data = []
-                time_data = []
-                for i in range(len(x_data_full)):
-                    if i == 0 or (x_data_full[i] != x_data_full[i - 1] or y_data_full[i] != y_data_full[i - 1]):
-                        x_data.append(x_data_full[i])
-                        y_data.append(y_data_full[i])
-                        time_data.append(time_data_full[i])
-
-                if x_data is not None and y_data is not None:
-                    self.gps_plot_panel.plot_gps_trajectory(
-                        x_data, y_data, time_data)
-                    self.tab_widget.setTabEnabled(
-                        self.tab_widget.indexOf(self.gps_plot_panel), True)
-
-            # Update GPS 2D Map if lat/lon data is available
+                gps_alt_column = self.processor.current_log.gps_cols.get('alt')
+
+            has_gps_3d_data = has_gps_data and gps_alt_column is not None
+            self._gps_alt_column = gps_alt_column
+            self.tab_widget.setTabEnabled(self._gps_3d_tab_index,
+                                          has_gps_3d_data)
+
+            # Check for GPS lat/lon data for 2D map
+            has_gps_latlon_data = False
+            lat_col = None
+            lon_col = None
+            if has_data:
+                gps_cols = self.processor.current_log.gps_cols
+                lat_col = gps_cols.get('lat')
+                lon_col = gps_cols.get('lon')
+                has_gps_latlon_data = lat_col is not None and lon_col is not None
+
+            self._lat_col = lat_col
+            self._lon_col = lon_col
+            self.tab_widget.setTabEnabled(self._gps_map_tab_index,
+                                          has_gps_latlon_data)
+
+            # Enable/disable KML export based on GPS lat/lon data
+            # availability; the actions may not exist yet (lazy menu)
+            self._has_gps_latlon_data = has_gps_latlon_data
+            if self.view_kml_action is not None:
+                self.view_kml_action.setEnabled(has_gps_latlon_data)
+                self.export_kml_action.setEnabled(has_gps_latlon_data)
+
+            # Enable/disable plotting, analysis, and data panels based on data availability
             self.tab_widget.setTabEnabled(
-                self.tab_widget.indexOf(self.gps_2d_map_panel), False)
-            self.gps_2d_map_panel.clear()
-            if has_gps_latlon_data and lat_col and lon_col:
-                latitudes_full = self.processor.get_channel_data(lat_col)
-                longitudes_full = self.processor.get_channel_data(lon_col)
-                time_data_full = self.processor.get_time_data()
-
-                # Remove duplicate (repeated) points
-                latitudes = []
-                longitudes = []
-                time_data = []
-                for i in range(len(latitudes_full)):
-                    if i == 0 or (latitudes_full[i] != latitudes_full[i - 1] or
-                                  longitudes_full[i] != longitudes_full[i - 1]):
-                        latitudes.append(latitudes_full[i])
-                        longitudes.append(longitudes_full[i])
-                        time_data.append(time_data_full[i])
-
-                if latitudes is not None and longitudes is not None:
-                    self.gps_2d_map_panel.render_gps_path(
-                        latitudes, longitudes, time_data)
-                    self.tab_widget.setTabEnabled(
-                        self.tab_widget.indexOf(self.gps_2d_map_panel), True)
-
-            # Update GPS 3D plot if GPS 3D data is available
-            self.tab_widget.setTabEnabled(
-                self.tab_widget.indexOf(self.gps_3d_plot_panel), False)
-            self.gps_3d_plot_panel.clear_plot()
-            if has_gps_3d_data:
-                x_data_full = self.processor.get_channel_data('GPS.X (m)')
-                y_data_full = self.processor.get_channel_data('GPS.Y (m)')
-                z_data_full = self.processor.get_channel_data(gps_alt_column)
-                time_data_full = self.processor.get_time_data()
-
-                # Remove duplicate (repeated) points
-                x_data = []
-                y_data = []
-                z_data = []
-                time_data = []
-                for i in range(len(x_data_full)):
-                    if i == 0 or (x_data_full[i] != x_data_full[i - 1]
-                                  or y_data_full[i] != y_data_full[i - 1]
-                                  or z_data_full[i] != z_data_full[i - 1]):
-                        x_data.append(x_data_full[i])
-                        y_data.append(y_data_full[i])
-                        z_data.append(z_data_full[i])
-                        time_data.append(time_data_full[i])
-
-                if x_data is not None and y_data is not None and z_data is not None:
-                    self.gps_3d_plot_panel.plot_gps_trajectory_3d(
-                        x_data, y_data, z_data, time_data)
-                    self.tab_widget.setTabEnabled(
-                        self.tab_widget.indexOf(self.gps_3d_plot_panel), True)
-
-            # Update status
-            metadata = self.processor.current_log.metadata
-            duration = metadata.get('duration', 0)
-            info_text = f"Samples: {metadata.get('num_samples', 0)} | "
-            info_text += f"Channels: {metadata.get('num_channels', 0)} | "
-            info_text += f"Duration: {duration:.2f}s ({duration/60:.0f}:{duration % 60:02.0f})"
-            self.file_info_label.setText(info_text)
-        else:
-            self.channel_panel.clear()
-            self.plot_panel.clear_plots()
-            self.gps_plot_panel.clear_plot()
-            self.gps_3d_plot_panel.clear_plot()
-            self.gps_2d_map_panel.clear()
-            self.analysis_panel.update_analysis(None)  # Clear analysis
-            self.data_panel.update_data(None)  # Clear data view
-            self.file_info_label.setText("")
+                self.tab_widget.indexOf(self.plot_panel), has_data)
+            self.tab_widget.setTabEnabled(self._analysis_tab_index, has_data)
+            self.tab_widget.setTabEnabled(self._data_tab_index, has_data)
+
+            if has_data:
+                # Update channel list
+                channels = self.processor.current_log.channels
+                self.channel_panel.update_channels(channels,
+                                                   self.filetype_config)
+
+                # Mark every data-dependent tab stale; only the one
+                # currently visible is refreshed now (via _on_tab_changed
+                # below), the rest refresh when the user switches to them
+                self._dirty.update(self._tab_refreshers)
+
+                # Update status (formatted once per log, then cached)
+                self.file_info_label.setText(
+                    self.processor.current_log.info_text)
+            else:
+                self.channel_panel.clear()
+                self.plot_panel.clear_plots()
+                self.gps_plot_panel.clear_plot()
+                if self.gps_3d_plot_panel is not None:
+                    self.gps_3d_plot_panel.clear_plot()
+                if self.gps_2d_map_panel is not None:
+                    self.gps_2d_map_panel.clear()
+                if self.analysis_panel is not None:
+                    self.analysis_panel.update_analysis(None)
+                if self.data_panel is not None:
+                    self.data_panel.update_data(None)
+                self.file_info_label.setText("")
+                self._dirty.clear()
+        finally:
+            self.tab_widget.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.update()
+
+        # Materialize the current tab if it is still a placeholder and run
+        # its refresh if it was just marked dirty
+        self._on_tab_changed(self.tab_widget.currentIndex())
+
+    def _refresh_gps_xy(self) -> None:
+        """
+        Rebuild the GPS XY plot from the current log.
+        """
+        self.gps_plot_panel.clear_plot()
+
+        log = self.processor.current_log
+        if (log is not None and log.processed_data is not None and
+                'GPS.X (m)' in log.channels and 'GPS.Y (m)' in log.channels):
+            x_data_full = self.processor.get_channel_data('GPS.X (m)')
+            y_data_full = self.processor.get_channel_data('GPS.Y (m)')
+            time_data_full = self.processor.get_time_data()
+
+            # Remove duplicate (repeated) points
+            x_data, y_data, time_data = _dedupe_consecutive(
+                (x_data_full, y_data_full), (time_data_full,))
+
+            self.gps_plot_panel.plot_gps_trajectory(
+                x_data, y_data, time_data)
+
+    def _refresh_analysis(self) -> None:
+        """
+        Update the analysis panel from the current log, if the panel exists.
+        """
+        if self.analysis_panel is not None:
+            self.analysis_panel.update_analysis(self.processor.current_log)
+
+    def _refresh_data(self) -> None:
+        """
+        Update the data panel from the current log, if the panel exists.
+        """
+        if self.data_panel is not None:
+            self.data_panel.update_data(self.processor.current_log)
+
+    def _refresh_gps_map(self) -> None:
+        """
+        Rebuild the GPS map from the current log, if the panel exists.
+        """
+        if self.gps_2d_map_panel is None:
+            return
+
+        self.gps_2d_map_panel.clear()
+        if self._lat_col and self._lon_col:
+            latitudes_full = self.processor.get_channel_data(self._lat_col)
+            longitudes_full = self.processor.get_channel_data(self._lon_col)
+            time_data_full = self.processor.get_time_data()
+
+            # Remove duplicate (repeated) points
+            latitudes, longitudes, time_data = _dedupe_consecutive(
+                (latitudes_full, longitudes_full), (time_data_full,))
+
+            self.gps_2d_map_panel.render_gps_path(
+                latitudes, longitudes, time_data)
+
+    def _refresh_gps_3d(self) -> None:
+        """
+        Rebuild the GPS 3D plot from the current log, if the panel exists.
+        """
+        if self.gps_3d_plot_panel is None:
+            return
+
+        self.gps_3d_plot_panel.clear_plot()
+        if self._gps_alt_column:
+            x_data_full = self.processor.get_channel_data('GPS.X (m)')
+            y_data_full = self.processor.get_channel_data('GPS.Y (m)')
+            z_data_full = self.processor.get_channel_data(
+                self._gps_alt_column)
+            time_data_full = self.processor.get_time_data()
+
+            # Remove near-duplicate points: consecutive 3D samples often
+            # differ only by altitude jitter, so a small per-axis tolerance
+            # cuts far more matplotlib vertices than exact-equality dedup
+            eps = self.config.get('gps', {}).get('dedup_epsilon',
+                                                 (0.01, 0.01, 0.1))
+            x_data, y_data, z_data, time_data = _dedupe_consecutive(
+                (x_data_full, y_data_full, z_data_full), (time_data_full,),
+                eps=eps)
+
+            self.gps_3d_plot_panel.plot_gps_trajectory_3d(
+                x_data, y_data, z_data, time_data)
 
     def _open_file(self):
         """Open file dialog and load selected file."""
@@ -457,64 +901,99 @@ class MainWindow(QMainWindow):
 
     def _load_file(self, file_path: str) -> None:
         """
-        Load the selected log file and update all relevant panels and UI elements.
+        Start loading the selected log file on a worker thread.
 
         This method is called when a file is opened either through the menu or directly
-        from the file panel. It handles the file loading process, error reporting, and
-        UI updates upon successful or failed loading.
+        from the file panel. The parse runs on a QThread so the GUI stays responsive;
+        progress arrives through queued signals rather than processEvents re-entry, and
+        _on_load_finished completes the UI updates when the parse ends.
 
         Args:
             file_path (str): The path to the log file to be loaded.
         """
 
-        try:
-            self.status_label.setText("Loading file...")
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 100)
-            QApplication.processEvents()  # Allow UI to update
+        if self._load_thread is not None and self._load_thread.isRunning():
+            # A load is already in progress; ignore the request
+            return
 
-            def progress_callback(percent):
-                self.progress_bar.setValue(int(percent))
-                QApplication.processEvents()
+        self.status_label.setText("Loading file...")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.file_panel.setEnabled(False)
+
+        self._load_thread = QThread(self)
+        self._load_worker = LoadWorker(self.processor, file_path, self.config)
+        self._load_worker.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._load_worker.run)
+        # Cross-thread connections are queued automatically, so these slots
+        # run on the GUI thread without any event-pump yields in the parser
+        self._load_worker.progress.connect(self.progress_bar.setValue)
+        self._load_worker.finished.connect(self._on_load_finished)
+        self._load_worker.finished.connect(self._load_thread.quit)
+        self._load_thread.finished.connect(self._load_worker.deleteLater)
+        self._load_thread.finished.connect(self._load_thread.deleteLater)
+        self._register_thread(self._load_thread)
+        self._load_thread.start()
+
+    def _register_thread(self, thread: QThread) -> None:
+        """
+        Track a worker thread for cleanup in closeEvent.
 
-            # Load the file
-            success = self.processor.load_file(
-                file_path, self.config, progress_callback)
+        The thread removes itself from the set when it finishes, so at
+        shutdown only genuinely live threads are waited on.
 
-            if success:
-                self.status_label.setText("File loaded successfully")
-                self.filetype = file_path.split('.')[-1].lower()
-
-                if self.filetype == 'csv':
-                    self.filetype_config = self.config["csv_file"]
-                elif self.filetype == 'tlog':
-                    self.filetype_config = self.config["tlog_file"]
-                elif self.filetype == 'bin':
-                    self.filetype_config = self.config["bin_file"]
-
-                self._update_ui_state()
-                QTimer.singleShot(
-                    3000, lambda: self.status_label.setText("Ready"))
-            else:
-                self.status_label.setText("Failed to load file")
-                self.filetype = ""
-                QMessageBox.warning(
-                    self,
-                    "Load Error",
-                    "Failed to load the selected file. Please check the file format."
-                )
-                QTimer.singleShot(
-                    3000, lambda: self.status_label.setText("Ready"))
-        except Exception as e:
+        Args:
+            thread (QThread): The thread to track.
+        """
+        self._threads.add(thread)
+        thread.finished.connect(functools.partial(self._unregister_thread,
+                                                  thread))
+
+    def _unregister_thread(self, thread: QThread) -> None:
+        """
+        Stop tracking a finished worker thread.
+
+        Args:
+            thread (QThread): The thread to drop.
+        """
+        self._threads.discard(thread)
+
+    def _on_load_finished(self, success: bool, file_path: str) -> None:
+        """
+        Complete a file load started by _load_file.
+
+        Runs on the GUI thread once the worker finishes, updating the status
+        bar and panels for success or failure.
+
+        Args:
+            success (bool): Whether the parse succeeded.
+            file_path (str): The path that was loaded.
+        """
+
+        self._load_thread = None
+        self._load_worker = None
+        self.progress_bar.setVisible(False)
+        self.file_panel.setEnabled(True)
+
+        if success:
+            self.status_label.setText("File loaded successfully")
+            self.filetype = os.path.splitext(file_path)[1][1:].lower()
+            self.filetype_config = self._config_by_ext.get(self.filetype)
+
+            # Drop KML renders of logs the user is no longer looking at
+            self._evict_stale_kml_cache()
+
+            self._update_ui_state()
+        else:
             self.status_label.setText("Failed to load file")
+            self.filetype = ""
             QMessageBox.warning(
                 self,
                 "Load Error",
-                f"Failed to load the selected file: {str(e)}"
+                "Failed to load the selected file. Please check the file format."
             )
-            QTimer.singleShot(3000, lambda: self.status_label.setText("Ready"))
-        finally:
-            self.progress_bar.setVisible(False)
+        QTimer.singleShot(3000, lambda: self.status_label.setText("Ready"))
 
     def _update_plot_selection(self, selected_channels: List[str]):
         """Update plot to show only selected channels."""
@@ -535,19 +1014,18 @@ class MainWindow(QMainWindow):
         if time_data is None:
             return
 
-        channel_data = {}
-        for channel in selected_channels:
-            data = self.processor.get_channel_data(channel)
-            if data is not None:
-                channel_data[channel] = data
+        # One pandas column-subset operation instead of a Series per channel
+        channel_array, channel_names = self.processor.get_channels(
+            selected_channels)
 
-        if channel_data:
-            self.plot_panel.plot_dataseries(time_data, channel_data)
+        if channel_names:
+            self.plot_panel.plot_dataseries(time_data, channel_array,
+                                            channel_names)
             if len(selected_channels) == 1:
                 self.status_label.setText(f"Plotted: {selected_channels[0]}")
             else:
                 self.status_label.setText(
-                    f"Plotted {len(channel_data)} channels")
+                    f"Plotted {len(channel_names)} channels")
             QTimer.singleShot(2000, lambda: self.status_label.setText("Ready"))
 
     def _export_data(self) -> None:
@@ -611,17 +1089,18 @@ class MainWindow(QMainWindow):
             default_filename = "gps_track.kml"
 
         # Prompt user for save location
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Export KML File",
             default_filename,
-            "KML Files (*.kml);;All Files (*)"
+            "KML Files (*.kml);;KMZ Files (*.kmz);;All Files (*)"
         )
 
         if file_path:
-            # Ensure .kml extension
-            if not file_path.lower().endswith('.kml'):
-                file_path += '.kml'
+            # Ensure .kml/.kmz extension, honouring the chosen filter
+            if not file_path.lower().endswith(('.kml', '.kmz')):
+                file_path += '.kmz' if 'kmz' in selected_filter.lower() \
+                    else '.kml'
 
             # Use the existing _generate_kml_file method
             self._generate_kml_file(file_path)
@@ -641,24 +1120,54 @@ class MainWindow(QMainWindow):
         """
 
         try:
-            # Get a unique temporary filename without keeping the file open
-            fd, temp_base_path = tempfile.mkstemp()
-            os.close(fd)  # Close the file descriptor immediately
-            # Remove the empty file created by mkstemp
-            os.remove(temp_base_path)
-            temp_path = f"{temp_base_path}.kml"
+            temp_path = self._kml_cache_path()
+            if temp_path is None:
+                # No stable cache key (e.g. log file gone); fall back to a
+                # one-shot temp file
+                fd, temp_base_path = tempfile.mkstemp()
+                os.close(fd)  # Close the file descriptor immediately
+                # Remove the empty file created by mkstemp
+                os.remove(temp_base_path)
+                temp_path = f"{temp_base_path}.kml"
+                self._generate_kml_file(temp_path,
+                                        on_done=self._open_kml_external)
+            elif not os.path.exists(temp_path):
+                # First view of this log (at this mtime); later views
+                # reuse the cached file directly
+                self._generate_kml_file(temp_path,
+                                        on_done=self._open_kml_external)
+            else:
+                self._open_kml_external(temp_path)
+
+        except Exception as e:
+            QMessageBox.warning(self, "KML Export Error",
+                                f"Failed to export or open KML file: {str(e)}")
 
-            # Generate KML file
-            self._generate_kml_file(temp_path)
+    def _open_kml_external(self, temp_path: str) -> None:
+        """
+        Open a generated KML file in the default application.
+
+        Used directly for cache hits and as the completion callback when
+        the file is generated on the worker thread.
 
+        Args:
+            temp_path (str): Path to the KML file to open.
+        """
+        try:
             # Open with default application
             if os.name == 'nt':  # Windows
                 os.startfile(temp_path)
             elif os.name == 'posix':  # macOS and Linux
-                if os.uname().sysname == 'Darwin':  # macOS
-                    subprocess.run(['open', temp_path])
-                else:  # Linux
-                    subprocess.run(['xdg-open', temp_path])
+                # sys.platform is a constant string compare; os.uname()
+                # builds a fresh struct via a syscall on every call
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                # Fire-and-forget: Popen returns as soon as the child is
+                # spawned, where run() would block the GUI thread until
+                # the launcher exits
+                subprocess.Popen([opener, temp_path],
+                                 start_new_session=True,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
 
             self.status_label.setText(f"KML exported and opened: {temp_path}")
             QTimer.singleShot(5000, lambda: self.status_label.setText("Ready"))
@@ -667,7 +1176,52 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "KML Export Error",
                                 f"Failed to export or open KML file: {str(e)}")
 
-    def _generate_kml_file(self, filename: str) -> None:
+    def _kml_cache_path(self):
+        """
+        Compute the cached KML path for the current log file.
+
+        The name is derived from the log's path and mtime, so an edited or
+        re-downloaded log naturally misses the cache.
+
+        Returns:
+            Optional[str]: Path under the temp-dir cache, or None if the
+            current log has no usable file path.
+        """
+        log = self.processor.current_log
+        if log is None or not getattr(log, 'file_path', None):
+            return None
+
+        try:
+            mtime_ns = os.stat(log.file_path).st_mtime_ns
+        except OSError:
+            return None
+
+        digest = hashlib.blake2b(f"{log.file_path}:{mtime_ns}".encode(),
+                                 digest_size=8).hexdigest()
+        cache_dir = os.path.join(tempfile.gettempdir(), _KML_CACHE_DIRNAME)
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, f"{digest}.kml")
+
+    @staticmethod
+    def _evict_stale_kml_cache() -> None:
+        """
+        Delete cached KML files older than the retention window.
+        """
+        cache_dir = os.path.join(tempfile.gettempdir(), _KML_CACHE_DIRNAME)
+        cutoff = time.time() - _KML_CACHE_MAX_AGE
+        try:
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            # Cache dir doesn't exist yet, or is unreadable — nothing to do
+            pass
+
+    def _generate_kml_file(self, filename: str, on_done=None) -> None:
         """
         Generate a KML file from the current GPS data.
 
@@ -677,13 +1231,14 @@ class MainWindow(QMainWindow):
 
         The method detects latitude, longitude, and altitude columns in the current log data
         and uses this information to create the KML content. If the required data is missing
-        or invalid, an error message is displayed.
+        or invalid, an error message is displayed. Serialization and the
+        file write run on a worker thread so the GUI stays responsive;
+        this method returns as soon as the export is started.
 
         Args:
             filename (str): The path to the file where the KML content will be saved.
-
-        Raises:
-            ValueError: If no valid GPS coordinates are found.
+            on_done: Optional callable invoked with the output path on the
+                GUI thread once the write has succeeded.
         """
 
         if self.processor.current_log is None:
@@ -691,116 +1246,150 @@ class MainWindow(QMainWindow):
                 self, "No Data", "No log file is currently loaded.")
             return
 
-        # Find GPS lat/lon columns and altitude column
-        lat_col = None
-        lon_col = None
-        alt_col = None
-        for ch in self.processor.current_log.channels:
-            cl = ch.lower()
-            if lat_col is None and ("latitude" in cl or cl.endswith("lat") or ".lat" in cl):
-                lat_col = ch
-            if lon_col is None and ("longitude" in cl or cl.endswith("lon") or ".lon" in cl or ".lng" in cl):
-                lon_col = ch
-            if alt_col is None and ("gps alt" in cl or "gps.alt" in cl or "altitude" in cl
-                                    or cl.endswith("alt")):
-                alt_col = ch
+        if self._kml_thread is not None and self._kml_thread.isRunning():
+            # An export is already in progress; ignore the request
+            return
+
+        # GPS lat/lon/altitude columns were detected once at load time
+        gps_cols = self.processor.current_log.gps_cols
+        lat_col = gps_cols.get('lat')
+        lon_col = gps_cols.get('lon')
+        alt_col = gps_cols.get('alt_any')
 
         if not lat_col or not lon_col:
             QMessageBox.warning(self,
                                 "No GPS Data", "No latitude/longitude data found in the log file.")
             return
 
-        # Get GPS data
-        latitudes = self.processor.get_channel_data(lat_col)
-        longitudes = self.processor.get_channel_data(lon_col)
-        altitudes = None
-
-        if alt_col:
-            altitudes = self.processor.get_channel_data(alt_col)
+        # Get GPS data in one pandas subset operation; the per-channel
+        # slices below are views into the shared buffer
+        wanted = [lat_col, lon_col] + ([alt_col] if alt_col else [])
+        gps_data, available = self.processor.get_channels(wanted)
 
-        if latitudes is None or longitudes is None:
+        if gps_data is None or lat_col not in available \
+                or lon_col not in available:
             QMessageBox.warning(self, "Data Error",
                                 "Failed to retrieve GPS coordinate data.")
             return
 
-        if len(latitudes) == 0 or len(longitudes) == 0:
+        latitudes = gps_data[:, available.index(lat_col)]
+        longitudes = gps_data[:, available.index(lon_col)]
+        altitudes = None
+        if alt_col and alt_col in available:
+            altitudes = gps_data[:, available.index(alt_col)]
+
+        if len(latitudes) == 0:
             QMessageBox.warning(self, "No GPS Data",
                                 "GPS coordinate data is empty.")
             return
 
-        try:
-            # Create KML content
-            kml_content = self._generate_kml_content(latitudes, longitudes,
-                                                     lat_col, lon_col,
-                                                     altitudes, alt_col)
+        # The chunk generator only reads the arrays captured above, so it
+        # can safely run on the worker thread even if a new log is loaded
+        # meanwhile (the old frame stays alive via these views)
+        chunks = self._iter_kml_chunks(latitudes, longitudes,
+                                       lat_col, lon_col,
+                                       altitudes, alt_col)
+
+        self.status_label.setText("Exporting KML...")
+        self._kml_thread = QThread(self)
+        self._kml_worker = KmlWriteWorker(chunks, filename)
+        self._kml_worker.moveToThread(self._kml_thread)
+        self._kml_thread.started.connect(self._kml_worker.run)
+        self._kml_worker.finished.connect(
+            functools.partial(self._on_kml_write_finished, on_done=on_done))
+        self._kml_worker.finished.connect(self._kml_thread.quit)
+        self._kml_thread.finished.connect(self._kml_worker.deleteLater)
+        self._kml_thread.finished.connect(self._kml_thread.deleteLater)
+        self._register_thread(self._kml_thread)
+        self._kml_thread.start()
+
+    def _on_kml_write_finished(self, success: bool, message: str,
+                               on_done=None) -> None:
+        """
+        Complete a KML export started by _generate_kml_file.
 
-            # Create KML file
-            with open(filename, 'w', encoding='utf-8') as kml_file:
-                kml_file.write(kml_content)
+        Runs on the GUI thread once the writer finishes.
 
-            self.status_label.setText(f"KML exported to: {filename}")
-            QTimer.singleShot(5000, lambda: self.status_label.setText("Ready"))
+        Args:
+            success (bool): Whether the write succeeded.
+            message (str): Output path on success, error text on failure.
+            on_done: Optional callable invoked with the output path on
+                success (e.g. to open the file externally).
+        """
+        self._kml_thread = None
+        self._kml_worker = None
 
-        except Exception as e:
+        if not success:
+            self.status_label.setText("Ready")
             QMessageBox.warning(self, "KML Export Error",
-                                f"Failed to export or open KML file: {str(e)}")
+                                f"Failed to export or open KML file: {message}")
+            return
+
+        self.status_label.setText(f"KML exported to: {message}")
+        QTimer.singleShot(5000, lambda: self.status_label.setText("Ready"))
+        if on_done is not None:
+            on_done(message)
 
     def _generate_kml_content(self, latitudes, longitudes,
                               lat_col_name, lon_col_name,
                               altitudes=None, alt_col_name=None):
         """Generate KML content from GPS coordinates with optional altitude data."""
-        # Filter valid coordinates
-        valid_coords = []
-        data_length = min(len(latitudes), len(longitudes))
+        return "".join(self._iter_kml_chunks(latitudes, longitudes,
+                                             lat_col_name, lon_col_name,
+                                             altitudes, alt_col_name))
+
+    def _iter_kml_chunks(self, latitudes, longitudes,
+                         lat_col_name, lon_col_name,
+                         altitudes=None, alt_col_name=None):
+        """
+        Yield KML document sections for the given GPS coordinates.
+
+        Generating the document as a sequence of chunks (header, markers,
+        track line pieces, footer) lets the file writer stream them to
+        disk without ever holding the whole serialized track in memory.
+
+        Yields:
+            str: Successive pieces of the KML document.
+
+        Raises:
+            ValueError: If no valid GPS coordinates are found.
+        """
+        # Coerce the channels to float64 once; validation and dedup then run
+        # as a few vectorized NumPy passes instead of per-row float() calls.
+        # Non-numeric cells coerce to NaN and fall out via the validity mask
+        lat = _to_float_array(latitudes)
+        lon = _to_float_array(longitudes)
+        data_length = min(lat.shape[0], lon.shape[0])
         if altitudes is not None:
-            data_length = min(data_length, len(altitudes))
+            alt = _to_float_array(altitudes)
+            data_length = min(data_length, alt.shape[0])
+            alt = alt[:data_length]
+            # An unparseable altitude defaults to 0, matching the old
+            # per-row fallback; the point itself is still kept
+            alt = np.where(np.isfinite(alt), alt, 0.0)
+        else:
+            # Default altitude to 0 if no alt. data
+            alt = np.zeros(data_length)
+
+        lat = lat[:data_length]
+        lon = lon[:data_length]
+
+        # Rows with missing or out-of-range coordinates are dropped
+        valid = (np.isfinite(lat) & np.isfinite(lon)
+                 & (np.abs(lat) <= 90.0) & (np.abs(lon) <= 180.0))
+        if not valid.all():
+            lat = lat[valid]
+            lon = lon[valid]
+            alt = alt[valid]
 
         # Because each line (or message) in the input log file creates its own line in the dataframe, and
         # each line in the dataframe contains all channels, we can end up with many duplicate points.
         # While there doesn't seem to be a defined limit to the number of points in a kml file, eventually
         # the programs that render the kml (e.g. Google Earth) will refuse to display it.  So, we only keep
         # the last unique point for each (lat, lon, alt) combination.
-        last_lat = None
-        last_lon = None
-        last_alt = None
-
-        for i in range(data_length):
-            try:
-                lat = float(latitudes[i])
-                lon = float(longitudes[i])
-                if -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0:
-                    # Include altitude if available
-                    if altitudes is not None:
-                        try:
-                            alt = float(altitudes[i])
-                            # KML uses lon,lat,alt order
-                            if lat != last_lat or lon != last_lon or alt != last_alt:
-                                valid_coords.append((lon, lat, alt))
-                                last_lat = lat
-                                last_lon = lon
-                                last_alt = alt
-
-                        except (ValueError, TypeError):
-                            # Default altitude to 0 if invalid
-                            alt = 0
-                            if lat != last_lat or lon != last_lon or alt != last_alt:
-                                valid_coords.append((lon, lat, alt))
-                                last_lat = lat
-                                last_lon = lon
-                                last_alt = alt
-                    else:
-                        # Default altitude to 0 if no alt. data
-                        alt = 0
-                        if lat != last_lat or lon != last_lon or alt != last_alt:
-                            valid_coords.append((lon, lat, alt))
-                            last_lat = lat
-                            last_lon = lon
-                            last_alt = alt
-
-            except (ValueError, TypeError):
-                continue
-
-        if not valid_coords:
+        lat, lon, alt = _dedupe_consecutive((lat, lon, alt))
+
+        if lat.size == 0:
             raise ValueError("No valid GPS coordinates found")
 
         # Generate KML content
@@ -808,89 +1397,48 @@ class MainWindow(QMainWindow):
         if altitudes is not None and alt_col_name:
             description += f" with altitude data from {alt_col_name}"
 
-        kml_header = f'''<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2">
-  <Document>
-    <name>RC Log GPS Track</name>
-    <description>{description}</description>
-    <Style id="trackStyle">
-      <LineStyle>
-        <color>ff0000ff</color>
-        <width>3</width>
-      </LineStyle>
-    </Style>
-    <Style id="startStyle">
-      <IconStyle>
-        <color>ff00ff00</color>
-        <Icon>
-          <href>http://maps.google.com/mapfiles/kml/pushpin/grn-pushpin.png</href>
-        </Icon>
-      </IconStyle>
-    </Style>
-    <Style id="endStyle">
-      <IconStyle>
-        <color>ff0000ff</color>
-        <Icon>
-          <href>http://maps.google.com/mapfiles/kml/pushpin/red-pushpin.png</href>
-        </Icon>
-      </IconStyle>
-    </Style>'''
+        yield _KML_HEADER % description
 
-        # Start marker
-        start_marker = f'''
-    <Placemark>
-      <name>Start</name>
-      <description>Track start point</description>
-      <styleUrl>#startStyle</styleUrl>
-      <Point>
-        <coordinates>{valid_coords[0][0]},{valid_coords[0][1]},{valid_coords[0][2]}</coordinates>
-      </Point>
-    </Placemark>'''
+        # Start marker (KML uses lon,lat,alt order)
+        yield _KML_POINT_MARKER % ('Start', 'Track start point', 'startStyle',
+                                   lon[0], lat[0], alt[0])
 
         # End marker (if more than one point)
-        end_marker = ""
-        if len(valid_coords) > 1:
-            end_marker = f'''
-    <Placemark>
-      <name>End</name>
-      <description>Track end point</description>
-      <styleUrl>#endStyle</styleUrl>
-      <Point>
-        <coordinates>{valid_coords[-1][0]},{valid_coords[-1][1]},{valid_coords[-1][2]}</coordinates>
-      </Point>
-    </Placemark>'''
+        if lat.size > 1:
+            yield _KML_POINT_MARKER % ('End', 'Track end point', 'endStyle',
+                                       lon[-1], lat[-1], alt[-1])
 
         # Track line with altitude
-        coordinates_str = " ".join(
-            [f"{lon},{lat},{alt}" for lon, lat, alt in valid_coords])
         track_description = f"GPS track from {lat_col_name} and {lon_col_name}"
         if altitudes is not None and alt_col_name:
             track_description += f" with altitude from {alt_col_name}"
 
-        track_line = f'''
-    <Placemark>
-      <name>GPS Track</name>
-      <description>{track_description}</description>
-      <styleUrl>#trackStyle</styleUrl>
-      <LineString>
-        <altitudeMode>absolute</altitudeMode>
-        <coordinates>{coordinates_str}</coordinates>
-      </LineString>
-    </Placemark>'''
+        yield _KML_TRACK_OPEN % track_description
 
-        kml_footer = '''
-  </Document>
-</kml>'''
+        # np.savetxt formats each chunk in C, so no per-point Python string
+        # objects are created
+        # One scratch buffer is reused across chunks instead of allocating
+        # a fresh StringIO (and its internal buffer growth) per chunk
+        coords = np.stack([lon, lat, alt], axis=1)
+        buf = io.StringIO()
+        for start in range(0, coords.shape[0], _KML_COORD_CHUNK):
+            buf.seek(0)
+            buf.truncate()
+            np.savetxt(buf, coords[start:start + _KML_COORD_CHUNK],
+                       fmt=_KML_COORD_FMT, newline=' ')
+            yield buf.getvalue()
 
-        return kml_header + start_marker + end_marker + track_line + kml_footer
+        yield _KML_FOOTER
 
     def _clear_all_plots(self):
         """Clear all plots in all plot panels."""
         self.channel_panel.deselect_all()
         self.plot_panel.clear_plots()
         self.gps_plot_panel.clear_plot()
-        self.gps_3d_plot_panel.clear_plot()
-        self.gps_2d_map_panel.clear()
+        if self.gps_3d_plot_panel is not None:
+            self.gps_3d_plot_panel.clear_plot()
+        if self.gps_2d_map_panel is not None:
+            self.gps_2d_map_panel.clear()
 
     def _restore_last_file(self):
         """Restore the last opened file on application startup."""
@@ -914,6 +1462,13 @@ class MainWindow(QMainWindow):
             "<p>Built with PySide6, NumPy, Pandas, and Matplotlib.</p>"
         )
 
+    def showEvent(self, event) -> None:
+        """
+        Materialize the current tab's panel when the window is first shown.
+        """
+        super().showEvent(event)
+        self._on_tab_changed(self.tab_widget.currentIndex())
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle the close event for the main window."""
 
@@ -931,11 +1486,13 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # Clean up any child threads that might exist
+        # Clean up any tracked worker threads still running; cheaper than
+        # a findChildren(QThread) walk over the whole QObject tree
         try:
-            child_threads = self.findChildren(QThread)
-            for thread in child_threads:
-                if thread and thread.isRunning():
+            for thread in list(self._threads):
+                # wait(0) skips threads that finished but whose finished
+                # signal hasn't been delivered yet
+                if thread.isRunning() and not thread.wait(0):
                     thread.requestInterruption()
                     if not thread.wait(300):
                         thread.terminate()
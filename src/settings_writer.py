@@ -0,0 +1,102 @@
+"""
+Copyright Andrew Fernie, 2025
+
+settings_writer.py
+
+Provides a shared background thread that performs QSettings writes so the
+GUI thread never blocks on disk I/O. Panels queue key/value pairs via
+SettingsWriter.instance().set_value(); the thread batches pending writes
+and applies them in one pass.
+"""
+from PySide6.QtCore import QThread, QMutex, QWaitCondition, QSettings
+from PySide6.QtWidgets import QApplication
+
+
+class SettingsWriter(QThread):
+    """
+    Singleton worker thread that applies QSettings writes off the UI thread.
+
+    Pending writes are held in a mutex-protected dict keyed by
+    (organization, application, key), so rapid repeated writes to the same
+    key coalesce into a single physical write. The thread is woken via a
+    wait condition whenever a new value is queued, and is flushed and
+    stopped when the application quits.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        Return the shared SettingsWriter, creating and starting it on first use.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance.start()
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(cls._instance.stop)
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._condition = QWaitCondition()
+        self._pending = {}
+        self._stopping = False
+
+    def set_value(self, settings, key, value):
+        """
+        Queue a value to be written to the given QSettings object's store.
+
+        Args:
+            settings (QSettings): Settings object identifying the target store.
+            key (str): Settings key.
+            value: Value to store.
+        """
+        self._mutex.lock()
+        try:
+            self._pending[(settings.organizationName(),
+                           settings.applicationName(), key)] = value
+        finally:
+            self._mutex.unlock()
+        self._condition.wakeOne()
+
+    def stop(self):
+        """
+        Flush any pending writes and stop the worker thread.
+        """
+        self._mutex.lock()
+        try:
+            self._stopping = True
+        finally:
+            self._mutex.unlock()
+        self._condition.wakeAll()
+        self.wait()
+
+    def run(self):
+        """
+        Worker loop: wait for queued writes and apply them in batches.
+        """
+        while True:
+            self._mutex.lock()
+            try:
+                while not self._pending and not self._stopping:
+                    self._condition.wait(self._mutex)
+                batch = self._pending
+                self._pending = {}
+                stopping = self._stopping
+            finally:
+                self._mutex.unlock()
+
+            # Apply the batch, reusing one QSettings object per target store
+            stores = {}
+            for (org, app, key), value in batch.items():
+                store = stores.get((org, app))
+                if store is None:
+                    store = QSettings(org, app)
+                    stores[(org, app)] = store
+                store.setValue(key, value)
+
+            if stopping:
+                break